@@ -0,0 +1,52 @@
+"""Micro-benchmark of the per-event overhead of `Engine._fire_event`.
+
+The legacy dispatcher (a linear scan of the allowed events, a debug logging call and an update of the stored
+handler kwargs on every call) is reproduced below and timed against the compiled dispatch table of the engine.
+"""
+from __future__ import print_function
+
+from argparse import ArgumentParser
+import timeit
+
+from ignite.engine import Engine, Events
+
+
+def _legacy_fire_event(engine, event_name, *event_args, **event_kwargs):
+    if event_name in engine._allowed_events:
+        engine._logger.debug("firing handlers for event %s ", event_name)
+        for func, args, kwargs, _ in engine._event_handlers[event_name]:
+            kwargs.update(event_kwargs)
+            func(engine, *(event_args + args), **kwargs)
+
+
+def _create_engine(num_handlers):
+    engine = Engine(lambda engine, batch: None)
+    for _ in range(num_handlers):
+        engine.add_event_handler(Events.ITERATION_COMPLETED, lambda engine: None)
+    return engine
+
+
+def run(num_handlers, number, repeat):
+    print("{:>10} | {:>14} | {:>14} | {:>8}".format("handlers", "legacy (us)", "compiled (us)", "speed-up"))
+    for n in num_handlers:
+        engine = _create_engine(n)
+        legacy = min(timeit.repeat(lambda: _legacy_fire_event(engine, Events.ITERATION_COMPLETED),
+                                   number=number, repeat=repeat))
+        compiled = min(timeit.repeat(lambda: engine._fire_event(Events.ITERATION_COMPLETED),
+                                     number=number, repeat=repeat))
+        print("{:>10} | {:>14.3f} | {:>14.3f} | {:>7.2f}x".format(n, 1e6 * legacy / number,
+                                                                  1e6 * compiled / number, legacy / compiled))
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument('--num_handlers', type=int, nargs='+', default=[0, 1, 5, 20, 50],
+                        help='numbers of handlers attached to the fired event (default: 0 1 5 20 50)')
+    parser.add_argument('--number', type=int, default=100000,
+                        help='number of events fired per measurement (default: 100000)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of measurements, the best one is reported (default: 5)')
+
+    args = parser.parse_args()
+
+    run(args.num_handlers, args.number, args.repeat)
@@ -0,0 +1,80 @@
+"""Micro-benchmark of the cost of `EpochMetric.update` as the number of stored samples grows.
+
+The legacy update (a concatenation of the whole history with the new batch at each update) is reproduced below and
+timed against the current update, which stores the batches as chunks concatenated once at `compute`.
+"""
+from __future__ import print_function
+
+from argparse import ArgumentParser
+from timeit import default_timer as timer
+
+import torch
+
+from ignite.metrics import EpochMetric
+
+
+class _LegacyEpochMetric(EpochMetric):
+
+    def reset(self):
+        self._legacy_predictions = torch.tensor([], dtype=torch.float32)
+        self._legacy_targets = torch.tensor([], dtype=torch.long)
+
+    def update(self, output):
+        y_pred, y = output
+        self._legacy_predictions = torch.cat([self._legacy_predictions, y_pred.type_as(self._legacy_predictions)])
+        self._legacy_targets = torch.cat([self._legacy_targets, y.type_as(self._legacy_targets)])
+
+    def compute(self):
+        return self.compute_fn(self._legacy_predictions, self._legacy_targets)
+
+
+def _compute_fn(y_preds, y_targets):
+    return y_preds.shape[0]
+
+
+def _time_updates(metric, batches, num_reports):
+    """Mean time of an update in each of `num_reports` consecutive parts of the epoch, and time of `compute`."""
+    part_size = len(batches) // num_reports
+    times = []
+    for k in range(num_reports):
+        start = timer()
+        for y_pred, y in batches[k * part_size:(k + 1) * part_size]:
+            metric.update((y_pred, y))
+        times.append((timer() - start) / part_size)
+    start = timer()
+    metric.compute()
+    return times, timer() - start
+
+
+def run(num_batches, batch_size, num_classes, num_reports):
+    y_pred = torch.rand(batch_size, num_classes)
+    y = torch.randint(0, 2, size=(batch_size, num_classes))
+    batches = [(y_pred, y)] * num_batches
+
+    results = {}
+    for name, metric_cls in (("legacy", _LegacyEpochMetric), ("chunks", EpochMetric)):
+        metric = metric_cls(_compute_fn)
+        results[name] = _time_updates(metric, batches, num_reports)
+
+    print("{:>16} | {:>14} | {:>14}".format("stored samples", "legacy (us)", "chunks (us)"))
+    part_size = num_batches // num_reports
+    for k in range(num_reports):
+        print("{:>16} | {:>14.1f} | {:>14.1f}".format((k + 1) * part_size * batch_size,
+                                                      1e6 * results["legacy"][0][k], 1e6 * results["chunks"][0][k]))
+    print("{:>16} | {:>14.1f} | {:>14.1f}".format("compute", 1e6 * results["legacy"][1], 1e6 * results["chunks"][1]))
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument('--num_batches', type=int, default=2000,
+                        help='number of updates of the metric in the epoch (default: 2000)')
+    parser.add_argument('--batch_size', type=int, default=256,
+                        help='number of samples per update (default: 256)')
+    parser.add_argument('--num_classes', type=int, default=10,
+                        help='number of columns of the predictions and targets (default: 10)')
+    parser.add_argument('--num_reports', type=int, default=5,
+                        help='number of parts of the epoch for which the mean update time is reported (default: 5)')
+
+    args = parser.parse_args()
+
+    run(args.num_batches, args.batch_size, args.num_classes, args.num_reports)
@@ -50,13 +50,17 @@ def get_data_loaders(train_batch_size, val_batch_size):
 
     if args.distributed:
         train_sampler = torch.utils.data.distributed.DistributedSampler(train_dataset)
+        # Metrics are reduced over the processes, each process evaluates its shard of the validation data
+        val_sampler = torch.utils.data.distributed.DistributedSampler(val_dataset, shuffle=False)
     else:
         train_sampler = None
+        val_sampler = None
 
     train_loader = torch.utils.data.DataLoader(
         train_dataset, sampler=train_sampler, batch_size=train_batch_size, shuffle=(train_sampler is None))
 
-    val_loader = torch.utils.data.DataLoader(val_dataset, batch_size=val_batch_size, shuffle=True)
+    val_loader = torch.utils.data.DataLoader(val_dataset, sampler=val_sampler, batch_size=val_batch_size,
+                                             shuffle=(val_sampler is None))
 
     return train_loader, val_loader, train_sampler
 
@@ -1,2 +1,3 @@
 from ignite.contrib.engines.tbptt import create_supervised_tbptt_trainer
 from ignite.contrib.engines.tbptt import Tbptt_Events
+from ignite.contrib.engines.parallel import create_parallel_supervised_evaluator
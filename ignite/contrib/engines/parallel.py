@@ -0,0 +1,189 @@
+import numbers
+import weakref
+
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+from torch.utils.data import DataLoader, Subset
+
+from ignite.engine import Engine, Events, _prepare_batch, create_supervised_evaluator
+from ignite.metrics import MetricsLambda
+
+
+def _get_leaf_metrics(metrics):
+    # Metrics holding the states of `metrics`, i.e. the metrics and the dependencies of the instances of
+    # MetricsLambda other than instances of MetricsLambda, without duplicates, in a deterministic order
+    leaves = []
+    for name in sorted(metrics):
+        metric = metrics[name]
+        candidates = metric._dependencies() if isinstance(metric, MetricsLambda) else [metric]
+        for m in candidates:
+            if not any(m is leaf for leaf in leaves):
+                leaves.append(m)
+    return leaves
+
+
+# Model, metrics and functions of the worker process, set by the initializer of the pool
+_worker_args = None
+
+
+def _init_worker(model, leaves, batch_size, prepare_batch, output_transform, num_threads):
+    global _worker_args
+    torch.set_num_threads(num_threads)
+    _worker_args = (model, leaves, batch_size, prepare_batch, output_transform)
+
+
+def _evaluate_shard(args):
+    dataset, indices = args
+    model, leaves, batch_size, prepare_batch, output_transform = _worker_args
+
+    evaluator = create_supervised_evaluator(model, prepare_batch=prepare_batch, output_transform=output_transform)
+    for metric in leaves:
+        # Attached with the standard handlers, even if the metric is a dependency of an instance of MetricsLambda
+        evaluator.add_event_handler(Events.EPOCH_STARTED, metric.started)
+        evaluator.add_event_handler(Events.ITERATION_COMPLETED, metric.iteration_completed)
+    evaluator.run(DataLoader(Subset(dataset, indices), batch_size=batch_size))
+    return [metric.state_dict() for metric in leaves]
+
+
+def _terminate_pool(pool):
+    pool.terminate()
+    pool.join()
+
+
+class _ParallelEvaluator(Engine):
+    """Engine evaluating the model on shards of a dataset in worker processes, merging the states of the metrics of
+    the workers at its single iteration."""
+
+    def __init__(self, model, metrics, num_workers, batch_size, prepare_batch, output_transform, start_method):
+        super(_ParallelEvaluator, self).__init__(self._process_dataset)
+        self._model = model
+        self._leaves = _get_leaf_metrics(metrics)
+        self._num_workers = num_workers
+        self._batch_size = batch_size
+        self._prepare_batch = prepare_batch
+        self._output_transform = output_transform
+        self._start_method = start_method
+        self._pool = None
+        self._pool_finalizer = None
+
+        for metric in self._leaves:
+            self.add_event_handler(Events.EPOCH_STARTED, metric.started)
+        for name, metric in metrics.items():
+            self.add_event_handler(Events.EPOCH_COMPLETED, metric.completed, name)
+
+    def _get_pool(self):
+        if self._pool is None:
+            # The workers use the parameters of the model in shared memory, such that the updates of the model by
+            # the parent process are seen by the workers without copy
+            self._model.share_memory()
+            num_threads = max(1, torch.get_num_threads() // self._num_workers)
+            context = mp.get_context(self._start_method)
+            self._pool = context.Pool(self._num_workers, initializer=_init_worker,
+                                      initargs=(self._model, self._leaves, self._batch_size, self._prepare_batch,
+                                                self._output_transform, num_threads))
+            # The workers are terminated when the engine is garbage collected or at the exit of the interpreter if
+            # the engine is not closed, the finalizer holding the pool and not the engine
+            self._pool_finalizer = weakref.finalize(self, _terminate_pool, self._pool)
+        return self._pool
+
+    def _process_dataset(self, engine, dataset):
+        # Contiguous shards, merged in the order of the dataset
+        shards = [indices.tolist() for indices in np.array_split(np.arange(len(dataset)), self._num_workers)]
+        tasks = [(dataset, indices) for indices in shards if len(indices) > 0]
+        for state_dicts in self._get_pool().map(_evaluate_shard, tasks):
+            for metric, state_dict in zip(self._leaves, state_dicts):
+                metric.merge(state_dict)
+        return len(dataset)
+
+    def run(self, data):
+        """Evaluate the model on the dataset `data`.
+
+        Args:
+            data (Dataset): a map-style dataset, e.g. a `torch.utils.data.TensorDataset`.
+
+        Returns:
+            State: output state.
+        """
+        return super(_ParallelEvaluator, self).run([data], max_epochs=1)
+
+    def _handle_exception(self, e):
+        # The workers may be in the middle of a task of the failed run
+        self.close()
+        super(_ParallelEvaluator, self)._handle_exception(e)
+
+    def close(self):
+        """Terminate the worker processes. The next run starts new worker processes."""
+        if self._pool is not None:
+            self._pool_finalizer()
+            self._pool = None
+            self._pool_finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+def create_parallel_supervised_evaluator(model, metrics, num_workers, batch_size, prepare_batch=_prepare_batch,
+                                         output_transform=lambda x, y, y_pred: (y_pred, y,), start_method=None):
+    """
+    Factory function for creating an evaluator for supervised models on CPU, evaluating the model on shards of the
+    dataset in a pool of worker processes.
+
+    Each worker runs an evaluator created with :meth:`~ignite.engine.create_supervised_evaluator` on a contiguous
+    shard of the dataset and returns the :meth:`~ignite.metrics.Metric.state_dict` of its metrics, which are merged
+    in the metrics of the returned engine with :meth:`~ignite.metrics.Metric.merge`. The parameters of the model are
+    moved to shared memory, such that the model is not copied for each evaluation and the workers evaluate the
+    current parameters of the model, e.g. after a training epoch.
+
+    The returned engine runs a single iteration per evaluation, over the whole dataset, and its metrics are computed
+    at `EPOCH_COMPLETED` as the metrics of an evaluator created with
+    :meth:`~ignite.engine.create_supervised_evaluator`. `engine.state.output` is the number of evaluated samples.
+
+    Args:
+        model (`torch.nn.Module`): the model to evaluate.
+        metrics (dict of str - :class:`~ignite.metrics.Metric`): a map of metric names to Metrics.
+        num_workers (int): number of worker processes.
+        batch_size (int): number of samples of the batches of the workers.
+        prepare_batch (callable, optional): function that receives `batch`, `device`, `non_blocking` and outputs
+            tuple of tensors `(batch_x, batch_y)`.
+        output_transform (callable, optional): function that receives 'x', 'y', 'y_pred' and returns value
+            to be assigned to the `state.output` of the evaluators of the workers after each iteration. Default is
+            returning `(y_pred, y,)` which fits output expected by metrics.
+        start_method (str, optional): start method of the worker processes, see :mod:`torch.multiprocessing`
+            (default: None, the default start method of the platform). Except with the `fork` start method, the
+            model, metrics and functions are pickled to start the workers.
+
+    Note: the pool of workers is started at the first run and kept for the next runs. The dataset is sent to the
+        workers at each run, the tensors of the dataset through shared memory. Call `engine.close()` or use the
+        engine as a context manager to terminate the workers. The workers are also terminated when a run raises an
+        exception and when the engine is garbage collected.
+
+    Note: the intra-op parallelism of each worker is limited to its share of the threads of the process, see
+        `torch.set_num_threads`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        evaluator = create_parallel_supervised_evaluator(model, metrics={"accuracy": Accuracy()}, num_workers=8,
+                                                         batch_size=256)
+
+        @trainer.on(Events.EPOCH_COMPLETED)
+        def validate(trainer):
+            state = evaluator.run(val_dataset)
+            print(state.metrics["accuracy"])
+
+        with evaluator:
+            trainer.run(train_loader, max_epochs=10)
+
+    Returns:
+        Engine: an evaluator engine running the evaluation in worker processes.
+    """
+    if not isinstance(num_workers, numbers.Integral) or num_workers < 1:
+        raise ValueError("Argument num_workers should be a positive integer, but given {}".format(num_workers))
+    if not isinstance(batch_size, numbers.Integral) or batch_size < 1:
+        raise ValueError("Argument batch_size should be a positive integer, but given {}".format(batch_size))
+    return _ParallelEvaluator(model, metrics, num_workers, batch_size, prepare_batch, output_transform, start_method)
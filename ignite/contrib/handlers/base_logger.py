@@ -4,7 +4,7 @@ import warnings
 
 import torch
 
-from ignite.engine import State, Engine
+from ignite.engine import Engine, EventWithFilter
 from ignite._six import with_metaclass
 
 
@@ -20,13 +20,16 @@ class BaseLogger(object):
             engine (Engine): engine object.
             log_handler (callable): a logging handler to execute
             event_name: event to attach the logging handler to. Valid events are from :class:`~ignite.engine.Events`
-                or any `event_name` added by :meth:`~ignite.engine.Engine.register_events`.
+                or any `event_name` added by :meth:`~ignite.engine.Engine.register_events`. The event can be
+                filtered, e.g. ``Events.ITERATION_COMPLETED(every=100)``, in which case `log_handler` receives the
+                unfiltered event.
 
         """
-        if event_name not in State.event_to_attr:
-            raise RuntimeError("Unknown event name '{}'".format(event_name))
+        base_event_name = event_name.event if isinstance(event_name, EventWithFilter) else event_name
+        if base_event_name not in engine._event_to_attr:
+            raise RuntimeError("Unknown event name '{}'".format(base_event_name))
 
-        engine.add_event_handler(event_name, log_handler, self, event_name)
+        engine.add_event_handler(event_name, log_handler, self, base_event_name)
 
     def __enter__(self):
         return self
@@ -1,5 +1,5 @@
 from enum import Enum
-from ignite.engine import Events, State
+from ignite.engine import Events, EventWithFilter
 
 
 class CustomPeriodicEvent(object):
@@ -43,6 +43,10 @@ class CustomPeriodicEvent(object):
             print(engine.state.epochs_10)
 
 
+    Note:
+        If the periodic events are only used to attach handlers, it is simpler to attach them directly to filtered
+        events, e.g. ``Events.ITERATION_COMPLETED(every=1000)``, see :class:`~ignite.engine.EventWithFilter`.
+
     Args:
         n_iterations (int, optional): number iterations of the custom periodic event
         n_epochs (int, optional): number iterations of the custom periodic event. Argument is optional, but only one,
@@ -77,9 +81,6 @@ class CustomPeriodicEvent(object):
             "{}_STARTED".format(event_name),
             "{}_COMPLETED".format(event_name)])
         ))
-        # Update State.event_to_attr
-        for e in self.Events:
-            State.event_to_attr[e] = self.custom_state_attr
 
         # Create aliases
         self._periodic_event_started = getattr(self.Events, "{}_STARTED".format(event_name))
@@ -88,20 +89,22 @@ class CustomPeriodicEvent(object):
     def _on_started(self, engine):
         setattr(engine.state, self.custom_state_attr, 0)
 
+    def _is_period_start(self, engine, value):
+        return (value - 1) % self.period == 0
+
     def _on_periodic_event_started(self, engine):
-        if getattr(engine.state, self.state_attr) % self.period == 1:
-            setattr(engine.state, self.custom_state_attr, getattr(engine.state, self.custom_state_attr) + 1)
-            engine.fire_event(self._periodic_event_started)
+        setattr(engine.state, self.custom_state_attr, getattr(engine.state, self.custom_state_attr) + 1)
+        engine.fire_event(self._periodic_event_started)
 
     def _on_periodic_event_completed(self, engine):
-        if getattr(engine.state, self.state_attr) % self.period == 0:
-            engine.fire_event(self._periodic_event_completed)
+        engine.fire_event(self._periodic_event_completed)
 
     def attach(self, engine):
-        engine.register_events(*self.Events)
+        engine.register_events(*self.Events, event_to_attr={e: self.custom_state_attr for e in self.Events})
 
         engine.add_event_handler(Events.STARTED, self._on_started)
-        engine.add_event_handler(getattr(Events, "{}_STARTED".format(self.state_attr.upper())),
+        event_started = getattr(Events, "{}_STARTED".format(self.state_attr.upper()))
+        engine.add_event_handler(EventWithFilter(event_started, event_filter=self._is_period_start),
                                  self._on_periodic_event_started)
-        engine.add_event_handler(getattr(Events, "{}_COMPLETED".format(self.state_attr.upper())),
-                                 self._on_periodic_event_completed)
+        event_completed = getattr(Events, "{}_COMPLETED".format(self.state_attr.upper()))
+        engine.add_event_handler(event_completed(every=self.period), self._on_periodic_event_completed)
@@ -136,9 +136,13 @@ class LRFinder(object):
             engine.add_event_handler(Events.ITERATION_COMPLETED, self._log_lr_and_loss)
 
         # attach LRScheduler to engine. can be done only after engine.run was called because of num_iter
-        required_epochs = self.num_iter / len(engine.state.dataloader)
-        if engine.state.max_epochs < required_epochs:
-            engine.state.max_epochs = int(np.ceil(required_epochs))
+        if engine.state.epoch_length is None:
+            warnings.warn("Number of iterations of an epoch is unknown, the run may complete before "
+                          "num_iter={} iterations. Use epoch_length argument of engine.run".format(self.num_iter))
+        else:
+            required_epochs = self.num_iter / engine.state.epoch_length
+            if engine.state.max_epochs < required_epochs:
+                engine.state.max_epochs = int(np.ceil(required_epochs))
 
         self._logger.debug("Running LR finder for {} iterations".format(self.num_iter))
         # Initialize the proper learning rate policy
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 import numbers
+import time
 import warnings
 
 import torch
 
 from ignite.engine import Events
+from ignite.metrics.metric import _LazyMetrics
 
 from ignite.contrib.handlers.base_logger import BaseLogger, BaseOutputHandler
 
@@ -114,7 +116,7 @@ class ProgressBar(BaseLogger):
         )
 
     def _close(self, engine):
-        if self.pbar:
+        if self.pbar is not None:
             self.pbar.close()
         self.pbar = None
 
@@ -153,7 +155,10 @@ class ProgressBar(BaseLogger):
             closing_event_name: event's name on which the progress bar is closed. Valid events are from
                 :class:`~ignite.engine.Events`.
 
-        Note: accepted output value types are numbers, 0d and 1d torch tensors and strings
+        Note: accepted output value types are numbers, 0d and 1d torch tensors and strings. Tensors are not
+            rendered at every update of the bar, but only when the bar is refreshed, every `mininterval` seconds
+            (see `tqdm`), so that the outputs of a trainer can be kept on the device without synchronizing it at
+            every iteration.
 
         """
         desc = self.tqdm_kwargs.get("desc", "Epoch")
@@ -201,27 +206,61 @@ class _OutputHandler(BaseOutputHandler):
                                              another_engine=None, global_step_transform=None)
         self.event_name = event_name
         self.closing_event_name = closing_event_name
+        self._last_render_time = None
 
     @staticmethod
     def get_max_number_events(event_name, engine):
         if event_name in (Events.ITERATION_STARTED, Events.ITERATION_COMPLETED):
-            return len(engine.state.dataloader)
+            return engine.state.epoch_length
         if event_name in (Events.EPOCH_STARTED, Events.EPOCH_COMPLETED):
             return engine.state.max_epochs
         return 1
 
+    def _reads_device(self, engine):
+        # Whether rendering the values reads tensors from the device: tensor outputs or metrics, including the
+        # metrics which are not computed yet, e.g. the averages of tensor outputs of RunningAverage
+        metrics = engine.state.metrics
+        if self.metric_names is not None:
+            names = list(metrics) if self.metric_names == "all" else [n for n in self.metric_names if n in metrics]
+            for name in names:
+                if isinstance(metrics, _LazyMetrics) and metrics.is_lazy(name) or \
+                        isinstance(metrics[name], torch.Tensor):
+                    return True
+        if self.output_transform is not None:
+            output = self.output_transform(engine.state.output)
+            values = output.values() if isinstance(output, dict) else [output]
+            return any(isinstance(value, torch.Tensor) for value in values)
+        return False
+
+    def _should_render(self, logger, engine):
+        # Rendering a tensor synchronizes its device with the host. Tensors are therefore rendered only when the
+        # bar can be refreshed, i.e. every `mininterval` seconds, and at the last update of the bar.
+        if not self._reads_device(engine):
+            return True
+        now = time.time()
+        pbar = logger.pbar
+        if self._last_render_time is None or now - self._last_render_time >= pbar.mininterval or \
+                (pbar.total is not None and pbar.n + 1 >= pbar.total):
+            self._last_render_time = now
+            return True
+        return False
+
     def __call__(self, engine, logger, event_name):
 
         if logger.pbar is None:
             logger._reset(pbar_total=self.get_max_number_events(self.event_name, engine))
+            self._last_render_time = None
 
         desc = self.tag
         max_num_of_closing_events = self.get_max_number_events(self.closing_event_name, engine)
-        if max_num_of_closing_events > 1:
+        if max_num_of_closing_events is not None and max_num_of_closing_events > 1:
             global_step = engine.state.get_event_attrib_value(self.closing_event_name)
             desc += " [{}/{}]".format(global_step, max_num_of_closing_events)
         logger.pbar.set_description(desc)
 
+        if not self._should_render(logger, engine):
+            logger.pbar.update()
+            return
         metrics = self._setup_output_metrics(engine)
 
         rendered_metrics = {}
@@ -230,7 +269,7 @@ class _OutputHandler(BaseOutputHandler):
                     isinstance(value, torch.Tensor) and value.ndimension() == 0:
                 rendered_metrics[key] = "{:.2e}".format(value)
             elif isinstance(value, torch.Tensor) and value.ndimension() == 1:
-                for i, v in enumerate(value):
+                for i, v in enumerate(value.tolist()):
                     k = "{}_{}".format(key, i)
                     rendered_metrics[k] = "{:.2e}".format(v)
             elif isinstance(value, str):
@@ -1,3 +1,3 @@
-from ignite.contrib.metrics.average_precision import AveragePrecision
-from ignite.contrib.metrics.roc_auc import ROC_AUC
+from ignite.contrib.metrics.average_precision import AveragePrecision, BinnedAveragePrecision
+from ignite.contrib.metrics.roc_auc import ROC_AUC, BinnedROC_AUC
 import ignite.contrib.metrics.regression
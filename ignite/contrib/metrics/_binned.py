@@ -0,0 +1,73 @@
+from __future__ import division
+
+import numbers
+from abc import abstractmethod
+
+import torch
+
+from ignite.exceptions import NotComputableError
+from ignite.metrics import Metric
+from ignite.metrics.metric import sync_all_reduce
+
+
+class _BaseBinnedCurve(Metric):
+    # Base class for the curve metrics computed from histograms of the scores of the positive and negative samples.
+    # `update` counts the samples per bin with a single `bincount` on the device of the inputs, and `compute` calls
+    # the overloaded method `_compute_from_counts` with the numbers of positive and negative samples per bin, sorted
+    # by decreasing score, as double precision tensors.
+
+    def __init__(self, output_transform=lambda x: x, num_thresholds=1000, min_value=0., max_value=1.):
+        if not isinstance(num_thresholds, numbers.Integral) or num_thresholds < 1:
+            raise ValueError("Argument num_thresholds should be a positive integer, but given {}"
+                             .format(num_thresholds))
+        if not min_value < max_value:
+            raise ValueError("Argument min_value should be smaller than max_value, but given {} and {}"
+                             .format(min_value, max_value))
+        self.num_thresholds = num_thresholds
+        self.min_value = min_value
+        self.max_value = max_value
+        super(_BaseBinnedCurve, self).__init__(output_transform=output_transform)
+
+    _state_dict_keys = ("_counts",)
+
+    def reset(self):
+        # Negative samples in the first `num_thresholds` bins, positive samples in the last ones
+        self._counts = torch.zeros(2 * self.num_thresholds, dtype=torch.long)
+
+    def update(self, output):
+        y_pred, y = output
+
+        if y_pred.ndimension() == 2 and y_pred.shape[1] == 1:
+            y_pred = y_pred.squeeze(dim=-1)
+        if y.ndimension() == 2 and y.shape[1] == 1:
+            y = y.squeeze(dim=-1)
+        if y_pred.ndimension() != 1 or y_pred.shape != y.shape:
+            raise ValueError("Input y_pred and y should have shape (N,) or (N, 1), but given {} and {}"
+                             .format(y_pred.shape, y.shape))
+        if not ((y == 0) | (y == 1)).all():
+            raise ValueError("For binary cases, y must be comprised of 0's and 1's.")
+
+        n = self.num_thresholds
+        scale = n / (self.max_value - self.min_value)
+        bins = ((y_pred.detach().double() - self.min_value) * scale).floor_().clamp_(0, n - 1).long()
+        bins += n * y.long()
+        counts = torch.bincount(bins, minlength=2 * n)
+
+        if self._counts.device != counts.device:
+            self._counts = self._counts.to(counts.device)
+        self._counts += counts
+
+    @sync_all_reduce("_counts")
+    def compute(self):
+        counts = self._counts.double()
+        n = self.num_thresholds
+        negatives = counts[:n].flip(0)
+        positives = counts[n:].flip(0)
+        if (negatives.sum() + positives.sum()).item() == 0:
+            raise NotComputableError("{} must have at least one example before it can be computed."
+                                     .format(self.__class__.__name__))
+        return self._compute_from_counts(positives, negatives)
+
+    @abstractmethod
+    def _compute_from_counts(self, positives, negatives):
+        pass
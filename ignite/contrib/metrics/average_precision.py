@@ -1,3 +1,5 @@
+from ignite.contrib.metrics._binned import _BaseBinnedCurve
+from ignite.exceptions import NotComputableError
 from ignite.metrics import EpochMetric
 
 
@@ -22,6 +24,13 @@ class AveragePrecision(EpochMetric):
             :class:`~ignite.engine.Engine`'s `process_function`'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
+        compute_on_rank_zero (bool, optional): in a distributed configuration, if True, the metric is computed by
+            the process of rank 0 only and broadcast to the other processes (default: False). See
+            :class:`~ignite.metrics.EpochMetric`.
+        spill_threshold (int, optional): if given, number of bytes of stored data above which the data is stored in
+            memory-mapped files (default: None). See :class:`~ignite.metrics.EpochMetric`.
+        spill_dir (str, optional): directory in which the files are created (default: None). See
+            :class:`~ignite.metrics.EpochMetric`.
 
     AveragePrecision expects y to be comprised of 0's and 1's. y_pred must either be probability estimates or
     confidence values. To apply an activation to y_pred, use output_transform as shown below:
@@ -36,5 +45,63 @@ class AveragePrecision(EpochMetric):
         avg_precision = AveragePrecision(activated_output_transform)
 
     """
-    def __init__(self, output_transform=lambda x: x):
-        super(AveragePrecision, self).__init__(average_precision_compute_fn, output_transform=output_transform)
+    def __init__(self, output_transform=lambda x: x, compute_on_rank_zero=False, spill_threshold=None,
+                 spill_dir=None):
+        super(AveragePrecision, self).__init__(average_precision_compute_fn, output_transform=output_transform,
+                                               compute_on_rank_zero=compute_on_rank_zero,
+                                               spill_threshold=spill_threshold,
+                                               spill_dir=spill_dir)
+
+
+class BinnedAveragePrecision(_BaseBinnedCurve):
+    """Computes an approximation of the Average Precision with bounded memory, from the histograms of the scores of
+    the positive and negative samples.
+
+    The range `[min_value, max_value]` of `y_pred` is split into `num_thresholds` bins of equal width, and each
+    update counts the positive and negative samples of each bin with a single `bincount` on the device of the
+    inputs. Scores outside of the range are counted in the first or the last bin. The memory used by the metric and
+    the time of :meth:`compute` depend on `num_thresholds` only, and the counts of the processes of a distributed
+    group are summed with a single `all_reduce`.
+
+    The result is the Average Precision of the scores rounded down to the edges of the bins: it is equal to
+    :class:`~ignite.contrib.metrics.AveragePrecision` when all the scores of each bin are equal. Otherwise, the
+    precision of all the positive samples of a bin is the precision at the lower edge of the bin, while the exact
+    precision of a positive sample depends on its rank within the bin. The absolute error with respect to the exact
+    Average Precision is thus at most the mean, over the positive samples, of the range of the precision within
+    their bin, which is at most `sum(positives[b] * counts[b] / above[b]) / P`, with `positives[b]` the number of
+    positive samples of bin `b`, `counts[b]` the number of samples of bin `b`, `above[b]` the number of samples of
+    the bins above and including `b` and `P` the total number of positive samples. The error is small when each
+    bin holds a small fraction of the samples with a higher score.
+
+    Args:
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        num_thresholds (int, optional): number of bins, or thresholds of the precision-recall curve (default: 1000).
+        min_value (float, optional): lower bound of the range of the scores (default: 0).
+        max_value (float, optional): upper bound of the range of the scores (default: 1).
+
+    BinnedAveragePrecision expects y to be comprised of 0's and 1's, with y_pred and y of shape (N,) or (N, 1).
+    y_pred should be probability estimates, or confidence values within `[min_value, max_value]`:
+
+    .. code-block:: python
+
+        avg_precision = BinnedAveragePrecision(lambda output: (torch.sigmoid(output[0]), output[1]),
+                                               num_thresholds=10000)
+
+    """
+    def __init__(self, output_transform=lambda x: x, num_thresholds=1000, min_value=0., max_value=1.):
+        super(BinnedAveragePrecision, self).__init__(output_transform=output_transform,
+                                                     num_thresholds=num_thresholds, min_value=min_value,
+                                                     max_value=max_value)
+
+    def _compute_from_counts(self, positives, negatives):
+        num_positives = positives.sum().item()
+        if num_positives == 0:
+            raise NotComputableError("BinnedAveragePrecision requires positive examples to be computed.")
+        tps = positives.cumsum(0)
+        fps = negatives.cumsum(0)
+        # Bins without positive samples do not contribute, and are given a non-zero denominator
+        precision = tps / (tps + fps).clamp(min=1)
+        return (positives * precision).sum().item() / num_positives
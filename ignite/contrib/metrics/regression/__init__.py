@@ -8,8 +8,9 @@ from ignite.contrib.metrics.regression.canberra_metric import CanberraMetric
 from ignite.contrib.metrics.regression.fractional_absolute_error import FractionalAbsoluteError
 from ignite.contrib.metrics.regression.wave_hedges_distance import WaveHedgesDistance
 from ignite.contrib.metrics.regression.geometric_mean_absolute_error import GeometricMeanAbsoluteError
-from ignite.contrib.metrics.regression.median_absolute_error import MedianAbsoluteError
+from ignite.contrib.metrics.regression.median_absolute_error import MedianAbsoluteError, StreamingMedianAbsoluteError
 from ignite.contrib.metrics.regression.median_relative_absolute_error import MedianRelativeAbsoluteError
-from ignite.contrib.metrics.regression.median_absolute_percentage_error import MedianAbsolutePercentageError
+from ignite.contrib.metrics.regression.median_absolute_percentage_error import MedianAbsolutePercentageError, \
+    StreamingMedianAbsolutePercentageError
 from ignite.contrib.metrics.regression.geometric_mean_relative_absolute_error import GeometricMeanRelativeAbsoluteError
 from ignite.contrib.metrics.regression.r2_score import R2Score
@@ -1,10 +1,12 @@
+import numbers
 from abc import abstractmethod
 
-import warnings
-
 import torch
 
+from ignite.contrib.metrics.regression._sketch import _TDigest
+from ignite.exceptions import NotComputableError
 from ignite.metrics import Metric, EpochMetric
+from ignite.metrics.metric import _get_world_size
 
 
 class _BaseRegression(Metric):
@@ -44,25 +46,62 @@ class _BaseRegressionEpoch(_BaseRegression, EpochMetric):
     # `update` method check the shapes and call internal overloaded method `_update`.
     # Class internally stores complete history of predictions and targets of type float32.
 
-    def __init__(self, compute_fn, output_transform=lambda x: x):
-        EpochMetric.__init__(self, compute_fn=compute_fn, output_transform=output_transform)
+    def __init__(self, compute_fn, output_transform=lambda x: x, compute_on_rank_zero=False, spill_threshold=None,
+                 spill_dir=None):
+        EpochMetric.__init__(self, compute_fn=compute_fn, output_transform=output_transform,
+                             compute_on_rank_zero=compute_on_rank_zero, spill_threshold=spill_threshold,
+                             spill_dir=spill_dir)
+
+    _targets_dtype = torch.float32
+
+    def _update(self, output):
+        y_pred, y = output
+        self._append(y_pred, y)
+
+
+class _BaseRegressionSketch(_BaseRegression):
+    # Base class for all median-based regression metrics computed over streams
+    # `update` method check the shapes and add the errors returned by the overloaded method `_errors` to a
+    # mergeable quantile sketch of size O(compression), merged over the processes of the distributed group in
+    # `compute`.
+
+    def __init__(self, output_transform=lambda x: x, compression=1000):
+        if not isinstance(compression, numbers.Integral) or compression < 2:
+            raise ValueError("Argument compression should be an integer greater than 1, but given {}"
+                             .format(compression))
+        self.compression = compression
+        super(_BaseRegressionSketch, self).__init__(output_transform=output_transform)
 
     def reset(self):
-        self._predictions = torch.tensor([], dtype=torch.float32)
-        self._targets = torch.tensor([], dtype=torch.float32)
+        self._digest = _TDigest(self.compression)
+
+    # The state is the one of the sketch, merged with the sketch of the other metric by `merge`
+    _state_dict_keys = ("means", "weights", "min", "max")
+
+    def state_dict(self):
+        return self._digest.state_dict()
+
+    def load_state_dict(self, state_dict):
+        self._check_state_dict(state_dict)
+        self._digest = _TDigest.from_state_dict(self.compression, state_dict)
+
+    def _additive_state_dict_keys(self):
+        return None
+
+    def _merge_state_dict(self, state_dict):
+        self._digest.merge(_TDigest.from_state_dict(self.compression, state_dict))
 
     def _update(self, output):
         y_pred, y = output
-        y_pred = y_pred.type_as(self._predictions)
-        y = y.type_as(self._targets)
-
-        self._predictions = torch.cat([self._predictions, y_pred], dim=0)
-        self._targets = torch.cat([self._targets, y], dim=0)
-
-        # Check once the signature and execution of compute_fn
-        if self._predictions.shape == y_pred.shape:
-            try:
-                self.compute_fn(self._predictions, self._targets)
-            except Exception as e:
-                warnings.warn("Probably, there can be a problem with `compute_fn`:\n {}".format(e),
-                              RuntimeWarning)
+        self._digest.add(self._errors(y_pred, y))
+
+    def compute(self):
+        digest = self._digest.all_gathered() if _get_world_size() > 1 else self._digest
+        if digest.count() == 0:
+            raise NotComputableError("{} must have at least one example before it can be computed."
+                                     .format(self.__class__.__name__))
+        return digest.quantile(0.5)
+
+    @abstractmethod
+    def _errors(self, y_pred, y):
+        pass
@@ -0,0 +1,123 @@
+from __future__ import division
+
+import numpy as np
+import torch
+
+from ignite.metrics.epoch_metric import _gather_uneven
+
+
+class _TDigest(object):
+    """Mergeable sketch of the distribution of a stream of values, in the spirit of the merging t-digest.
+
+    The values are summarized by at most `compression / 2` centroids, i.e. weighted means of consecutive values,
+    each holding at most about `2 / compression` of the total weight. The values are buffered on their device and
+    inserted with a single sort of the buffer and the centroids followed by `index_add_`, once the buffer holds
+    `compression` values or when the sketch is queried. As long as at most `compression / 2` values were added, each
+    value is its own centroid and the quantiles are exact.
+    """
+
+    def __init__(self, compression):
+        self.compression = compression
+        self.max_centroids = (compression + 1) // 2
+        self.means = torch.zeros(0, dtype=torch.float64)
+        self.weights = torch.zeros(0, dtype=torch.float64)
+        self.min = None
+        self.max = None
+        self._buffer = []
+        self._buffer_size = 0
+
+    def add(self, values):
+        values = values.detach().reshape(-1).to(dtype=torch.float64)
+        if values.numel() == 0:
+            return
+        if self.means.device != values.device:
+            self.means = self.means.to(values.device)
+            self.weights = self.weights.to(values.device)
+        value_min, value_max = values.min(), values.max()
+        self.min = value_min if self.min is None else torch.min(self.min, value_min)
+        self.max = value_max if self.max is None else torch.max(self.max, value_max)
+        self._buffer.append(values)
+        self._buffer_size += values.numel()
+        if self._buffer_size >= self.compression:
+            self._flush()
+
+    def merge(self, other):
+        """Add the centroids of the digest `other` to this digest."""
+        other._flush()
+        if other.min is None:
+            return
+        self._flush()
+        device = self.means.device if self.min is not None else other.means.device
+        self.min = other.min.to(device) if self.min is None else torch.min(self.min, other.min.to(device))
+        self.max = other.max.to(device) if self.max is None else torch.max(self.max, other.max.to(device))
+        self._compress(torch.cat([self.means.to(device), other.means.to(device)]),
+                       torch.cat([self.weights.to(device), other.weights.to(device)]))
+
+    def state_dict(self):
+        self._flush()
+        return {"means": self.means.clone(), "weights": self.weights.clone(), "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_state_dict(cls, compression, state_dict):
+        digest = cls(compression)
+        digest.means = state_dict["means"].clone()
+        digest.weights = state_dict["weights"].clone()
+        digest.min = state_dict["min"]
+        digest.max = state_dict["max"]
+        return digest
+
+    def _flush(self):
+        if self._buffer_size == 0:
+            return
+        values = torch.cat(self._buffer) if len(self._buffer) > 1 else self._buffer[0]
+        self._buffer = []
+        self._buffer_size = 0
+        self._compress(torch.cat([self.means, values]), torch.cat([self.weights, torch.ones_like(values)]))
+
+    def _compress(self, means, weights):
+        means, indices = torch.sort(means)
+        weights = weights[indices]
+        cum_weights = torch.cumsum(weights, dim=0)
+        # Centroids are grouped by the quantile of their middle, in groups of 2 / compression of the total weight
+        quantiles = (cum_weights - weights / 2) / cum_weights[-1]
+        groups = (quantiles * self.max_centroids).floor_().long().clamp_(0, self.max_centroids - 1)
+
+        group_weights = torch.zeros(self.max_centroids, dtype=torch.float64, device=means.device)
+        group_weights.index_add_(0, groups, weights)
+        group_sums = torch.zeros_like(group_weights)
+        group_sums.index_add_(0, groups, weights * means)
+        non_empty = group_weights > 0
+        self.weights = group_weights[non_empty]
+        self.means = group_sums[non_empty] / self.weights
+
+    def count(self):
+        self._flush()
+        return self.weights.sum().item()
+
+    def quantile(self, q):
+        """Estimate the `q`-quantile of the added values, interpolating linearly between the centroids."""
+        self._flush()
+        weights = self.weights.cpu().numpy()
+        means = self.means.cpu().numpy()
+        cum_weights = np.cumsum(weights)
+        positions = (cum_weights - weights / 2) / cum_weights[-1]
+        positions = np.concatenate([[0.], positions, [1.]])
+        means = np.concatenate([[self.min.item()], means, [self.max.item()]])
+        return float(np.interp(q, positions, means))
+
+    def all_gathered(self):
+        """Digest of the values added to the digests of all the processes of the distributed group."""
+        self._flush()
+        means, weights = _gather_uneven([self.means, self.weights])
+        if self.min is not None:
+            bounds = torch.stack([self.min, self.max]).unsqueeze(0)
+        else:
+            bounds = torch.zeros(0, 2, dtype=torch.float64, device=self.means.device)
+        bounds, = _gather_uneven([bounds])
+
+        digest = _TDigest(self.compression)
+        if bounds.size(0) > 0:
+            digest.min = bounds[:, 0].min()
+            digest.max = bounds[:, 1].max()
+            digest._compress(means, weights)
+        return digest
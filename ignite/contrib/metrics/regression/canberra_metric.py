@@ -3,6 +3,7 @@ from __future__ import division
 import torch
 
 from ignite.contrib.metrics.regression._base import _BaseRegression
+from ignite.metrics.metric import sync_all_reduce
 
 
 class CanberraMetric(_BaseRegression):
@@ -21,6 +22,8 @@ class CanberraMetric(_BaseRegression):
     __ https://arxiv.org/abs/1809.03006
     """
 
+    _state_dict_keys = ("_sum_of_errors",)
+
     def reset(self):
         self._sum_of_errors = 0.0
 
@@ -29,5 +32,6 @@ class CanberraMetric(_BaseRegression):
         errors = torch.abs(y.view_as(y_pred) - y_pred) / (y_pred + y.view_as(y_pred))
         self._sum_of_errors += torch.sum(errors).item()
 
+    @sync_all_reduce("_sum_of_errors")
     def compute(self):
         return self._sum_of_errors
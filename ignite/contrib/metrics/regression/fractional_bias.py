@@ -4,6 +4,7 @@ import torch
 
 from ignite.exceptions import NotComputableError
 from ignite.contrib.metrics.regression._base import _BaseRegression
+from ignite.metrics.metric import sync_all_reduce
 
 
 class FractionalBias(_BaseRegression):
@@ -22,6 +23,8 @@ class FractionalBias(_BaseRegression):
     __ https://arxiv.org/abs/1809.03006
 
     """
+    _state_dict_keys = ("_sum_of_errors", "_num_examples")
+
     def reset(self):
         self._sum_of_errors = 0.0
         self._num_examples = 0
@@ -32,6 +35,7 @@ class FractionalBias(_BaseRegression):
         self._sum_of_errors += torch.sum(errors).item()
         self._num_examples += y.shape[0]
 
+    @sync_all_reduce("_sum_of_errors", "_num_examples")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError('FractionalBias must have at least one example before it can be computed.')
@@ -3,6 +3,7 @@ from __future__ import division
 import torch
 
 from ignite.contrib.metrics.regression._base import _BaseRegression
+from ignite.metrics.metric import sync_all_reduce
 
 
 class GeometricMeanRelativeAbsoluteError(_BaseRegression):
@@ -22,6 +23,8 @@ class GeometricMeanRelativeAbsoluteError(_BaseRegression):
     __ https://arxiv.org/abs/1809.03006
 
     """
+    _state_dict_keys = ("_sum_y", "_num_examples", "_sum_of_errors")
+
     def reset(self):
         self._sum_y = 0.0
         self._num_examples = 0
@@ -36,6 +39,7 @@ class GeometricMeanRelativeAbsoluteError(_BaseRegression):
         denominator = torch.abs(y.view_as(y_pred) - y_mean)
         self._sum_of_errors += torch.log(numerator / denominator).sum()
 
+    @sync_all_reduce("_sum_y", "_num_examples", "_sum_of_errors")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError('GeometricMeanRelativeAbsoluteError must have at least '
@@ -2,6 +2,7 @@ import torch
 
 from ignite.exceptions import NotComputableError
 from ignite.contrib.metrics.regression._base import _BaseRegression
+from ignite.metrics.metric import sync_all_reduce
 
 
 class MaximumAbsoluteError(_BaseRegression):
@@ -21,6 +22,8 @@ class MaximumAbsoluteError(_BaseRegression):
 
     """
 
+    _state_dict_keys = ("_max_of_absolute_errors",)
+
     def reset(self):
         self._max_of_absolute_errors = -1
 
@@ -30,6 +33,13 @@ class MaximumAbsoluteError(_BaseRegression):
         if self._max_of_absolute_errors < mae:
             self._max_of_absolute_errors = mae
 
+    def _additive_state_dict_keys(self):
+        return None
+
+    def _merge_state_dict(self, state_dict):
+        self._max_of_absolute_errors = max(self._max_of_absolute_errors, state_dict["_max_of_absolute_errors"])
+
+    @sync_all_reduce("_max_of_absolute_errors", op="max")
     def compute(self):
         if self._max_of_absolute_errors < 0:
             raise NotComputableError('MaximumAbsoluteError must have at least one example before it can be computed.')
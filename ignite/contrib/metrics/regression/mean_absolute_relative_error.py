@@ -4,6 +4,7 @@ import torch
 
 from ignite.exceptions import NotComputableError
 from ignite.contrib.metrics.regression._base import _BaseRegression
+from ignite.metrics.metric import sync_all_reduce
 
 
 class MeanAbsoluteRelativeError(_BaseRegression):
@@ -23,6 +24,8 @@ class MeanAbsoluteRelativeError(_BaseRegression):
 
     """
 
+    _state_dict_keys = ("_sum_of_absolute_relative_errors", "_num_samples")
+
     def reset(self):
         self._sum_of_absolute_relative_errors = 0.0
         self._num_samples = 0
@@ -35,6 +38,7 @@ class MeanAbsoluteRelativeError(_BaseRegression):
         self._sum_of_absolute_relative_errors += torch.sum(absolute_error).item()
         self._num_samples += y.size()[0]
 
+    @sync_all_reduce("_sum_of_absolute_relative_errors", "_num_samples")
     def compute(self):
         if self._num_samples == 0:
             raise NotComputableError('MeanAbsoluteRelativeError must have at least'
@@ -2,7 +2,7 @@ from __future__ import division
 
 import torch
 
-from ignite.contrib.metrics.regression._base import _BaseRegressionEpoch
+from ignite.contrib.metrics.regression._base import _BaseRegressionEpoch, _BaseRegressionSketch
 
 
 def median_absolute_percentage_error_compute_fn(y_pred, y):
@@ -27,11 +27,68 @@ class MedianAbsolutePercentageError(_BaseRegressionEpoch):
 
         Current implementation stores all input data (output and target) in as tensors before computing a metric.
         This can potentially lead to a memory error if the input data is larger than available RAM.
+        :class:`~ignite.contrib.metrics.regression.StreamingMedianAbsolutePercentageError` computes an approximation
+        with bounded memory.
 
 
     __ https://arxiv.org/abs/1809.03006
 
+    Args:
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        compute_on_rank_zero (bool, optional): in a distributed configuration, if True, the metric is computed by
+            the process of rank 0 only and broadcast to the other processes (default: False). See
+            :class:`~ignite.metrics.EpochMetric`.
+        spill_threshold (int, optional): if given, number of bytes of stored data above which the data is stored in
+            memory-mapped files (default: None). See :class:`~ignite.metrics.EpochMetric`.
+        spill_dir (str, optional): directory in which the files are created (default: None). See
+            :class:`~ignite.metrics.EpochMetric`.
+
     """
-    def __init__(self, output_transform=lambda x: x):
+    def __init__(self, output_transform=lambda x: x, compute_on_rank_zero=False, spill_threshold=None,
+                 spill_dir=None):
         super(MedianAbsolutePercentageError, self).__init__(median_absolute_percentage_error_compute_fn,
-                                                            output_transform)
+                                                            output_transform,
+                                                            compute_on_rank_zero=compute_on_rank_zero,
+                                                            spill_threshold=spill_threshold,
+                                                            spill_dir=spill_dir)
+
+
+class StreamingMedianAbsolutePercentageError(_BaseRegressionSketch):
+    r"""
+    Calculates the Median Absolute Percentage Error over a stream of data with bounded memory:
+
+    :math:`\text{MdAPE} = 100 \cdot \text{MD}_{j=1,n} \left( \frac{|A_j - P_j|}{|A_j|} \right)`,
+
+    where :math:`A_j` is the ground truth and :math:`P_j` is the predicted value.
+
+    More details can be found in `Botchkarev 2018`__.
+
+    - `update` must receive output of the form `(y_pred, y)`.
+    - `y` and `y_pred` must be of same shape `(N, )` or `(N, 1)`.
+
+    The errors are summarized by a mergeable quantile sketch, in the spirit of the merging t-digest, of at most
+    `compression / 2` weighted means of consecutive errors. The memory used by the metric does not depend on the
+    number of samples, batches are inserted with a vectorized sort on the device of the inputs and, in a
+    distributed configuration, the sketches of the processes are gathered and merged. The result is exact as long
+    as the metric received at most `compression / 2` samples, and is otherwise an approximation of the median, with
+    a rank error typically well below `1 / compression`. The median of an even number of values is the mean of the
+    two middle values, as for :func:`numpy.median`.
+
+    __ https://arxiv.org/abs/1809.03006
+
+    Args:
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        compression (int, optional): size parameter of the sketch, the larger the more accurate (default: 1000).
+
+    """
+    def __init__(self, output_transform=lambda x: x, compression=1000):
+        super(StreamingMedianAbsolutePercentageError, self).__init__(output_transform, compression=compression)
+
+    def _errors(self, y_pred, y):
+        return 100.0 * torch.abs(y.view_as(y_pred) - y_pred) / torch.abs(y.view_as(y_pred))
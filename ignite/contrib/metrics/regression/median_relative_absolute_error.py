@@ -31,7 +31,23 @@ class MedianRelativeAbsoluteError(_BaseRegressionEpoch):
 
     __ https://arxiv.org/abs/1809.03006
 
+    Args:
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        compute_on_rank_zero (bool, optional): in a distributed configuration, if True, the metric is computed by
+            the process of rank 0 only and broadcast to the other processes (default: False). See
+            :class:`~ignite.metrics.EpochMetric`.
+        spill_threshold (int, optional): if given, number of bytes of stored data above which the data is stored in
+            memory-mapped files (default: None). See :class:`~ignite.metrics.EpochMetric`.
+        spill_dir (str, optional): directory in which the files are created (default: None). See
+            :class:`~ignite.metrics.EpochMetric`.
+
     """
-    def __init__(self, output_transform=lambda x: x):
-        super(MedianRelativeAbsoluteError, self).__init__(median_relative_absolute_error_compute_fn,
-                                                          output_transform)
+    def __init__(self, output_transform=lambda x: x, compute_on_rank_zero=False, spill_threshold=None,
+                 spill_dir=None):
+        super(MedianRelativeAbsoluteError, self).__init__(median_relative_absolute_error_compute_fn, output_transform,
+                                                          compute_on_rank_zero=compute_on_rank_zero,
+                                                          spill_threshold=spill_threshold,
+                                                          spill_dir=spill_dir)
@@ -4,6 +4,7 @@ import torch
 
 from ignite.exceptions import NotComputableError
 from ignite.contrib.metrics.regression._base import _BaseRegression
+from ignite.metrics.metric import sync_all_reduce
 
 
 class R2Score(_BaseRegression):
@@ -19,6 +20,8 @@ class R2Score(_BaseRegression):
         - `update` must receive output of the form `(y_pred, y)`.
         - `y` and `y_pred` must be of same shape `(N, )` or `(N, 1)` and of type `float32`.
     """
+    _state_dict_keys = ("_num_examples", "_sum_of_errors", "_y_sq_sum", "_y_sum")
+
     def reset(self):
         self._num_examples = 0
         self._sum_of_errors = 0
@@ -33,6 +36,7 @@ class R2Score(_BaseRegression):
         self._y_sum += torch.sum(y).item()
         self._y_sq_sum += torch.sum(torch.pow(y, 2)).item()
 
+    @sync_all_reduce("_num_examples", "_sum_of_errors", "_y_sq_sum", "_y_sum")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError('R2Score must have at least one example before it can be computed.')
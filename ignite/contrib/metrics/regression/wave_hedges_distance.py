@@ -3,6 +3,7 @@ from __future__ import division
 import torch
 
 from ignite.contrib.metrics.regression._base import _BaseRegression
+from ignite.metrics.metric import sync_all_reduce
 
 
 class WaveHedgesDistance(_BaseRegression):
@@ -20,6 +21,8 @@ class WaveHedgesDistance(_BaseRegression):
     __ https://arxiv.org/abs/1809.03006
     """
 
+    _state_dict_keys = ("_sum_of_errors",)
+
     def reset(self):
         self._sum_of_errors = 0.0
 
@@ -28,5 +31,6 @@ class WaveHedgesDistance(_BaseRegression):
         errors = torch.abs(y.view_as(y_pred) - y_pred) / torch.max(y_pred, y.view_as(y_pred))
         self._sum_of_errors += torch.sum(errors).item()
 
+    @sync_all_reduce("_sum_of_errors")
     def compute(self):
         return self._sum_of_errors
@@ -1,3 +1,5 @@
+from ignite.contrib.metrics._binned import _BaseBinnedCurve
+from ignite.exceptions import NotComputableError
 from ignite.metrics import EpochMetric
 
 
@@ -23,6 +25,13 @@ class ROC_AUC(EpochMetric):
             :class:`~ignite.engine.Engine`'s `process_function`'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
+        compute_on_rank_zero (bool, optional): in a distributed configuration, if True, the metric is computed by
+            the process of rank 0 only and broadcast to the other processes (default: False). See
+            :class:`~ignite.metrics.EpochMetric`.
+        spill_threshold (int, optional): if given, number of bytes of stored data above which the data is stored in
+            memory-mapped files (default: None). See :class:`~ignite.metrics.EpochMetric`.
+        spill_dir (str, optional): directory in which the files are created (default: None). See
+            :class:`~ignite.metrics.EpochMetric`.
 
     ROC_AUC expects y to be comprised of 0's and 1's. y_pred must either be probability estimates or confidence
     values. To apply an activation to y_pred, use output_transform as shown below:
@@ -37,5 +46,58 @@ class ROC_AUC(EpochMetric):
         roc_auc = ROC_AUC(activated_output_transform)
 
     """
-    def __init__(self, output_transform=lambda x: x):
-        super(ROC_AUC, self).__init__(roc_auc_compute_fn, output_transform=output_transform)
+    def __init__(self, output_transform=lambda x: x, compute_on_rank_zero=False, spill_threshold=None,
+                 spill_dir=None):
+        super(ROC_AUC, self).__init__(roc_auc_compute_fn, output_transform=output_transform,
+                                      compute_on_rank_zero=compute_on_rank_zero, spill_threshold=spill_threshold,
+                                      spill_dir=spill_dir)
+
+
+class BinnedROC_AUC(_BaseBinnedCurve):
+    """Computes an approximation of the Area Under the Receiver Operating Characteristic Curve (ROC AUC) with bounded
+    memory, from the histograms of the scores of the positive and negative samples.
+
+    The range `[min_value, max_value]` of `y_pred` is split into `num_thresholds` bins of equal width, and each
+    update counts the positive and negative samples of each bin with a single `bincount` on the device of the
+    inputs. Scores outside of the range are counted in the first or the last bin. The memory used by the metric and
+    the time of :meth:`compute` depend on `num_thresholds` only, and the counts of the processes of a distributed
+    group are summed with a single `all_reduce`.
+
+    The result is the ROC AUC of the scores rounded down to the edges of the bins: it is equal to
+    :class:`~ignite.contrib.metrics.ROC_AUC` when all the scores of each bin are equal, and otherwise the pairs of a
+    positive and a negative sample of the same bin are counted as ties. The absolute error with respect to the exact
+    ROC AUC is thus at most `sum(positives[b] * negatives[b]) / (2 * P * N)`, with `positives[b]` and `negatives[b]`
+    the numbers of positive and negative samples of bin `b` and `P` and `N` the total numbers of positive and
+    negative samples, which is at most half the largest fraction of negative (or positive) samples in a single bin,
+    e.g. about `1 / (2 * num_thresholds)` for scores spread evenly over the range.
+
+    Args:
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        num_thresholds (int, optional): number of bins, or thresholds of the ROC curve (default: 1000).
+        min_value (float, optional): lower bound of the range of the scores (default: 0).
+        max_value (float, optional): upper bound of the range of the scores (default: 1).
+
+    BinnedROC_AUC expects y to be comprised of 0's and 1's, with y_pred and y of shape (N,) or (N, 1). y_pred should
+    be probability estimates, or confidence values within `[min_value, max_value]`:
+
+    .. code-block:: python
+
+        roc_auc = BinnedROC_AUC(lambda output: (torch.sigmoid(output[0]), output[1]), num_thresholds=10000)
+
+    """
+    def __init__(self, output_transform=lambda x: x, num_thresholds=1000, min_value=0., max_value=1.):
+        super(BinnedROC_AUC, self).__init__(output_transform=output_transform, num_thresholds=num_thresholds,
+                                            min_value=min_value, max_value=max_value)
+
+    def _compute_from_counts(self, positives, negatives):
+        num_positives = positives.sum().item()
+        num_negatives = negatives.sum().item()
+        if num_positives == 0 or num_negatives == 0:
+            raise NotComputableError("BinnedROC_AUC requires positive and negative examples to be computed.")
+        # Trapezoidal rule, the number of true positives above each bin being the cumulated count minus the bin
+        tps = positives.cumsum(0)
+        area = (negatives * (2 * tps - positives)).sum().item() / 2
+        return area / (num_positives * num_negatives)
@@ -1,6 +1,12 @@
+from __future__ import division
+
+import itertools
+import numbers
+
 import torch
 
-from ignite.engine.engine import Engine, State, Events
+from ignite.engine.engine import Engine, State, Events, EventWithFilter
+from ignite.engine.profiler import HandlersTimeProfiler, TimesRecorder
 from ignite.utils import convert_tensor
 
 
@@ -13,10 +19,89 @@ def _prepare_batch(batch, device=None, non_blocking=False):
             convert_tensor(y, device=device, non_blocking=non_blocking))
 
 
+class _RebatchedData(object):
+    """Iterable over the batches of `data`, prepared with `prepare_batch` and re-batched to `batch_size` samples.
+
+    Small batches are concatenated and big batches are split, such that all the batches except the last one have
+    `batch_size` samples.
+    """
+
+    def __init__(self, data, batch_size, prepare_batch, device=None, non_blocking=False):
+        self.data = data
+        self.batch_size = batch_size
+        self.prepare_batch = prepare_batch
+        self.device = device
+        self.non_blocking = non_blocking
+
+    def __iter__(self):
+        batch_size = self.batch_size
+        xs, ys, num_samples = [], [], 0
+        for batch in self.data:
+            x, y = self.prepare_batch(batch, device=self.device, non_blocking=self.non_blocking)
+            if not (isinstance(x, torch.Tensor) and isinstance(y, torch.Tensor)):
+                raise TypeError("With inference_batch_size, batch_x and batch_y should be tensors, but given {} and {}"
+                                .format(type(x), type(y)))
+            xs.append(x)
+            ys.append(y)
+            num_samples += x.size(0)
+            if num_samples < batch_size:
+                continue
+            x = torch.cat(xs) if len(xs) > 1 else xs[0]
+            y = torch.cat(ys) if len(ys) > 1 else ys[0]
+            start = 0
+            while num_samples - start >= batch_size:
+                yield x[start:start + batch_size], y[start:start + batch_size]
+                start += batch_size
+            num_samples -= start
+            xs, ys = ([x[start:]], [y[start:]]) if num_samples > 0 else ([], [])
+        if num_samples > 0:
+            yield (torch.cat(xs) if len(xs) > 1 else xs[0]), (torch.cat(ys) if len(ys) > 1 else ys[0])
+
+
+class _InferenceEngine(Engine):
+    """Engine setting the model in evaluation mode once per run."""
+
+    def __init__(self, process_function, model, rebatch_data=None):
+        super(_InferenceEngine, self).__init__(process_function)
+        self._model = model
+        self._rebatch_data = rebatch_data
+
+    def run(self, data, *args, **kwargs):
+        if self._rebatch_data is not None:
+            data = self._rebatch_data(data)
+        self._model.eval()
+        return super(_InferenceEngine, self).run(data, *args, **kwargs)
+
+
+class _TracedModel(object):
+    """Model traced with `torch.jit.trace` for each signature of its inputs.
+
+    A trace is created for each shape, dtype and device of the input, and the traces are recreated when a parameter
+    or a buffer of the model is replaced by a new tensor, e.g. with `model.weight = nn.Parameter(...)`. Updates of
+    the values of the parameters, e.g. by an optimizer or with `model.load_state_dict`, are seen by the traces.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._traces = {}
+        self._tensor_ids = None
+
+    def __call__(self, x):
+        tensor_ids = [id(t) for t in itertools.chain(self.model.parameters(), self.model.buffers())]
+        if tensor_ids != self._tensor_ids:
+            self._traces = {}
+            self._tensor_ids = tensor_ids
+        key = (tuple(x.shape), x.dtype, x.device)
+        if key not in self._traces:
+            self._traces[key] = torch.jit.trace(self.model, x)
+        return self._traces[key](x)
+
+
 def create_supervised_trainer(model, optimizer, loss_fn,
                               device=None, non_blocking=False,
                               prepare_batch=_prepare_batch,
-                              output_transform=lambda x, y, y_pred, loss: loss.item()):
+                              output_transform=None,
+                              gradient_accumulation_steps=1, num_micro_batches=1, materialize_every=1):
     """
     Factory function for creating a trainer for supervised models.
 
@@ -31,34 +116,147 @@ def create_supervised_trainer(model, optimizer, loss_fn,
         prepare_batch (callable, optional): function that receives `batch`, `device`, `non_blocking` and outputs
             tuple of tensors `(batch_x, batch_y)`.
         output_transform (callable, optional): function that receives 'x', 'y', 'y_pred', 'loss' and returns value
-            to be assigned to engine's state.output after each iteration. Default is returning `loss.item()`.
+            to be assigned to engine's state.output after each iteration. Default is returning the loss, read from
+            the device according to `materialize_every`.
+        gradient_accumulation_steps (int, optional): number of iterations over which the gradients are accumulated
+            before an optimizer step. The gradients are zeroed at the first iteration and the optimizer makes a
+            step at the last iteration of each group of `gradient_accumulation_steps` iterations, and the loss is
+            divided by `gradient_accumulation_steps` before the backward pass (default: 1). The groups do not cross
+            the epochs: the gradients of an incomplete group at the end of an epoch or of the run are rescaled to
+            the average over its iterations and the optimizer makes a step.
+        num_micro_batches (int, optional): number of chunks, along the first dimension of `batch_x` and `batch_y`,
+            in which each batch is split. The forward and backward passes are run chunk by chunk, such that the
+            memory needed by the intermediate results is the one of a single chunk, and the loss of each chunk is
+            weighted by its fraction of the batch size (default: 1). Requires `batch_x` and `batch_y` to be tensors.
+        materialize_every (int, optional): with the default `output_transform`, number of iterations between two
+            reads of the loss from the device, which synchronize the device with the host. `engine.state.output` is
+            the loss as a Python number every `materialize_every` iterations and as a detached tensor on the device
+            at the other iterations. If None, the loss is always kept on the device, and read by the handlers only
+            when they need its value (default: 1, the loss is read at each iteration).
 
     Note: `engine.state.output` for this engine is defind by `output_transform` parameter and is the loss
         of the processed batch by default.
 
+    Note: the loss kept on the device with `materialize_every` is accepted by
+        :class:`~ignite.metrics.RunningAverage`, which stores its average in `engine.state.metrics` to be read at
+        its first access, :class:`~ignite.handlers.TerminateOnNan` (with `check_every`) and
+        :class:`~ignite.contrib.handlers.tqdm_logger.ProgressBar`, which read it from the device only when needed.
+
+    Note: with `gradient_accumulation_steps` or `num_micro_batches`, `loss_fn` is expected to average the loss
+        over the samples, such that the accumulated gradients are the gradients of the average loss over all
+        the accumulated samples. `loss` passed to `output_transform` is the unscaled loss of the batch, and with
+        `num_micro_batches`, `y_pred` is the concatenation of the detached predictions of the chunks.
+
+    Example usage:
+
+    .. code-block:: python
+
+        # Effective batch size of 4 * 64 with 64 samples in memory at once
+        trainer = create_supervised_trainer(model, optimizer, loss_fn, gradient_accumulation_steps=4)
+        trainer.run(DataLoader(dataset, batch_size=64))
+
+        # Same effective batch size, with a single engine iteration per optimizer step
+        trainer = create_supervised_trainer(model, optimizer, loss_fn, num_micro_batches=4)
+        trainer.run(DataLoader(dataset, batch_size=256))
+
+        # Loss kept on the device, its running average being read every 100 iterations only
+        trainer = create_supervised_trainer(model, optimizer, loss_fn, device="cuda", materialize_every=None)
+        RunningAverage(output_transform=lambda x: x).attach(trainer, "loss")
+
+        @trainer.on(Events.ITERATION_COMPLETED(every=100))
+        def log_loss(trainer):
+            print(trainer.state.metrics["loss"])
+
     Returns:
         Engine: a trainer engine with supervised update function.
     """
+    if not isinstance(gradient_accumulation_steps, numbers.Integral) or gradient_accumulation_steps < 1:
+        raise ValueError("Argument gradient_accumulation_steps should be a positive integer, but given {}"
+                         .format(gradient_accumulation_steps))
+    if not isinstance(num_micro_batches, numbers.Integral) or num_micro_batches < 1:
+        raise ValueError("Argument num_micro_batches should be a positive integer, but given {}"
+                         .format(num_micro_batches))
+    if materialize_every is not None and \
+            (not isinstance(materialize_every, numbers.Integral) or materialize_every < 1):
+        raise ValueError("Argument materialize_every should be a positive integer or None, but given {}"
+                         .format(materialize_every))
+    if output_transform is not None and materialize_every != 1:
+        raise ValueError("Argument materialize_every applies to the default output_transform only")
+
     if device:
         model.to(device)
 
+    def _forward_backward(x, y):
+        if num_micro_batches == 1:
+            y_pred = model(x)
+            loss = loss_fn(y_pred, y)
+            if gradient_accumulation_steps > 1:
+                (loss / gradient_accumulation_steps).backward()
+            else:
+                loss.backward()
+            return y_pred, loss
+
+        if not (isinstance(x, torch.Tensor) and isinstance(y, torch.Tensor)):
+            raise TypeError("With num_micro_batches, batch_x and batch_y should be tensors, but given {} and {}"
+                            .format(type(x), type(y)))
+        batch_size = x.size(0)
+        y_preds = []
+        loss = 0.
+        for x_chunk, y_chunk in zip(torch.chunk(x, num_micro_batches), torch.chunk(y, num_micro_batches)):
+            y_pred_chunk = model(x_chunk)
+            loss_chunk = loss_fn(y_pred_chunk, y_chunk) * (x_chunk.size(0) / batch_size)
+            (loss_chunk / gradient_accumulation_steps).backward()
+            y_preds.append(y_pred_chunk.detach())
+            loss = loss + loss_chunk.detach()
+        return torch.cat(y_preds), loss
+
+    # Number of iterations whose gradients are accumulated since the last optimizer step
+    num_accumulated = [0]
+
     def _update(engine, batch):
         model.train()
-        optimizer.zero_grad()
+        if num_accumulated[0] == 0:
+            optimizer.zero_grad()
         x, y = prepare_batch(batch, device=device, non_blocking=non_blocking)
-        y_pred = model(x)
-        loss = loss_fn(y_pred, y)
-        loss.backward()
+        y_pred, loss = _forward_backward(x, y)
+        num_accumulated[0] += 1
+        if num_accumulated[0] == gradient_accumulation_steps:
+            optimizer.step()
+            num_accumulated[0] = 0
+        if output_transform is not None:
+            return output_transform(x, y, y_pred, loss)
+        if materialize_every is not None and engine.state.iteration % materialize_every == 0:
+            return loss.item()
+        return loss.detach()
+
+    def _reset_accumulation(engine):
+        num_accumulated[0] = 0
+
+    def _step_incomplete_accumulation(engine):
+        if num_accumulated[0] == 0:
+            return
+        # Gradients divided by the number of accumulated iterations instead of gradient_accumulation_steps
+        scale = gradient_accumulation_steps / num_accumulated[0]
+        for group in optimizer.param_groups:
+            for p in group["params"]:
+                if p.grad is not None:
+                    p.grad.mul_(scale)
         optimizer.step()
-        return output_transform(x, y, y_pred, loss)
+        num_accumulated[0] = 0
 
-    return Engine(_update)
+    engine = Engine(_update)
+    if gradient_accumulation_steps > 1:
+        engine.add_event_handler(Events.STARTED, _reset_accumulation)
+        engine.add_event_handler(Events.EPOCH_COMPLETED, _step_incomplete_accumulation)
+        engine.add_event_handler(Events.COMPLETED, _step_incomplete_accumulation)
+    return engine
 
 
 def create_supervised_evaluator(model, metrics=None,
                                 device=None, non_blocking=False,
                                 prepare_batch=_prepare_batch,
-                                output_transform=lambda x, y, y_pred: (y_pred, y,)):
+                                output_transform=lambda x, y, y_pred: (y_pred, y,),
+                                inference_batch_size=None, trace=False):
     """
     Factory function for creating an evaluator for supervised models.
 
@@ -74,26 +272,72 @@ def create_supervised_evaluator(model, metrics=None,
         output_transform (callable, optional): function that receives 'x', 'y', 'y_pred' and returns value
             to be assigned to engine's state.output after each iteration. Default is returning `(y_pred, y,)` which fits
             output expected by metrics. If you change it you should use `output_transform` in metrics.
+        inference_batch_size (int, optional): if given, the batches prepared by `prepare_batch` are re-batched to
+            `inference_batch_size` samples: small batches are concatenated and big batches are split, and `x`, `y`
+            and `y_pred` given to `output_transform` are the ones of the re-batched batch. `engine.state.batch` is
+            the re-batched `(batch_x, batch_y)` and `engine.state.epoch_length` is None. Requires `batch_x` and
+            `batch_y` to be tensors (default: None).
+        trace (bool, optional): if True, the model is traced with `torch.jit.trace` and the traced model is used for
+            the inference (default: False). The model is traced again for each new shape, dtype or device of
+            `batch_x`, e.g. for the last smaller batch, and when its parameters or buffers are replaced by new
+            tensors. Tracing requires a model whose operations do not depend on the values of its inputs, and
+            `batch_x` to be a tensor.
 
     Note: `engine.state.output` for this engine is defind by `output_transform` parameter and is
         a tuple of `(batch_pred, batch_y)` by default.
 
+    Note: with `inference_batch_size` or `trace`, `model.eval()` is called once per run instead of at each
+        iteration. The gradients are disabled during the inference only, not in the event handlers.
+
+    Example usage:
+
+    .. code-block:: python
+
+        # Inference on batches of 1024 samples from a loader of small batches
+        evaluator = create_supervised_evaluator(model, metrics={"accuracy": Accuracy()},
+                                                inference_batch_size=1024, trace=True)
+        evaluator.run(DataLoader(dataset, batch_size=16))
+
     Returns:
         Engine: an evaluator engine with supervised inference function.
     """
     metrics = metrics or {}
+    if inference_batch_size is not None and \
+            (not isinstance(inference_batch_size, numbers.Integral) or inference_batch_size < 1):
+        raise ValueError("Argument inference_batch_size should be a positive integer, but given {}"
+                         .format(inference_batch_size))
 
     if device:
         model.to(device)
 
-    def _inference(engine, batch):
-        model.eval()
-        with torch.no_grad():
-            x, y = prepare_batch(batch, device=device, non_blocking=non_blocking)
-            y_pred = model(x)
-            return output_transform(x, y, y_pred)
+    if inference_batch_size is None and not trace:
+
+        def _inference(engine, batch):
+            model.eval()
+            with torch.no_grad():
+                x, y = prepare_batch(batch, device=device, non_blocking=non_blocking)
+                y_pred = model(x)
+                return output_transform(x, y, y_pred)
+
+        engine = Engine(_inference)
+
+    else:
+        inference_model = _TracedModel(model) if trace else model
+
+        def _batched_inference(engine, batch):
+            with torch.no_grad():
+                if inference_batch_size is None:
+                    x, y = prepare_batch(batch, device=device, non_blocking=non_blocking)
+                else:
+                    x, y = batch
+                y_pred = inference_model(x)
+                return output_transform(x, y, y_pred)
+
+        def _rebatch_data(data):
+            return _RebatchedData(data, inference_batch_size, prepare_batch, device=device, non_blocking=non_blocking)
 
-    engine = Engine(_inference)
+        engine = _InferenceEngine(_batched_inference, model,
+                                  rebatch_data=_rebatch_data if inference_batch_size is not None else None)
 
     for name, metric in metrics.items():
         metric.attach(engine, name)
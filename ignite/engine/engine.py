@@ -1,15 +1,33 @@
 import inspect
+import itertools
 import logging
+import numbers
 import sys
+import threading
 import time
+import warnings
+
+try:
+    from time import perf_counter
+except ImportError:
+    from time import time as perf_counter
 from collections import defaultdict
 from enum import Enum
 import weakref
 
+import torch
+from torch.utils.data import DataLoader
+
 from ignite._utils import _to_hours_mins_secs
+from ignite.utils import convert_tensor, apply_to_tensor
 
 IS_PYTHON2 = sys.version_info[0] < 3
 
+if IS_PYTHON2:
+    import Queue as queue
+else:
+    import queue
+
 
 class Events(Enum):
     """Events that are fired by the :class:`~ignite.engine.Engine` during execution."""
@@ -21,9 +39,98 @@ class Events(Enum):
     ITERATION_COMPLETED = "iteration_completed"
     EXCEPTION_RAISED = "exception_raised"
 
+    def __call__(self, event_filter=None, every=None, once=None):
+        """Create the event with a filter, see :class:`~ignite.engine.EventWithFilter`.
+
+        Example usage:
+
+        .. code-block:: python
+
+            @engine.on(Events.ITERATION_COMPLETED(every=100))
+            def log_training_loss(engine):
+                print("Iteration {}: {}".format(engine.state.iteration, engine.state.output))
+
+        """
+        return EventWithFilter(self, event_filter=event_filter, every=every, once=once)
+
+
+class EventWithFilter(object):
+    """An event whose handlers are called only on the occurrences of the event accepted by a filter.
+
+    The filter is applied by the engine's dispatcher before calling the handler, so that skipped occurrences cost
+    neither a handler call nor a mutation of the engine's state. Exactly one of `event_filter`, `every` and `once`
+    should be given. Filtered events are usually created by calling an event, e.g.
+    ``Events.ITERATION_COMPLETED(every=10)``, the class can be used to filter custom events registered
+    with `event_to_attr`.
+
+    Args:
+        event: an event with a state attribute, e.g. from :class:`~ignite.engine.Events` or registered by
+            :meth:`~ignite.engine.Engine.register_events` with `event_to_attr`.
+        event_filter (callable, optional): function receiving the engine and the value of the state attribute of
+            `event` (e.g. `engine.state.iteration` for :attr:`~ignite.engine.Events.ITERATION_COMPLETED`) and
+            returning True if the handler should be called.
+        every (int, optional): call the handler every `every` occurrences of the event.
+        once (int, optional): call the handler only once, when the state attribute of `event` is equal to `once`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        # Save a checkpoint every 5 epochs
+        engine.add_event_handler(Events.EPOCH_COMPLETED(every=5), checkpoint_handler, {'model': model})
+
+        # Unfreeze the backbone at the 3rd epoch
+        @engine.on(Events.EPOCH_STARTED(once=3))
+        def unfreeze(engine):
+            ...
+
+        # Custom filter
+        @engine.on(Events.ITERATION_COMPLETED(event_filter=lambda engine, iteration: iteration in (10, 50, 100)))
+        def log_iteration(engine):
+            ...
+
+    """
+
+    def __init__(self, event, event_filter=None, every=None, once=None):
+        if sum(arg is not None for arg in (event_filter, every, once)) != 1:
+            raise ValueError("Exactly one of the arguments event_filter, every and once should be specified")
+
+        if event_filter is not None and not callable(event_filter):
+            raise TypeError("Argument event_filter should be a callable, but given {}".format(type(event_filter)))
+
+        for name, value in (("every", every), ("once", once)):
+            if value is not None and (not isinstance(value, numbers.Integral) or value < 1):
+                raise ValueError("Argument {} should be a positive integer, but given {}".format(name, value))
+
+        self.event = event
+        self.event_filter = event_filter
+        self.every = every
+        self.once = once
+
+    def _compile(self):
+        """Return the filter as a function of the engine and the value of the event's state attribute."""
+        if self.every is not None:
+            every = self.every
+            return lambda engine, value: value % every == 0
+        if self.once is not None:
+            once = self.once
+            return lambda engine, value: value == once
+        return self.event_filter
+
+    def __repr__(self):
+        for name in ("every", "once", "event_filter"):
+            value = getattr(self, name)
+            if value is not None:
+                return "{}({}={})".format(self.event, name, value)
+
 
 class State(object):
-    """An object that is used to pass internal and user-defined state between event handlers."""
+    """An object that is used to pass internal and user-defined state between event handlers.
+
+    Default mapping of the events to the state attributes is given by the class attribute `event_to_attr`. Events
+    registered with :meth:`~ignite.engine.Engine.register_events` are added to the mapping of the state of the
+    engine only, and are available in the `event_to_attr` attribute of the instance.
+    """
 
     event_to_attr = {
         Events.ITERATION_STARTED: "iteration",
@@ -37,6 +144,8 @@ class State(object):
     def __init__(self, **kwargs):
         self.output = None
         self.batch = None
+        self.event_to_attr = dict(State.event_to_attr)
+        self.event_to_attr.update(kwargs.pop('event_to_attr', {}))
         for k, v in kwargs.items():
             setattr(self, k, v)
 
@@ -44,9 +153,11 @@ class State(object):
             setattr(self, value, 0)
 
     def get_event_attrib_value(self, event_name):
-        if event_name not in State.event_to_attr:
+        if isinstance(event_name, EventWithFilter):
+            event_name = event_name.event
+        if event_name not in self.event_to_attr:
             raise RuntimeError("Unknown event name '{}'".format(event_name))
-        return getattr(self, State.event_to_attr[event_name])
+        return getattr(self, self.event_to_attr[event_name])
 
 
 class RemovableEventHandle(object):
@@ -101,6 +212,134 @@ class RemovableEventHandle(object):
         self.remove()
 
 
+class _BatchPrefetcher(object):
+    """Iterator over `data` fetching the batches in a background thread.
+
+    Up to `depth` batches are fetched, optionally copied to page-locked memory and sent to `device` ahead of the
+    batch being processed. Batches are returned in the order of `data`, and an exception raised while fetching a
+    batch is re-raised when this batch is requested.
+
+    Args:
+        data (Iterable): collection of batches.
+        depth (int): maximum number of prepared batches waiting to be processed.
+        device (str or torch.device, optional): device the batches are sent to with `non_blocking=True`.
+        pin_memory (bool, optional): if True, tensors of the batches are copied to page-locked memory before being
+            sent to `device`.
+    """
+
+    _END = object()
+
+    def __init__(self, data, depth, device=None, pin_memory=False):
+        self._device = device
+        self._pin_memory = pin_memory
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._worker, args=(data, ))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _prepare(self, batch):
+        if self._pin_memory:
+            batch = apply_to_tensor(batch, lambda t: t.pin_memory())
+        if self._device is not None:
+            batch = convert_tensor(batch, device=self._device, non_blocking=True)
+        return batch
+
+    def _put(self, item):
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _worker(self, data):
+        try:
+            for batch in data:
+                if not self._put((self._prepare(batch), None)):
+                    return
+            self._put((self._END, None))
+        except BaseException as e:
+            self._put((None, e))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        batch, exception = self._queue.get()
+        if exception is not None:
+            raise exception
+        if batch is self._END:
+            raise StopIteration
+        return batch
+
+    next = __next__
+
+    def close(self, timeout=1.0):
+        """Stop the background thread, dropping the batches fetched in advance.
+
+        The thread is waited for at most `timeout` seconds. A thread blocked fetching a batch, e.g. from a slow or
+        hung iterator, is left running as a daemon thread and stops without using the batch once it is fetched.
+        """
+        self._stop_event.set()
+        deadline = time.time() + timeout
+        # Free the queue so that a worker blocked on a full queue stops without waiting for the timeout
+        while self._thread.is_alive() and time.time() < deadline:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._thread.join(timeout=0.01)
+
+
+class _SkipBatchSampler(object):
+    """Batch sampler dropping the first `num_batches` batches of indices of `batch_sampler`."""
+
+    def __init__(self, batch_sampler, num_batches):
+        self.batch_sampler = batch_sampler
+        self.num_batches = num_batches
+
+    def __iter__(self):
+        for i, batch_indices in enumerate(self.batch_sampler):
+            if i >= self.num_batches:
+                yield batch_indices
+
+    def __len__(self):
+        return max(len(self.batch_sampler) - self.num_batches, 0)
+
+
+def _get_dataloader_arg_names():
+    if IS_PYTHON2:
+        return inspect.getargspec(DataLoader.__init__).args[1:]
+    return list(inspect.signature(DataLoader.__init__).parameters)[1:]
+
+
+def _with_batch_sampler(dataloader, batch_sampler):
+    """Copy of `dataloader` with the batch sampler `batch_sampler`.
+
+    All the arguments of the constructor stored by `dataloader`, e.g. `collate_fn`, `worker_init_fn` or `timeout`,
+    are passed to the copy, except the ones defining its batches.
+    """
+    batch_args = ("dataset", "batch_size", "shuffle", "sampler", "batch_sampler", "drop_last")
+    kwargs = {name: getattr(dataloader, name) for name in _get_dataloader_arg_names()
+              if name not in batch_args and hasattr(dataloader, name)}
+    return DataLoader(dataloader.dataset, batch_sampler=batch_sampler, **kwargs)
+
+
+def _skip_batches(data, num_batches):
+    """Iterator over `data` without its first `num_batches` batches.
+
+    The batches of a `DataLoader` over a map-style dataset are skipped by dropping the indices of its batch sampler,
+    so that skipped batches are not loaded. Other iterables are consumed up to the first returned batch.
+    """
+    iterable_dataset_cls = getattr(torch.utils.data, "IterableDataset", ())
+    if isinstance(data, DataLoader) and data.batch_sampler is not None and \
+            not isinstance(data.dataset, iterable_dataset_cls):
+        return iter(_with_batch_sampler(data, _SkipBatchSampler(data.batch_sampler, num_batches)))
+    return itertools.islice(iter(data), num_batches, None)
+
+
 class Engine(object):
     """Runs a given process_function over each batch of a dataset, emitting events as it goes.
 
@@ -135,7 +374,20 @@ class Engine(object):
         self.should_terminate = False
         self.should_terminate_single_epoch = False
         self.state = None
+        self._prefetch = None
+        self._fixed_epoch_length = False
+        self._dataloader_iter = None
+        self._dataloader_iter_index = 0
+        self._num_batches_to_skip = 0
+        self._init_epoch_iteration = 0
+        self._is_state_loaded = False
+        self._profilers = []
         self._allowed_events = []
+        self._allowed_events_set = set()
+        self._event_to_attr = dict(State.event_to_attr)
+        # Per-event tuples of (handler, args, kwargs) that ``_fire_event`` iterates over.
+        # Rebuilt by ``_compile_event_handlers`` whenever handlers or allowed events change.
+        self._dispatch_table = {}
 
         self.register_events(*Events)
 
@@ -197,15 +449,18 @@ class Engine(object):
 
         for name in event_names:
             self._allowed_events.append(name)
+            self._allowed_events_set.add(name)
             if event_to_attr:
-                State.event_to_attr[name] = event_to_attr[name]
+                self._event_to_attr[name] = event_to_attr[name]
+            self._compile_event_handlers(name)
 
     def add_event_handler(self, event_name, handler, *args, **kwargs):
         """Add an event handler to be executed when the specified event is fired.
 
         Args:
             event_name: An event to attach the handler to. Valid events are from :class:`~ignite.engine.Events`
-                or any `event_name` added by :meth:`~ignite.engine.Engine.register_events`.
+                or any `event_name` added by :meth:`~ignite.engine.Engine.register_events`. Events with a state
+                attribute can be filtered, see :class:`~ignite.engine.EventWithFilter`.
             handler (callable): the callable event handler that should be invoked
             *args: optional args to be passed to `handler`.
             **kwargs: optional keyword args to be passed to `handler`.
@@ -231,15 +486,36 @@ class Engine(object):
 
             engine.add_event_handler(Events.EPOCH_COMPLETED, print_epoch)
 
+            # print the epoch every 10 epochs
+            engine.add_event_handler(Events.EPOCH_COMPLETED(every=10), print_epoch)
+
         """
-        if event_name not in self._allowed_events:
+        return self._add_event_handler(event_name, handler, args, kwargs)
+
+    def _add_event_handler(self, event_name, handler, args, kwargs, prepend=False):
+        # Adds `handler`, called with `args` and `kwargs`, after the handlers already added to `event_name` or, if
+        # `prepend`, before them, e.g. for the handlers of the engine's helpers which should run first
+        event_filter = None
+        if isinstance(event_name, EventWithFilter):
+            event_filter = event_name._compile()
+            event_name = event_name.event
+            if event_name not in self._event_to_attr:
+                raise ValueError("Event {} can not be filtered as it has no state attribute. "
+                                 "Use event_to_attr of register_events to define it.".format(event_name))
+
+        if event_name not in self._allowed_events_set:
             self._logger.error("attempt to add event handler to an invalid event %s.", event_name)
             raise ValueError("Event {} is not a valid event for this Engine.".format(event_name))
 
         event_args = (Exception(), ) if event_name == Events.EXCEPTION_RAISED else ()
         self._check_signature(handler, 'handler', *(event_args + args), **kwargs)
 
-        self._event_handlers[event_name].append((handler, args, kwargs))
+        record = (handler, args, kwargs, event_filter)
+        if prepend:
+            self._event_handlers[event_name].insert(0, record)
+        else:
+            self._event_handlers[event_name].append(record)
+        self._compile_event_handlers(event_name)
         self._logger.debug("added handler for event %s.", event_name)
 
         return RemovableEventHandle(event_name, handler, self)
@@ -252,6 +528,8 @@ class Engine(object):
             event_name: The event the handler attached to. Set this
                 to ``None`` to search all events.
         """
+        if isinstance(event_name, EventWithFilter):
+            event_name = event_name.event
         if event_name is not None:
             if event_name not in self._event_handlers:
                 return False
@@ -259,7 +537,7 @@ class Engine(object):
         else:
             events = self._event_handlers
         for e in events:
-            for h, _, _ in self._event_handlers[e]:
+            for h, _, _, _ in self._event_handlers[e]:
                 if h == handler:
                     return True
         return False
@@ -272,14 +550,44 @@ class Engine(object):
             event_name: The event the handler attached to.
 
         """
+        if isinstance(event_name, EventWithFilter):
+            event_name = event_name.event
         if event_name not in self._event_handlers:
             raise ValueError("Input event name '{}' does not exist".format(event_name))
 
-        new_event_handlers = [(h, args, kwargs) for h, args, kwargs in self._event_handlers[event_name]
-                              if h != handler]
+        new_event_handlers = [record for record in self._event_handlers[event_name] if record[0] != handler]
         if len(new_event_handlers) == len(self._event_handlers[event_name]):
             raise ValueError("Input handler '{}' is not found among registered event handlers".format(handler))
         self._event_handlers[event_name] = new_event_handlers
+        self._compile_event_handlers(event_name)
+
+    def _compile_event_handlers(self, event_name):
+        """Rebuild the dispatch table entry of `event_name` from the registered handlers.
+
+        Events without handlers are left out of the table, so that firing them costs a single dictionary lookup.
+        """
+        handlers = tuple(self._event_handlers.get(event_name, ()))
+        for profiler in self._profilers:
+            handlers = tuple((profiler._wrap_handler(event_name, h), args, kwargs, event_filter)
+                             for h, args, kwargs, event_filter in handlers)
+        if handlers and event_name in self._allowed_events_set:
+            self._dispatch_table[event_name] = handlers
+        else:
+            self._dispatch_table.pop(event_name, None)
+
+    def _add_profiler(self, profiler):
+        """Add a profiler timing the handlers, the data fetching and the process function of the engine.
+
+        Handlers are wrapped by the profilers in the dispatch table only, e.g. `has_event_handler` is unaffected.
+        """
+        self._profilers.append(profiler)
+        for event_name in list(self._event_handlers):
+            self._compile_event_handlers(event_name)
+
+    def _remove_profiler(self, profiler):
+        self._profilers.remove(profiler)
+        for event_name in list(self._event_handlers):
+            self._compile_event_handlers(event_name)
 
     def _check_signature(self, fn, fn_description, *args, **kwargs):
         exception_msg = None
@@ -338,11 +646,21 @@ class Engine(object):
             **event_kwargs: optional keyword args to be passed to all handlers.
 
         """
-        if event_name in self._allowed_events:
-            self._logger.debug("firing handlers for event %s ", event_name)
-            for func, args, kwargs in self._event_handlers[event_name]:
-                kwargs.update(event_kwargs)
-                func(self, *(event_args + args), **kwargs)
+        handlers = self._dispatch_table.get(event_name)
+        if handlers is None:
+            return
+
+        self._logger.debug("firing handlers for event %s ", event_name)
+        event_value = None
+        for func, args, kwargs, event_filter in handlers:
+            if event_filter is not None:
+                if event_value is None:
+                    event_value = self.state.get_event_attrib_value(event_name)
+                if not event_filter(self, event_value):
+                    continue
+            if event_kwargs:
+                kwargs = dict(kwargs, **event_kwargs)
+            func(self, *(event_args + args), **kwargs)
 
     def fire_event(self, event_name):
         """Execute all the handlers associated with given event.
@@ -380,21 +698,159 @@ class Engine(object):
                           "Current epoch iteration will stop after current iteration is finished.")
         self.should_terminate_single_epoch = True
 
+    def state_dict(self):
+        """Returns a dictionary containing the engine's state needed to resume a run with
+        :meth:`~ignite.engine.Engine.load_state_dict`: `seed`, `epoch_length`, `max_epochs`, `epoch` and `iteration`.
+
+        Example usage:
+
+        .. code-block:: python
+
+            @trainer.on(Events.ITERATION_COMPLETED(every=1000))
+            def save_checkpoint(engine):
+                torch.save({"trainer": engine.state_dict(), "model": model.state_dict()}, "checkpoint.pth")
+
+        Returns:
+            dict: an empty dictionary if the engine was not run.
+        """
+        if self.state is None:
+            return {}
+        return {k: getattr(self.state, k) for k in self._state_dict_keys}
+
+    _state_dict_keys = ("seed", "epoch_length", "max_epochs", "epoch", "iteration")
+
+    def load_state_dict(self, state_dict):
+        """Setups the engine's state from `state_dict`, such that the next call of
+        :meth:`~ignite.engine.Engine.run` continues the saved run.
+
+        The run is continued from the saved iteration, possibly in the middle of an epoch. If the epoch length is
+        known, the already processed batches of the data are skipped; for a `DataLoader` over a map-style dataset
+        they are skipped without being loaded. If the run was started with a `seed`, the batches are the ones of the
+        saved run, even for a shuffling `DataLoader`.
+
+        For data without length, e.g. a stream run with `epoch_length`, the first `iteration` batches of a new
+        iterator over the data are consumed and dropped. The batches are the ones of the saved run if the data
+        yields the same batches and if its iterator was not exhausted during the saved run; a new iterator over a
+        finite stream exhausted during the saved run is not positioned exactly. Without a known epoch length, only
+        the completed epochs are restored.
+
+        Args:
+            state_dict (dict): a dictionary returned by :meth:`~ignite.engine.Engine.state_dict`.
+
+        Example usage:
+
+        .. code-block:: python
+
+            checkpoint = torch.load("checkpoint.pth")
+            model.load_state_dict(checkpoint["model"])
+            trainer.load_state_dict(checkpoint["trainer"])
+            trainer.run(data_loader)
+
+        """
+        if not isinstance(state_dict, dict):
+            raise TypeError("Argument state_dict should be a dictionary, but given {}".format(type(state_dict)))
+
+        missing_keys = [k for k in self._state_dict_keys if k not in state_dict]
+        if missing_keys:
+            raise ValueError("Required keys {} are absent in provided state_dict".format(missing_keys))
+
+        self.state = State(dataloader=None, max_epochs=state_dict["max_epochs"], seed=state_dict["seed"],
+                           epoch_length=state_dict["epoch_length"], metrics={}, event_to_attr=self._event_to_attr)
+        self.state.epoch = state_dict["epoch"]
+        self.state.iteration = state_dict["iteration"]
+        self._is_state_loaded = True
+
+    def _setup_resumed_run(self):
+        """Setup the epoch counter and the position in the data to continue the loaded state."""
+        epoch_length = self.state.epoch_length
+        if epoch_length is None:
+            # Only the completed epochs can be restored
+            self._dataloader_iter_index = self.state.epoch
+            return
+
+        self.state.epoch, self._init_epoch_iteration = divmod(self.state.iteration, epoch_length)
+        data_length = len(self.state.dataloader) if hasattr(self.state.dataloader, "__len__") else None
+        if data_length:
+            self._dataloader_iter_index, self._num_batches_to_skip = divmod(self.state.iteration, data_length)
+        elif data_length is None:
+            # All the batches were taken from a single iterator kept between the epochs
+            self._num_batches_to_skip = self.state.iteration
+
+    def _create_dataloader_iter(self):
+        if self.state.seed is not None:
+            torch.manual_seed(self.state.seed + self._dataloader_iter_index)
+        self._dataloader_iter_index += 1
+
+        data = self.state.dataloader
+        if self._num_batches_to_skip > 0:
+            data = _skip_batches(data, self._num_batches_to_skip)
+            self._num_batches_to_skip = 0
+
+        if self._prefetch is not None:
+            return _BatchPrefetcher(data, **self._prefetch)
+        return iter(data)
+
+    def _close_dataloader_iter(self):
+        if isinstance(self._dataloader_iter, _BatchPrefetcher):
+            self._dataloader_iter.close()
+        self._dataloader_iter = None
+
     def _run_once_on_dataset(self):
         start_time = time.time()
 
+        # Without a fixed epoch length, the epoch ends when the data is exhausted
+        epoch_length = self.state.epoch_length if self._fixed_epoch_length else None
+        epoch_iteration = self._init_epoch_iteration
+        self._init_epoch_iteration = 0
+        profilers = self._profilers
+
         try:
-            for batch in self.state.dataloader:
+            while epoch_length is None or epoch_iteration < epoch_length:
+                new_iter = self._dataloader_iter is None
+                if new_iter:
+                    self._dataloader_iter = self._create_dataloader_iter()
+                try:
+                    if profilers:
+                        start = perf_counter()
+                    batch = next(self._dataloader_iter)
+                    if profilers:
+                        elapsed = perf_counter() - start
+                        for profiler in profilers:
+                            profiler._add_dataflow_time(elapsed)
+                except StopIteration:
+                    self._close_dataloader_iter()
+                    if epoch_length is None:
+                        break
+                    if new_iter:
+                        warnings.warn("Data iterator can not provide data anymore but required number of iterations "
+                                      "of the epoch ({}) is not reached. Current iteration: {}"
+                                      .format(epoch_length, self.state.iteration))
+                        self.should_terminate = True
+                        break
+                    continue
+
+                epoch_iteration += 1
                 self.state.batch = batch
                 self.state.iteration += 1
                 self._fire_event(Events.ITERATION_STARTED)
-                self.state.output = self._process_function(self, batch)
+                if profilers:
+                    start = perf_counter()
+                    self.state.output = self._process_function(self, batch)
+                    elapsed = perf_counter() - start
+                    for profiler in profilers:
+                        profiler._add_processing_time(elapsed)
+                else:
+                    self.state.output = self._process_function(self, batch)
                 self._fire_event(Events.ITERATION_COMPLETED)
                 if self.should_terminate or self.should_terminate_single_epoch:
                     self.should_terminate_single_epoch = False
                     break
 
+            if epoch_length is None:
+                self._close_dataloader_iter()
+
         except BaseException as e:
+            self._close_dataloader_iter()
             self._logger.error("Current run is terminating due to exception: %s.", str(e))
             self._handle_exception(e)
 
@@ -404,30 +860,108 @@ class Engine(object):
         return hours, mins, secs
 
     def _handle_exception(self, e):
-        if Events.EXCEPTION_RAISED in self._event_handlers:
+        if Events.EXCEPTION_RAISED in self._dispatch_table:
             self._fire_event(Events.EXCEPTION_RAISED, e)
         else:
             raise e
 
-    def run(self, data, max_epochs=1):
+    def run(self, data, max_epochs=None, epoch_length=None, seed=None, prefetch=0, prefetch_device=None,
+            pin_memory=False):
         """Runs the process_function over the passed data.
 
+        If the engine's state was set with :meth:`~ignite.engine.Engine.load_state_dict`, the loaded run is
+        continued. Otherwise a new run is started.
+
         Args:
             data (Iterable): Collection of batches allowing repeated iteration (e.g., list or `DataLoader`).
-            max_epochs (int, optional): max epochs to run for (default: 1).
+                If `epoch_length` is given, `data` can also be an iterator, e.g. a generator.
+            max_epochs (int, optional): max epochs to run for (default: 1, or the loaded value for a continued run).
+            epoch_length (int, optional): number of iterations of an epoch. If given, the batches are taken from a
+                single iterator over `data` that is kept between the epochs, and a new iterator is only created
+                when it is exhausted. If None, an epoch is a full iteration over `data` (default: None, or the
+                loaded value for a continued run).
+            seed (int, optional): if given, `torch.manual_seed(seed + k)` is called before creating the `k`-th
+                iterator over `data`, such that the order of the batches, e.g. of a shuffling `DataLoader`, is
+                reproducible and can be restored when continuing the run (default: None, or the loaded value for a
+                continued run).
+            prefetch (int, optional): if positive, batches are fetched from `data` in a background thread, up to
+                `prefetch` batches ahead of the batch being processed (default: 0, batches are fetched when needed).
+            prefetch_device (str or torch.device, optional): if given with `prefetch`, tensors of the batches are
+                sent to this device with `non_blocking=True` in the background thread, so that the host-to-device
+                copy of the next batch overlaps the processing of the current one (default: None).
+            pin_memory (bool, optional): if True with `prefetch`, tensors of the batches are copied to page-locked
+                memory before being sent to `prefetch_device` (default: False).
+
+        Note:
+            `engine.state.epoch_length` contains the number of iterations of an epoch: `epoch_length` if given,
+            otherwise the length of `data` if it has one, None otherwise. Handlers should rely on it instead of
+            `len(engine.state.dataloader)`.
+
+        Note:
+            With `epoch_length`, an epoch terminated with :meth:`~ignite.engine.Engine.terminate_epoch` is followed
+            by an epoch starting from the next batch of the iterator. The run is terminated with a warning if a
+            new iterator over `data` provides no batch.
+
+        Note:
+            With `prefetch`, batches fetched in advance are dropped when the iterator over `data` is closed: at the
+            end of the run and, without `epoch_length`, at the end of each epoch, e.g. terminated with
+            :meth:`~ignite.engine.Engine.terminate_epoch`. With `epoch_length`, the iterator is kept between the
+            epochs and the batches fetched in advance are processed by the next epoch. `engine.state.batch` contains
+            the batch as sent to `prefetch_device`.
+
+        Example usage:
+
+        .. code-block:: python
+
+            # Pull 1000 batches per epoch from a stream, without re-creating the DataLoader workers every epoch
+            loader = DataLoader(iterable_dataset, batch_size=32, num_workers=4)
+            trainer.run(loader, max_epochs=50, epoch_length=1000)
 
         Returns:
             State: output state.
         """
+        if epoch_length is not None and (not isinstance(epoch_length, numbers.Integral) or epoch_length < 1):
+            raise ValueError("Argument epoch_length should be a positive integer, but given {}".format(epoch_length))
+
+        if prefetch < 0:
+            raise ValueError("Argument prefetch should be a non-negative integer, but given {}".format(prefetch))
+        if prefetch > 0:
+            self._prefetch = dict(depth=prefetch, device=prefetch_device, pin_memory=pin_memory)
+        else:
+            self._prefetch = None
+
+        data_length = len(data) if hasattr(data, "__len__") else None
+        self._dataloader_iter_index = 0
+        self._num_batches_to_skip = 0
+        self._init_epoch_iteration = 0
+
+        if self._is_state_loaded:
+            self._is_state_loaded = False
+            self.state.dataloader = data
+            if max_epochs is not None:
+                self.state.max_epochs = max_epochs
+            if epoch_length is not None:
+                self.state.epoch_length = epoch_length
+            elif self.state.epoch_length is None:
+                self.state.epoch_length = data_length
+            if seed is not None:
+                self.state.seed = seed
+            self._fixed_epoch_length = self.state.epoch_length is not None and self.state.epoch_length != data_length
+            self._setup_resumed_run()
+        else:
+            self._fixed_epoch_length = epoch_length is not None
+            self.state = State(dataloader=data, max_epochs=1 if max_epochs is None else max_epochs,
+                               epoch_length=data_length if epoch_length is None else epoch_length, seed=seed,
+                               metrics={}, event_to_attr=self._event_to_attr)
 
-        self.state = State(dataloader=data, max_epochs=max_epochs, metrics={})
         self.should_terminate = self.should_terminate_single_epoch = False
+        self._close_dataloader_iter()
 
         try:
-            self._logger.info("Engine run starting with max_epochs={}.".format(max_epochs))
+            self._logger.info("Engine run starting with max_epochs={}.".format(self.state.max_epochs))
             start_time = time.time()
             self._fire_event(Events.STARTED)
-            while self.state.epoch < max_epochs and not self.should_terminate:
+            while self.state.epoch < self.state.max_epochs and not self.should_terminate:
                 self.state.epoch += 1
                 self._fire_event(Events.EPOCH_STARTED)
                 hours, mins, secs = self._run_once_on_dataset()
@@ -445,4 +979,7 @@ class Engine(object):
             self._logger.error("Engine run is terminating due to exception: %s.", str(e))
             self._handle_exception(e)
 
+        finally:
+            self._close_dataloader_iter()
+
         return self.state
@@ -0,0 +1,295 @@
+from __future__ import division, print_function
+
+from ignite.engine.engine import Events
+
+try:
+    from time import perf_counter
+except ImportError:
+    from time import time as perf_counter
+
+
+class _TimeStats(object):
+    """Number of calls and total, minimal and maximal durations of these calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.
+        self.min = float("inf")
+        self.max = 0.
+
+    def add(self, elapsed):
+        self.calls += 1
+        self.total += elapsed
+        if elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "mean": self.total / self.calls if self.calls > 0 else 0.,
+            "min": self.min if self.calls > 0 else 0.,
+            "max": self.max,
+        }
+
+
+def _get_handler_name(handler):
+    self_ = getattr(handler, "__self__", None)
+    if self_ is not None:
+        return "{}.{}".format(type(self_).__name__, handler.__name__)
+    name = getattr(handler, "__qualname__", getattr(handler, "__name__", None))
+    if name is None:
+        name = type(handler).__name__
+    return name
+
+
+class HandlersTimeProfiler(object):
+    """Profiler of the time spent by an engine in each of its handlers, fetching the data and processing the batches.
+
+    Once attached, the engine records the number of calls and the wall time of each of its handlers for each event,
+    of the data fetching (`next` on the data iterator) and of the process function. Handlers are timed by wrapping
+    them in the dispatch table of the engine, so that an engine without profiler has no timing overhead. Calls
+    skipped by an event filter are not counted. The results are reset when the engine is started.
+
+    Examples:
+
+    .. code-block:: python
+
+        from ignite.engine import HandlersTimeProfiler
+
+        trainer = ...
+        profiler = HandlersTimeProfiler()
+        profiler.attach(trainer)
+
+        @trainer.on(Events.COMPLETED)
+        def log_profiling(engine):
+            profiler.print_results(profiler.get_results())
+
+        trainer.run(data_loader)
+
+    The output looks like::
+
+        Handler                        Event                         Calls  Total (s)   Mean (s)    Min (s)    Max (s)
+        --------------------------------------------------------------------------------------------------------------
+        ModelCheckpoint                Events.EPOCH_COMPLETED           10    12.6148     1.2615     1.1902     1.4123
+        log_training_loss              Events.ITERATION_COMPLETED     4690     0.1510     0.0000     0.0000     0.0016
+        ...
+        --------------------------------------------------------------------------------------------------------------
+        Total handlers                                                         12.7658
+        Dataflow                                                      4690    35.0541     0.0075     0.0012     2.2312
+        Processing                                                    4690    62.3346     0.0133     0.0108     0.0915
+
+    """
+
+    def __init__(self):
+        self._engine = None
+        self._reset()
+
+    def _reset(self, *args):
+        self._handlers_stats = {}
+        self._dataflow_stats = _TimeStats()
+        self._processing_stats = _TimeStats()
+
+    def attach(self, engine):
+        """Attach the profiler to the engine.
+
+        Args:
+            engine (Engine): engine to profile.
+        """
+        if self._engine is not None:
+            raise RuntimeError("This profiler is already attached to an engine")
+        self._engine = engine
+        engine.add_event_handler(Events.STARTED, self._reset)
+        engine._add_profiler(self)
+
+    def detach(self):
+        """Detach the profiler from its engine. Results are kept until the profiler is attached again."""
+        if self._engine is None:
+            return
+        self._engine._remove_profiler(self)
+        if self._engine.has_event_handler(self._reset, Events.STARTED):
+            self._engine.remove_event_handler(self._reset, Events.STARTED)
+        self._engine = None
+
+    def _wrap_handler(self, event_name, handler):
+        key = (event_name, handler)
+
+        # The stats are looked up at each call as they are re-created when the engine is started
+        def timed_handler(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stats = self._handlers_stats.get(key)
+                if stats is None:
+                    stats = self._handlers_stats[key] = _TimeStats()
+                stats.add(elapsed)
+
+        return timed_handler
+
+    def _add_dataflow_time(self, elapsed):
+        self._dataflow_stats.add(elapsed)
+
+    def _add_processing_time(self, elapsed):
+        self._processing_stats.add(elapsed)
+
+    def get_results(self):
+        """Get the profiling results.
+
+        Returns:
+            dict: with keys
+
+            - `handlers`: list of dictionaries with keys `handler` (name of the handler), `event`, `calls`, `total`,
+              `mean`, `min` and `max` (in seconds), sorted by decreasing total time. Handlers never called are omitted.
+            - `dataflow`: dictionary with keys `calls`, `total`, `mean`, `min` and `max` for the data fetching.
+            - `processing`: dictionary with keys `calls`, `total`, `mean`, `min` and `max` for the process function.
+        """
+        handlers = []
+        for (event_name, handler), stats in self._handlers_stats.items():
+            if stats.calls == 0:
+                continue
+            result = stats.to_dict()
+            result["handler"] = _get_handler_name(handler)
+            result["event"] = event_name
+            handlers.append(result)
+        handlers.sort(key=lambda r: r["total"], reverse=True)
+
+        return {
+            "handlers": handlers,
+            "dataflow": self._dataflow_stats.to_dict(),
+            "processing": self._processing_stats.to_dict(),
+        }
+
+    @staticmethod
+    def print_results(results):
+        """Print the results of :meth:`get_results` as a table.
+
+        Args:
+            results (dict): profiling results.
+
+        Returns:
+            str: the printed table.
+        """
+        row_fmt = "{:<30} {:<28} {:>6} {:>10} {:>10} {:>10} {:>10}"
+        header = row_fmt.format("Handler", "Event", "Calls", "Total (s)", "Mean (s)", "Min (s)", "Max (s)")
+        separator = "-" * len(header)
+
+        def _row(name, event, r):
+            return row_fmt.format(name[:30], event[:28], r["calls"], "{:.4f}".format(r["total"]),
+                                  "{:.4f}".format(r["mean"]), "{:.4f}".format(r["min"]), "{:.4f}".format(r["max"]))
+
+        lines = [header, separator]
+        for r in results["handlers"]:
+            lines.append(_row(r["handler"], str(r["event"]), r))
+        lines.append(separator)
+        lines.append(row_fmt.format("Total handlers", "", "",
+                                    "{:.4f}".format(sum(r["total"] for r in results["handlers"])), "", "", ""))
+        lines.append(_row("Dataflow", "", results["dataflow"]))
+        lines.append(_row("Processing", "", results["processing"]))
+
+        output = "\n".join(lines)
+        print(output)
+        return output
+
+
+class TimesRecorder(object):
+    """Recorder of the time spent by an engine waiting for the data, in its process function and in its handlers.
+
+    Once attached, `engine.state.times` is a dictionary of running aggregates, in seconds, updated at each
+    iteration:
+
+    - `dataflow`, `processing` and `handlers`: total times since the engine was started spent in `next` on the data
+      iterator, in the process function and in the handlers.
+    - `iteration_dataflow`, `iteration_processing` and `iteration_handlers`: times of the current iteration. The
+      times of the handlers are accumulated from the fetching of the batch, i.e. they include the handlers of
+      `ITERATION_STARTED` and, for those called so far, of `ITERATION_COMPLETED`.
+    - `dataflow_fraction`: fraction of the total time spent waiting for the data, updated after the process
+      function. A value close to 1 indicates an input-bound engine, e.g. a `DataLoader` with too few workers.
+
+    As `engine.state.times` contains numbers only, it can be logged directly, for example with
+    :class:`~ignite.contrib.handlers.tqdm_logger.ProgressBar` or
+    :class:`~ignite.contrib.handlers.tensorboard_logger.TensorboardLogger`.
+
+    Examples:
+
+    .. code-block:: python
+
+        from ignite.engine import TimesRecorder
+        from ignite.contrib.handlers import ProgressBar
+
+        trainer = ...
+        TimesRecorder().attach(trainer)
+
+        pbar = ProgressBar()
+        pbar.attach(trainer, output_transform=lambda _: {"data": trainer.state.times["dataflow_fraction"]})
+
+        tb_logger.attach(trainer,
+                         log_handler=OutputHandler(tag="times", output_transform=lambda _: trainer.state.times),
+                         event_name=Events.ITERATION_COMPLETED(every=100))
+
+    """
+
+    _keys = ("dataflow", "processing", "handlers", "iteration_dataflow", "iteration_processing", "iteration_handlers",
+             "dataflow_fraction")
+
+    def __init__(self):
+        self._engine = None
+        self._times = None
+
+    def _reset(self, engine):
+        self._times = engine.state.times = dict.fromkeys(self._keys, 0.)
+
+    def attach(self, engine):
+        """Attach the recorder to the engine.
+
+        Args:
+            engine (Engine): engine to record.
+        """
+        if self._engine is not None:
+            raise RuntimeError("This recorder is already attached to an engine")
+        self._engine = engine
+        # Registered first, so that the times are available to the other handlers of `STARTED`
+        engine._add_event_handler(Events.STARTED, self._reset, (), {}, prepend=True)
+        engine._add_profiler(self)
+
+    def detach(self):
+        """Detach the recorder from its engine. `engine.state.times` is no longer updated."""
+        if self._engine is None:
+            return
+        self._engine._remove_profiler(self)
+        if self._engine.has_event_handler(self._reset, Events.STARTED):
+            self._engine.remove_event_handler(self._reset, Events.STARTED)
+        self._engine = None
+        self._times = None
+
+    def _wrap_handler(self, event_name, handler):
+
+        def timed_handler(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                times = self._times
+                if times is not None:
+                    times["handlers"] += elapsed
+                    times["iteration_handlers"] += elapsed
+
+        return timed_handler
+
+    def _add_dataflow_time(self, elapsed):
+        times = self._times
+        times["dataflow"] += elapsed
+        times["iteration_dataflow"] = elapsed
+        times["iteration_processing"] = 0.
+        times["iteration_handlers"] = 0.
+
+    def _add_processing_time(self, elapsed):
+        times = self._times
+        times["processing"] += elapsed
+        times["iteration_processing"] = elapsed
+        total = times["dataflow"] + times["processing"] + times["handlers"]
+        times["dataflow_fraction"] = times["dataflow"] / total if total > 0 else 0.
@@ -1,8 +1,10 @@
 import logging
 import numbers
+import weakref
 
 import torch
 
+from ignite.engine import Events
 from ignite.utils import apply_to_type
 
 
@@ -18,6 +20,12 @@ class TerminateOnNan(object):
             :class:`~ignite.engine.Engine`'s `process_function`'s output into a number or `torch.tensor`
             or collection of them. This can be useful if, for example, you have a multi-output model and
             you want to check one or multiple values of the output.
+        check_every (int, optional): number of calls between two reads of the checks of the tensors. Tensors are
+            checked at each call, on their device, but reading the result of a check synchronizes the device with
+            the host. With `check_every` greater than 1, the results for tensors are only read every `check_every`
+            calls and at the end of each epoch and of the run, and the training is stopped up to `check_every - 1`
+            iterations after the NaN or infinite value (default: 1). The handler should then be added to the
+            engine with :meth:`attach`.
 
 
     Examples:
@@ -26,27 +34,80 @@ class TerminateOnNan(object):
 
         trainer.add_event_handler(Events.ITERATION_COMPLETED, TerminateOnNan())
 
+        # Loss kept on the device by the trainer, checked without synchronization at each iteration
+        trainer = create_supervised_trainer(model, optimizer, loss_fn, materialize_every=None)
+        TerminateOnNan(check_every=50).attach(trainer)
+
     """
 
-    def __init__(self, output_transform=lambda x: x):
+    def __init__(self, output_transform=lambda x: x, check_every=1):
+        if not isinstance(check_every, numbers.Integral) or check_every < 1:
+            raise ValueError("Argument check_every should be a positive integer, but given {}".format(check_every))
+
         self._logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
         self._logger.addHandler(logging.StreamHandler())
         self._output_transform = output_transform
+        self._check_every = check_every
+        self._num_calls = 0
+        self._pending_checks = []
+        # Engines to which the handler is attached, which read the pending checks at the end of epochs and runs
+        self._engines = weakref.WeakSet()
+
+    def attach(self, engine, event_name=Events.ITERATION_COMPLETED):
+        """Attach the handler to the engine, the output being checked at `event_name`. With `check_every` greater
+        than 1, the checks pending at `EPOCH_COMPLETED` and `COMPLETED` are read before the other handlers of these
+        events.
+
+        Args:
+            engine (Engine): the engine to which the handler is attached.
+            event_name (Events, optional): event at which the output is checked (default:
+                `Events.ITERATION_COMPLETED`).
+        """
+        engine.add_event_handler(event_name, self)
+        if self._check_every > 1 and engine not in self._engines:
+            engine._add_event_handler(Events.EPOCH_COMPLETED, self._read_pending_checks, (), {}, prepend=True)
+            engine._add_event_handler(Events.COMPLETED, self._read_pending_checks, (), {}, prepend=True)
+            self._engines.add(engine)
 
     def __call__(self, engine):
         output = self._output_transform(engine.state.output)
 
         def raise_error(x):
 
-            if isinstance(x, numbers.Number):
+            is_number = isinstance(x, numbers.Number)
+            if is_number:
                 x = torch.tensor(x)
 
-            if isinstance(x, torch.Tensor) and not bool(torch.isfinite(x).all()):
-                raise RuntimeError("Infinite or NaN tensor found.")
+            is_finite = torch.isfinite(x).all()
+            if is_number or self._check_every == 1:
+                if not bool(is_finite):
+                    raise RuntimeError("Infinite or NaN tensor found.")
+            else:
+                self._pending_checks.append((is_finite, engine.state.iteration))
+
+        if self._check_every > 1 and engine not in self._engines:
+            raise RuntimeError("With check_every greater than 1, TerminateOnNan should be added to the engine with "
+                               "attach(engine), to read the checks pending at the end of the epochs and of the run")
 
         try:
             apply_to_type(output, (numbers.Number, torch.Tensor), raise_error)
         except RuntimeError:
-            self._logger.warning("{}: Output '{}' contains NaN or Inf. Stop training"
-                                 .format(self.__class__.__name__, output))
-            engine.terminate()
+            self._terminate(engine, "Output '{}'".format(output))
+            return
+
+        self._num_calls += 1
+        if self._num_calls % self._check_every == 0:
+            self._read_pending_checks(engine)
+
+    def _read_pending_checks(self, engine):
+        pending_checks, self._pending_checks = self._pending_checks, []
+        for is_finite, iteration in pending_checks:
+            if not bool(is_finite):
+                self._terminate(engine, "Output of iteration {}".format(iteration))
+                return
+
+    def _terminate(self, engine, output_desc):
+        self._pending_checks = []
+        self._logger.warning("{}: {} contains NaN or Inf. Stop training"
+                             .format(self.__class__.__name__, output_desc))
+        engine.terminate()
@@ -10,6 +10,8 @@ from ignite.metrics.recall import Recall
 from ignite.metrics.root_mean_squared_error import RootMeanSquaredError
 from ignite.metrics.top_k_categorical_accuracy import TopKCategoricalAccuracy
 from ignite.metrics.running_average import RunningAverage
+from ignite.metrics.windowed_metric import WindowedMetric
 from ignite.metrics.metrics_lambda import MetricsLambda
+from ignite.metrics.metric_group import MetricGroup
 from ignite.metrics.confusion_matrix import ConfusionMatrix, IoU, mIoU
 from ignite.metrics.accumulation import VariableAccumulation, Average, GeometricAverage
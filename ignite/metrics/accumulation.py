@@ -2,6 +2,7 @@ import numbers
 import torch
 
 from ignite.metrics import Metric
+from ignite.metrics.metric import sync_all_reduce
 from ignite.exceptions import NotComputableError
 
 
@@ -14,6 +15,11 @@ class VariableAccumulation(Metric):
     Note:
 
         The class stores input into two public variables: `accumulator` and `num_examples`.
+        :meth:`~ignite.metrics.Metric.merge` sums the accumulators, which requires `op` to add a function of the
+        output to the accumulator, e.g. `a + x` or `a + log(x)`. In a distributed configuration, :meth:`compute`
+        returns the local accumulator and number of samples, which are not reduced over the processes, while the
+        accumulators of :class:`~ignite.metrics.Average` and :class:`~ignite.metrics.GeometricAverage` are summed
+        over the processes.
         Number of samples is updated following the rule:
 
         - `+1` if input is a number
@@ -38,6 +44,8 @@ class VariableAccumulation(Metric):
         self._op = op
         super(VariableAccumulation, self).__init__(output_transform=output_transform)
 
+    _state_dict_keys = ("accumulator", "num_examples")
+
     def reset(self):
         self.accumulator = torch.tensor(0.0, dtype=torch.float64)
         self.num_examples = torch.tensor(0.0, dtype=torch.float64)
@@ -100,6 +108,7 @@ class Average(VariableAccumulation):
 
         super(Average, self).__init__(op=_mean_op, output_transform=output_transform)
 
+    @sync_all_reduce("accumulator", "num_examples")
     def compute(self):
         if self.num_examples < 1:
             raise NotComputableError("{} must have at least one example before"
@@ -138,6 +147,7 @@ class GeometricAverage(VariableAccumulation):
 
         super(GeometricAverage, self).__init__(op=_geom_op, output_transform=output_transform)
 
+    @sync_all_reduce("accumulator", "num_examples")
     def compute(self):
         if self.num_examples < 1:
             raise NotComputableError("{} must have at least one example before"
@@ -2,14 +2,17 @@ from __future__ import division
 
 import torch
 
-from ignite.metrics.metric import Metric
+from ignite.metrics.metric import Metric, sync_all_reduce, _check_validate_inputs
+from ignite.metrics.metric_group import _binary_counts, _class_counts
 from ignite.exceptions import NotComputableError
 
 
 class _BaseClassification(Metric):
 
-    def __init__(self, output_transform=lambda x: x, is_multilabel=False):
+    def __init__(self, output_transform=lambda x: x, is_multilabel=False, validate_inputs="first_batch"):
+        _check_validate_inputs(validate_inputs)
         self._is_multilabel = is_multilabel
+        self._validate_inputs = validate_inputs
         self._type = None
         self._num_classes = None
         super(_BaseClassification, self).__init__(output_transform=output_transform)
@@ -47,18 +50,39 @@ class _BaseClassification(Metric):
         if not torch.equal(y_pred, y_pred ** 2):
             raise ValueError("For binary cases, y_pred must be comprised of 0's and 1's.")
 
+    def _should_validate(self):
+        # Whether the values of the batch are checked, the first batch after a reset being the one without type
+        return self._validate_inputs == "always" or (self._validate_inputs == "first_batch" and self._type is None)
+
     def _check_type(self, output):
+        self._set_type(*self._get_type(output, self._should_validate()))
+
+    def _check_shared(self, shared):
+        # Checks of the shapes and of the type of the batch, run once per batch for the metrics of a group.
+        # Returns whether the values of the batch are checked.
+        validate = self._should_validate()
+
+        def _check_shape_and_get_type(output):
+            self._check_shape(output)
+            return self._get_type(output, validate)
+
+        self._set_type(*shared.get(("type", self._is_multilabel, validate), _check_shape_and_get_type))
+        return validate
+
+    def _get_type(self, output, validate=True):
         y_pred, y = output
 
         if y.ndimension() + 1 == y_pred.ndimension():
             num_classes = y_pred.shape[1]
             if num_classes == 1:
                 update_type = "binary"
-                self._check_binary_multilabel_cases((y_pred, y))
+                if validate:
+                    self._check_binary_multilabel_cases((y_pred, y))
             else:
                 update_type = "multiclass"
         elif y.ndimension() == y_pred.ndimension():
-            self._check_binary_multilabel_cases((y_pred, y))
+            if validate:
+                self._check_binary_multilabel_cases((y_pred, y))
 
             if self._is_multilabel:
                 update_type = "multilabel"
@@ -69,6 +93,9 @@ class _BaseClassification(Metric):
         else:
             raise RuntimeError("Invalid shapes of y (shape={}) and y_pred (shape={}), check documentation."
                                " for expected shapes of y and y_pred.".format(y.shape, y_pred.shape))
+        return update_type, num_classes
+
+    def _set_type(self, update_type, num_classes):
         if self._type is None:
             self._type = update_type
             self._num_classes = num_classes
@@ -79,6 +106,15 @@ class _BaseClassification(Metric):
                 raise ValueError("Input data number of classes has changed from {} to {}"
                                  .format(self._num_classes, num_classes))
 
+    def _additive_state_dict_keys(self):
+        return tuple(k for k in self._state_dict_keys if k not in ("_type", "_num_classes"))
+
+    def _merge_state_dict(self, state_dict):
+        # The types of the data should be the same, the counts are summed
+        if state_dict["_type"] is not None:
+            self._set_type(state_dict["_type"], state_dict["_num_classes"])
+        super(_BaseClassification, self)._merge_state_dict(state_dict)
+
 
 class Accuracy(_BaseClassification):
     """
@@ -108,12 +144,19 @@ class Accuracy(_BaseClassification):
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
         is_multilabel (bool, optional): flag to use in multilabel case. By default, False.
+        validate_inputs (str, optional): policy of the checks of the values of `y` and `y_pred`, e.g. that they
+            are comprised of 0's and 1's in binary and multilabel cases, which allocate and compare tensors of the
+            size of the batch: "always" checks all the batches, "first_batch" the first batch after each reset and
+            "never" none. The shapes are always checked. By default, "first_batch".
     """
 
-    def __init__(self, output_transform=lambda x: x, is_multilabel=False):
+    def __init__(self, output_transform=lambda x: x, is_multilabel=False, validate_inputs="first_batch"):
         self._num_correct = None
         self._num_examples = None
-        super(Accuracy, self).__init__(output_transform=output_transform, is_multilabel=is_multilabel)
+        super(Accuracy, self).__init__(output_transform=output_transform, is_multilabel=is_multilabel,
+                                       validate_inputs=validate_inputs)
+
+    _state_dict_keys = ("_type", "_num_classes", "_num_correct", "_num_examples")
 
     def reset(self):
         self._num_correct = 0
@@ -121,9 +164,24 @@ class Accuracy(_BaseClassification):
         super(Accuracy, self).reset()
 
     def update(self, output):
+        self._check_shape(output)
+        self._check_type(output)
+        self._update(output)
+
+    def _update_shared(self, shared):
+        self._check_shared(shared)
+        if self._type == "binary":
+            num_correct = shared.get("binary_counts", _binary_counts)[0]
+        elif self._type == "multiclass":
+            num_correct = shared.get("class_counts", _class_counts)[0].diag().sum()
+        else:
+            self._update(shared.output)
+            return
+        self._num_correct += num_correct.item()
+        self._num_examples += shared.output[1].numel()
+
+    def _update(self, output):
         y_pred, y = output
-        self._check_shape((y_pred, y))
-        self._check_type((y_pred, y))
 
         if self._type == "binary":
             correct = torch.eq(y_pred.view(-1).to(y), y.view(-1))
@@ -141,6 +199,7 @@ class Accuracy(_BaseClassification):
         self._num_correct += torch.sum(correct).item()
         self._num_examples += correct.shape[0]
 
+    @sync_all_reduce("_num_correct", "_num_examples")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError('Accuracy must have at least one example before it can be computed.')
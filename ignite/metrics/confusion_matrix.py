@@ -3,6 +3,8 @@ import numbers
 import torch
 
 from ignite.metrics import Metric, MetricsLambda
+from ignite.metrics.metric import sync_all_reduce
+from ignite.metrics.metric_group import _bincount, _class_counts
 from ignite.exceptions import NotComputableError
 
 
@@ -26,15 +28,30 @@ class ConfusionMatrix(Metric):
             :class:`~ignite.engine.Engine`'s `process_function`'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
+        device (str or torch.device, optional): device on which the confusion matrix is accumulated. If None, the
+            confusion matrix is accumulated on the device of the data, such that the updates do not copy data
+            between devices nor synchronize the device with the host. In any case, :meth:`compute` returns a
+            confusion matrix on CPU (default: "cpu").
+        filter_targets (bool, optional): if True, target indices out of `[0, num_classes)` are neglected. If False,
+            the targets must be in `[0, num_classes)`, saving a pass over the data at each update, and out of range
+            targets are invalid inputs: they raise an error on CPU, while on CUDA devices they trigger a device-side
+            assert in `index_add_`, after which the CUDA context of the process is unusable (default: True).
 
     Note:
-        In case of the targets `y` in `(batch_size, ...)` format, target indices between 0 and `num_classes` only
-        contribute to the confusion matrix and others are neglected. For example, if `num_classes=20` and target index
-        equal 255 is encountered, then it is filtered out.
+        In case of the targets `y` in `(batch_size, ...)` format and `filter_targets=True`, target indices between 0
+        and `num_classes` only contribute to the confusion matrix and others are neglected. For example, if
+        `num_classes=20` and target index equal 255 is encountered, then it is filtered out.
+
+    Examples:
+
+    .. code-block:: python
+
+        # Segmentation on GPU, with targets in [0, num_classes)
+        cm = ConfusionMatrix(num_classes=21, device=None, filter_targets=False)
 
     """
 
-    def __init__(self, num_classes, average=None, output_transform=lambda x: x):
+    def __init__(self, num_classes, average=None, output_transform=lambda x: x, device="cpu", filter_targets=True):
         if average is not None and average not in ("samples", "recall", "precision"):
             raise ValueError("Argument average can None or one of ['samples', 'recall', 'precision']")
 
@@ -42,11 +59,15 @@ class ConfusionMatrix(Metric):
         self._num_examples = 0
         self.average = average
         self.confusion_matrix = None
+        self.device = device
+        self.filter_targets = filter_targets
         super(ConfusionMatrix, self).__init__(output_transform=output_transform)
 
+    _state_dict_keys = ("confusion_matrix", "_num_examples")
+
     def reset(self):
-        self.confusion_matrix = torch.zeros(self.num_classes, self.num_classes,
-                                            dtype=torch.int64, device='cpu')
+        self.confusion_matrix = torch.zeros(self.num_classes, self.num_classes, dtype=torch.int64,
+                                            device=self.device if self.device is not None else "cpu")
         self._num_examples = 0
 
     def _check_shape(self, output):
@@ -80,30 +101,55 @@ class ConfusionMatrix(Metric):
 
         self._num_examples += y_pred.shape[0]
 
-        # target is (batch_size, ...)
-        y_pred = torch.argmax(y_pred, dim=1).flatten()
-        y = y.flatten()
-
-        target_mask = (y >= 0) & (y < self.num_classes)
-        y = y[target_mask]
-        y_pred = y_pred[target_mask]
-
-        indices = self.num_classes * y + y_pred
-        m = torch.bincount(indices, minlength=self.num_classes ** 2).reshape(self.num_classes, self.num_classes)
-        self.confusion_matrix += m.to(self.confusion_matrix)
-
+        if self.filter_targets:
+            # Out of range targets are counted in an extra bin, which is dropped, instead of being removed with a
+            # boolean mask, which would allocate new tensors and synchronize the device with the host
+            m, _ = _class_counts(output)
+        else:
+            # target is (batch_size, ...)
+            y_pred = torch.argmax(y_pred, dim=1).flatten()
+            y = y.flatten().long()
+            num_bins = self.num_classes ** 2
+            m = _bincount(self.num_classes * y + y_pred, num_bins)
+            if m.shape[0] != num_bins:
+                raise ValueError("With filter_targets=False, y should contain class indices in [0, {}), but given "
+                                 "a maximal index of {}".format(self.num_classes, (m.shape[0] - 1) // self.num_classes))
+            m = m.reshape(self.num_classes, self.num_classes)
+        self._accumulate(m)
+
+    def _update_shared(self, shared):
+        self._check_shape(shared.output)
+        self._num_examples += shared.output[0].shape[0]
+        self._accumulate(shared.get("class_counts", _class_counts)[0])
+
+    def _accumulate(self, m):
+        if self.device is None and self.confusion_matrix.device != m.device:
+            self.confusion_matrix = self.confusion_matrix.to(m.device)
+        self.confusion_matrix += m.to(self.confusion_matrix.device)
+
+    @sync_all_reduce("confusion_matrix", "_num_examples")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError('Confusion matrix must have at least one example before it can be computed.')
+        confusion_matrix = self.confusion_matrix.cpu()
         if self.average:
-            self.confusion_matrix = self.confusion_matrix.float()
+            confusion_matrix = confusion_matrix.float()
             if self.average == "samples":
-                return self.confusion_matrix / self._num_examples
+                return confusion_matrix / self._num_examples
             elif self.average == "recall":
-                return self.confusion_matrix / (self.confusion_matrix.sum(dim=1) + 1e-15)
+                return confusion_matrix / (confusion_matrix.sum(dim=1) + 1e-15)
             elif self.average == "precision":
-                return self.confusion_matrix / (self.confusion_matrix.sum(dim=0) + 1e-15)
-        return self.confusion_matrix
+                return confusion_matrix / (confusion_matrix.sum(dim=0) + 1e-15)
+        return confusion_matrix
+
+
+def _cm_float64(cm):
+    # Confusion matrix in double precision, shared by all the metrics computed from `cm`, such that it is cast once
+    # when they are computed together
+    cm_float64 = cm.__dict__.get("_cm_float64")
+    if cm_float64 is None:
+        cm_float64 = cm._cm_float64 = cm.type(torch.float64)
+    return cm_float64
 
 
 def IoU(cm, ignore_index=None):
@@ -137,7 +183,7 @@ def IoU(cm, ignore_index=None):
             raise ValueError("ignore_index should be non-negative integer, but given {}".format(ignore_index))
 
     # Increase floating point precision
-    cm = cm.type(torch.float64)
+    cm = _cm_float64(cm)
     iou = cm.diag() / (cm.sum(dim=1) + cm.sum(dim=0) - cm.diag() + 1e-15)
     if ignore_index is not None:
 
@@ -191,7 +237,7 @@ def cmAccuracy(cm):
         MetricsLambda
     """
     # Increase floating point precision
-    cm = cm.type(torch.float64)
+    cm = _cm_float64(cm)
     return cm.diag().sum() / (cm.sum() + 1e-15)
 
 
@@ -206,7 +252,7 @@ def cmPrecision(cm, average=True):
     """
 
     # Increase floating point precision
-    cm = cm.type(torch.float64)
+    cm = _cm_float64(cm)
     precision = cm.diag() / (cm.sum(dim=0) + 1e-15)
     if average:
         return precision.mean()
@@ -224,7 +270,7 @@ def cmRecall(cm, average=True):
     """
 
     # Increase floating point precision
-    cm = cm.type(torch.float64)
+    cm = _cm_float64(cm)
     recall = cm.diag() / (cm.sum(dim=1) + 1e-15)
     if average:
         return recall.mean()
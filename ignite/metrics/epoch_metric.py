@@ -1,8 +1,19 @@
+import numbers
+import os
+import shutil
+import tempfile
 import warnings
 
+try:
+    import builtins
+except ImportError:  # Python 2.7 compatibility
+    import __builtin__ as builtins
+
+import numpy as np
 import torch
+import torch.distributed as dist
 
-from ignite.metrics.metric import Metric
+from ignite.metrics.metric import Metric, _check_validate_inputs, _get_collective_device, _get_world_size
 
 
 class EpochMetric(Metric):
@@ -13,7 +24,11 @@ class EpochMetric(Metric):
     .. warning::
 
         Current implementation stores all input data (output and target) in as tensors before computing a metric.
-        This can potentially lead to a memory error if the input data is larger than available RAM.
+        This can potentially lead to a memory error if the input data is larger than available RAM. In this case,
+        use `spill_threshold` to store the data on disk.
+
+    The batches are stored on CPU as a list of tensors, concatenated once when the metric is computed, such that the
+    cost of an update does not grow with the number of stored samples.
 
 
     - `update` must receive output of the form `(y_pred, y)`.
@@ -27,20 +42,122 @@ class EpochMetric(Metric):
             :class:`~ignite.engine.Engine`'s `process_function`'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
+        compute_on_rank_zero (bool, optional): in a distributed configuration, if True, the predictions and targets
+            are gathered on the process of rank 0 only, `compute_fn` is called by this process only and its result,
+            which should be a number, is broadcast to the other processes. An error raised by `compute_fn` is
+            raised in all the processes, with the same type for the built-in exceptions and as a `RuntimeError`
+            otherwise. If False, the predictions and targets are gathered on all the processes, which all call
+            `compute_fn` (default: False).
+        spill_threshold (int, optional): if given, once the stored predictions and targets exceed `spill_threshold`
+            bytes in memory, they are written to files in a temporary directory, and the following batches are
+            appended to these files. `compute_fn` then receives tensors sharing memory with `numpy.memmap` arrays of
+            the files, which are read from the disk when accessed, without copy. The files are removed when the
+            metric is reset (default: None, the data is kept in memory).
+        spill_dir (str, optional): directory in which the temporary directory of the files is created (default:
+            None, the default directory of :mod:`tempfile`).
+        validate_inputs (str, optional): policy of the checks of the inputs, i.e. that 2D targets are comprised of
+            0's and 1's and that `compute_fn` can be called on the batch: "always" checks the values of all the
+            batches and calls `compute_fn` on the first batch after each reset, "first_batch" checks the first batch
+            after each reset only and "never" does not check the inputs. The shapes are always checked (default:
+            "first_batch").
+
+    Note:
+        In a distributed configuration, e.g. with `torch.distributed` and the `gloo` backend, the predictions and
+        targets of all the processes are gathered in the order of the ranks before calling `compute_fn`, such that
+        each process can update the metric with its own shard of the data. Shards can have different sizes. As
+        gathering is a collective call, the metric should be computed by all the processes of the group.
 
     """
 
-    def __init__(self, compute_fn, output_transform=lambda x: x):
+    def __init__(self, compute_fn, output_transform=lambda x: x, compute_on_rank_zero=False, spill_threshold=None,
+                 spill_dir=None, validate_inputs="first_batch"):
 
         if not callable(compute_fn):
             raise TypeError("Argument compute_fn should be callable.")
 
+        _check_validate_inputs(validate_inputs)
+
+        if spill_threshold is not None and (not isinstance(spill_threshold, numbers.Integral) or spill_threshold < 0):
+            raise ValueError("Argument spill_threshold should be a non-negative integer, but given {}"
+                             .format(spill_threshold))
+
+        # Set before the reset of the base class
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self._spill_tmpdir = None
+        self.validate_inputs = validate_inputs
         super(EpochMetric, self).__init__(output_transform=output_transform)
         self.compute_fn = compute_fn
+        self.compute_on_rank_zero = compute_on_rank_zero
+
+    _predictions_dtype = torch.float32
+    _targets_dtype = torch.long
 
     def reset(self):
-        self._predictions = torch.tensor([], dtype=torch.float32)
-        self._targets = torch.tensor([], dtype=torch.long)
+        self._remove_spilled_files()
+        self._predictions_storage = _TensorStorage(self._predictions_dtype)
+        self._targets_storage = _TensorStorage(self._targets_dtype)
+
+    def _remove_spilled_files(self):
+        if self._spill_tmpdir is None:
+            return
+        self._predictions_storage.close()
+        self._targets_storage.close()
+        shutil.rmtree(self._spill_tmpdir, ignore_errors=True)
+        self._spill_tmpdir = None
+
+    def __del__(self):
+        if "_spill_tmpdir" in self.__dict__:
+            self._remove_spilled_files()
+
+    @property
+    def _predictions(self):
+        return self._predictions_storage.get()
+
+    @property
+    def _targets(self):
+        return self._targets_storage.get()
+
+    def _append(self, y_pred, y):
+        y_pred, y = self._store(y_pred, y)
+
+        # Check once the signature and execution of compute_fn
+        if self.validate_inputs != "never" and self._predictions_storage.num_rows == y_pred.shape[0]:
+            try:
+                self.compute_fn(y_pred, y)
+            except Exception as e:
+                warnings.warn("Probably, there can be a problem with `compute_fn`:\n {}.".format(e),
+                              RuntimeWarning)
+
+    def _store(self, y_pred, y):
+        # Copy to CPU, as the input tensors can be modified after the update
+        y_pred = y_pred.to(device="cpu", dtype=self._predictions_dtype, copy=True).contiguous()
+        y = y.to(device="cpu", dtype=self._targets_dtype, copy=True).contiguous()
+
+        self._predictions_storage.append(y_pred)
+        self._targets_storage.append(y)
+
+        if self.spill_threshold is not None and self._spill_tmpdir is None and \
+                self._predictions_storage.nbytes + self._targets_storage.nbytes > self.spill_threshold:
+            self._spill_tmpdir = tempfile.mkdtemp(prefix="ignite_epoch_metric_", dir=self.spill_dir)
+            self._predictions_storage.spill(os.path.join(self._spill_tmpdir, "predictions.bin"))
+            self._targets_storage.spill(os.path.join(self._spill_tmpdir, "targets.bin"))
+        return y_pred, y
+
+    # The state is the concatenation of the stored predictions and targets, which are appended by `merge`
+    _state_dict_keys = ("_predictions", "_targets")
+
+    def load_state_dict(self, state_dict):
+        self._check_state_dict(state_dict)
+        self.reset()
+        self._merge_state_dict(state_dict)
+
+    def _additive_state_dict_keys(self):
+        return None
+
+    def _merge_state_dict(self, state_dict):
+        if state_dict["_predictions"].shape[0] > 0:
+            self._store(state_dict["_predictions"], state_dict["_targets"])
 
     def update(self, output):
         y_pred, y = output
@@ -51,7 +168,9 @@ class EpochMetric(Metric):
         if y.ndimension() not in (1, 2):
             raise ValueError("Targets should be of shape (batch_size, n_classes) or (batch_size, ).")
 
-        if y.ndimension() == 2:
+        validate = self.validate_inputs == "always" or \
+            (self.validate_inputs == "first_batch" and self._predictions_storage.num_rows == 0)
+        if validate and y.ndimension() == 2:
             if not torch.equal(y ** 2, y):
                 raise ValueError("Targets should be binary (0 or 1).")
 
@@ -61,19 +180,164 @@ class EpochMetric(Metric):
         if y.ndimension() == 2 and y.shape[1] == 1:
             y = y.squeeze(dim=-1)
 
-        y_pred = y_pred.type_as(self._predictions)
-        y = y.type_as(self._targets)
+        self._append(y_pred, y)
 
-        self._predictions = torch.cat([self._predictions, y_pred], dim=0)
-        self._targets = torch.cat([self._targets, y], dim=0)
+    def compute(self):
+        if _get_world_size() < 2:
+            return self.compute_fn(self._predictions, self._targets)
 
-        # Check once the signature and execution of compute_fn
-        if self._predictions.shape == y_pred.shape:
+        dst = 0 if self.compute_on_rank_zero else None
+        predictions, targets = _gather_uneven([self._predictions, self._targets], dst=dst)
+        if dst is None:
+            return self.compute_fn(predictions, targets)
+
+        # The result is broadcast with the status of the computation, such that an error of `compute_fn` is raised
+        # in all the processes instead of leaving the other processes waiting for the result
+        device = _get_collective_device()
+        header = torch.zeros(3, dtype=torch.float64, device=device)  # error flag, result, size of the error message
+        error = None
+        if dist.get_rank() == dst:
             try:
-                self.compute_fn(self._predictions, self._targets)
+                result = self.compute_fn(predictions, targets)
+                if not isinstance(result, numbers.Number):
+                    raise TypeError("With compute_on_rank_zero, compute_fn should return a number, but given {}"
+                                    .format(type(result)))
+                header[1] = float(result)
             except Exception as e:
-                warnings.warn("Probably, there can be a problem with `compute_fn`:\n {}.".format(e),
-                              RuntimeWarning)
+                error = e
+                message = torch.tensor(bytearray(_encode_error(e)), dtype=torch.uint8, device=device)
+                header[0] = 1
+                header[2] = message.numel()
+        dist.broadcast(header, src=dst)
+        header = header.tolist()
+        if header[0] == 0:
+            return header[1]
 
-    def compute(self):
-        return self.compute_fn(self._predictions, self._targets)
+        if error is None:
+            message = torch.zeros(int(header[2]), dtype=torch.uint8, device=device)
+        dist.broadcast(message, src=dst)
+        if error is not None:
+            raise error
+        raise _decode_error(bytes(bytearray(message.cpu().tolist())), dst)
+
+
+class _TensorStorage(object):
+    """Concatenation along the first dimension of CPU tensors, stored in memory or in a file.
+
+    In memory, the tensors are stored as a list of chunks, concatenated once when the concatenation is accessed,
+    instead of being concatenated at each update, which would copy the whole history at each update. Once spilled,
+    the tensors are appended to a file and the concatenation is a tensor view of a `numpy.memmap` of the file.
+    """
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        self.chunks = []
+        self.nbytes = 0
+        self.num_rows = 0
+        self.trailing_shape = None
+        self.path = None
+        self._file = None
+
+    def append(self, tensor):
+        if self.trailing_shape is None:
+            self.trailing_shape = tuple(tensor.shape[1:])
+        elif tuple(tensor.shape[1:]) != self.trailing_shape:
+            raise ValueError("Shape of the batches should be (batch_size, {}), but given {}"
+                             .format(", ".join(str(d) for d in self.trailing_shape), tuple(tensor.shape)))
+
+        self.num_rows += tensor.shape[0]
+        if self._file is not None:
+            self._file.write(tensor.numpy().tobytes())
+        else:
+            self.chunks.append(tensor)
+            self.nbytes += tensor.numel() * tensor.element_size()
+
+    def spill(self, path):
+        self.path = path
+        self._file = open(path, "wb")
+        for chunk in self.chunks:
+            self._file.write(chunk.numpy().tobytes())
+        self.chunks = []
+        self.nbytes = 0
+
+    def get(self):
+        if self._file is None:
+            if len(self.chunks) == 0:
+                return torch.tensor([], dtype=self.dtype)
+            if len(self.chunks) > 1:
+                self.chunks = [torch.cat(self.chunks, dim=0)]
+            return self.chunks[0]
+
+        self._file.flush()
+        np_dtype = torch.tensor([], dtype=self.dtype).numpy().dtype
+        if self.num_rows == 0:
+            return torch.from_numpy(np.empty((0,) + self.trailing_shape, dtype=np_dtype))
+        # Copy-on-write mapping: `compute_fn` can modify the tensor without modifying the file
+        array = np.memmap(self.path, dtype=np_dtype, mode="c", shape=(self.num_rows,) + self.trailing_shape)
+        return torch.from_numpy(array)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _encode_error(error):
+    return "{}\n{}".format(type(error).__name__, error).encode("utf-8")
+
+
+def _decode_error(message, rank):
+    # Error raised by the process of rank `rank`, of the same type if it is a built-in exception
+    name, _, text = message.decode("utf-8").partition("\n")
+    error_type = getattr(builtins, name, None)
+    if isinstance(error_type, type) and issubclass(error_type, Exception):
+        return error_type(text)
+    return RuntimeError("{} raised in the process of rank {}: {}".format(name, rank, text))
+
+
+def _gather_uneven(tensors, dst=None):
+    """Concatenate, in the order of the ranks, the tensors of all the processes of the distributed group.
+
+    The tensors of a process have the same size along the first dimension, which can differ between the processes.
+    The tensors are padded to the maximal size, gathered and trimmed, such that no padding value is returned. If
+    `dst` is None, the tensors are gathered on all the processes, otherwise on the process of rank `dst` only and
+    None values are returned for the other processes.
+    """
+    device = _get_collective_device()
+    world_size = dist.get_world_size()
+
+    # Size and trailing dimension (-1 for 1D tensors) of the tensors of each process
+    meta = torch.tensor([tensors[0].size(0)] + [t.size(1) if t.ndimension() == 2 else -1 for t in tensors],
+                        dtype=torch.long, device=device)
+    metas = [torch.empty_like(meta) for _ in range(world_size)]
+    dist.all_gather(metas, meta)
+    metas = torch.stack(metas).cpu()
+    sizes = metas[:, 0].tolist()
+    if max(sizes) == 0:
+        return tensors
+
+    is_dst = dst is None or dist.get_rank() == dst
+    gathered_tensors = []
+    for i, t in enumerate(tensors):
+        trailing_dims = set(metas[metas[:, 0] > 0, i + 1].tolist())
+        if len(trailing_dims) > 1:
+            raise ValueError("Tensors of the processes should have the same number of dimensions and the same "
+                             "number of columns, but given trailing dimensions {}".format(sorted(trailing_dims)))
+        trailing_dim = trailing_dims.pop()
+        trailing_shape = (trailing_dim,) if trailing_dim >= 0 else ()
+
+        padded = torch.zeros((max(sizes),) + trailing_shape, dtype=t.dtype, device=device)
+        padded[:t.size(0)] = t.reshape((t.size(0),) + trailing_shape)
+        if dst is None:
+            gather_list = [torch.empty_like(padded) for _ in range(world_size)]
+            dist.all_gather(gather_list, padded)
+        else:
+            gather_list = [torch.empty_like(padded) for _ in range(world_size)] if is_dst else None
+            dist.gather(padded, gather_list=gather_list, dst=dst)
+
+        if is_dst:
+            gathered = torch.cat([g[:n] for g, n in zip(gather_list, sizes)], dim=0)
+            gathered_tensors.append(gathered.to(t.device))
+        else:
+            gathered_tensors.append(None)
+    return gathered_tensors
@@ -1,7 +1,7 @@
 from __future__ import division
 
 from ignite.exceptions import NotComputableError
-from ignite.metrics.metric import Metric
+from ignite.metrics.metric import Metric, sync_all_reduce
 
 
 class Loss(Metric):
@@ -31,6 +31,8 @@ class Loss(Metric):
         self._loss_fn = loss_fn
         self._batch_size = batch_size
 
+    _state_dict_keys = ("_sum", "_num_examples")
+
     def reset(self):
         self._sum = 0
         self._num_examples = 0
@@ -50,6 +52,7 @@ class Loss(Metric):
         self._sum += average_loss.item() * N
         self._num_examples += N
 
+    @sync_all_reduce("_sum", "_num_examples")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError(
@@ -3,7 +3,7 @@ from __future__ import division
 import torch
 
 from ignite.exceptions import NotComputableError
-from ignite.metrics.metric import Metric
+from ignite.metrics.metric import Metric, sync_all_reduce
 
 
 class MeanAbsoluteError(Metric):
@@ -12,6 +12,8 @@ class MeanAbsoluteError(Metric):
 
     - `update` must receive output of the form `(y_pred, y)`.
     """
+    _state_dict_keys = ("_sum_of_absolute_errors", "_num_examples")
+
     def reset(self):
         self._sum_of_absolute_errors = 0.0
         self._num_examples = 0
@@ -22,6 +24,7 @@ class MeanAbsoluteError(Metric):
         self._sum_of_absolute_errors += torch.sum(absolute_errors).item()
         self._num_examples += y.shape[0]
 
+    @sync_all_reduce("_sum_of_absolute_errors", "_num_examples")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError('MeanAbsoluteError must have at least one example before it can be computed.')
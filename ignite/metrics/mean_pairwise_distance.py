@@ -4,7 +4,7 @@ import torch
 from torch.nn.functional import pairwise_distance
 
 from ignite.exceptions import NotComputableError
-from ignite.metrics.metric import Metric
+from ignite.metrics.metric import Metric, sync_all_reduce
 
 
 class MeanPairwiseDistance(Metric):
@@ -18,6 +18,8 @@ class MeanPairwiseDistance(Metric):
         self._p = p
         self._eps = eps
 
+    _state_dict_keys = ("_sum_of_distances", "_num_examples")
+
     def reset(self):
         self._sum_of_distances = 0.0
         self._num_examples = 0
@@ -28,6 +30,7 @@ class MeanPairwiseDistance(Metric):
         self._sum_of_distances += torch.sum(distances).item()
         self._num_examples += y.shape[0]
 
+    @sync_all_reduce("_sum_of_distances", "_num_examples")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError('MeanAbsoluteError must have at least one example before it can be computed.')
@@ -1,7 +1,18 @@
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
+from functools import partial, wraps
+import numbers
+import sys
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # Python 2.7 compatibility
+    from collections import MutableMapping
+
 from ignite._six import with_metaclass
 from ignite.engine import Events
 import torch
+import torch.distributed as dist
 
 
 class Metric(with_metaclass(ABCMeta, object)):
@@ -56,22 +67,165 @@ class Metric(with_metaclass(ABCMeta, object)):
         """
         pass
 
+    # Names of the attributes holding the accumulated state of the metric, saved by `state_dict` and summed by `merge`
+    _state_dict_keys = ()
+
+    def state_dict(self):
+        """Returns a dictionary containing the accumulated state of the metric, e.g. sums and numbers of examples,
+        to resume an epoch with :meth:`load_state_dict` or to merge the state in another metric with :meth:`merge`.
+
+        Tensors are copied, such that the dictionary is not modified by the next updates of the metric.
+
+        Example usage:
+
+        .. code-block:: python
+
+            @evaluator.on(Events.ITERATION_COMPLETED(every=1000))
+            def save_checkpoint(engine):
+                torch.save({"evaluator": engine.state_dict(), "accuracy": accuracy.state_dict()}, "checkpoint.pth")
+
+        Returns:
+            dict: a dictionary of numbers, tensors or strings.
+        """
+        return {key: _copy_value(getattr(self, key)) for key in self._state_dict_keys}
+
+    def load_state_dict(self, state_dict):
+        """Setups the state of the metric from `state_dict`, such that the next updates are accumulated to the saved
+        state. As the state is reset at the start of each epoch, it should be loaded once the epoch is started.
+
+        Args:
+            state_dict (dict): a dictionary returned by :meth:`state_dict`.
+        """
+        self._check_state_dict(state_dict)
+        for key in self._state_dict_keys:
+            setattr(self, key, _copy_value(state_dict[key]))
+
+    def merge(self, other):
+        """Merges the state of another metric of the same type, e.g. updated with another shard of the data by
+        another process, in the state of this metric, such that :meth:`compute` returns the result of the metric
+        updated with the data of both metrics.
+
+        Args:
+            other (Metric or dict): a metric of the same type or a dictionary returned by its :meth:`state_dict`.
+
+        Raises:
+            TypeError: raised when `other` is not of the type of this metric or when the metric can not be merged,
+                e.g. :class:`~ignite.metrics.RunningAverage`, whose value depends on the order of the updates.
+
+        Example usage:
+
+        .. code-block:: python
+
+            # Metric updated with the shards of the data by the workers, which return their states
+            accuracy = Accuracy()
+            for state_dict in pool.map(evaluate_shard, shards):
+                accuracy.merge(state_dict)
+            accuracy.compute()
+
+        """
+        if isinstance(other, Metric):
+            if type(other) is not type(self):
+                raise TypeError("Argument other should be a {}, but given {}".format(type(self), type(other)))
+            other = other.state_dict()
+        self._check_state_dict(other)
+        self._merge_state_dict(other)
+
+    def _check_state_dict(self, state_dict):
+        if not isinstance(state_dict, dict):
+            raise TypeError("Argument state_dict should be a dictionary, but given {}".format(type(state_dict)))
+        missing_keys = [k for k in self._state_dict_keys if k not in state_dict]
+        if missing_keys:
+            raise ValueError("Required keys {} are absent in provided state_dict".format(missing_keys))
+
+    def _additive_state_dict_keys(self):
+        # Keys of the state that are sums over the batches, or None if the state is not a sum, e.g. a maximum
+        return self._state_dict_keys
+
+    def _merge_state_dict(self, state_dict):
+        # Overloaded by the metrics with a state that is not additive
+        self._sum_state_dict(state_dict, self._additive_state_dict_keys())
+
+    def _sum_state_dict(self, state_dict, keys):
+        for key in keys:
+            setattr(self, key, _sum_values(getattr(self, key), state_dict[key]))
+
+    @contextmanager
+    def _all_reduced(self, *attrs, **kwargs):
+        """Context in which the attributes `attrs` are summed over all the processes of the distributed group, or
+        reduced with the keyword argument `op`, see :meth:`~ignite.metrics.metric.sync_all_reduce`.
+
+        The local values are restored on exit, such that the metric can be updated and computed again. Nested
+        contexts do not reduce the attributes again.
+        """
+        op = kwargs.pop("op", "sum")
+        if self.__dict__.get("_is_all_reduced", False) or _get_world_size() < 2:
+            yield
+            return
+
+        local_values = [getattr(self, attr) for attr in attrs]
+        for attr, value in zip(attrs, _all_reduce_values(local_values, op)):
+            setattr(self, attr, value)
+        self._is_all_reduced = True
+        try:
+            yield
+        finally:
+            self._is_all_reduced = False
+            for attr, value in zip(attrs, local_values):
+                setattr(self, attr, value)
+
+    def _compute_memoized(self, memo):
+        """Result of `compute`, computed at the first call with the dictionary `memo` of computed results."""
+        key = id(self)
+        if key not in memo:
+            # The metric is kept in the memo, so that its id is not reused
+            memo[key] = (self, self.compute())
+        return memo[key][1]
+
     def started(self, engine):
+        _clear_memo(engine)
         self.reset()
 
     @torch.no_grad()
     def iteration_completed(self, engine):
+        _clear_memo(engine)
         output = self._output_transform(engine.state.output)
         self.update(output)
 
-    def completed(self, engine, name):
-        result = self.compute()
+    def _engine_result(self, engine):
+        result = self._compute_memoized(_get_memo(engine))
         if torch.is_tensor(result) and len(result.shape) == 0:
             result = result.item()
-        engine.state.metrics[name] = result
+        return result
 
-    def attach(self, engine, name):
-        engine.add_event_handler(Events.EPOCH_COMPLETED, self.completed, name)
+    def completed(self, engine, name):
+        engine.state.metrics[name] = self._engine_result(engine)
+
+    def lazily_completed(self, engine, name):
+        """Store in `engine.state.metrics` the metric under `name`, to be computed at its first access. In
+        distributed configurations, the metric is computed at once, as its computation may be a collective operation
+        in which all the processes should take part, e.g. with :meth:`~ignite.metrics.metric.sync_all_reduce`."""
+        if _get_world_size() > 1:
+            self.completed(engine, name)
+            return
+        _get_lazy_metrics(engine).set_lazy(name, partial(self._engine_result, engine))
+
+    def attach(self, engine, name, lazy=False):
+        """Attach the metric to the engine, the metric being reset at `EPOCH_STARTED`, updated at
+        `ITERATION_COMPLETED` and computed at `EPOCH_COMPLETED` into `engine.state.metrics[name]`.
+
+        Args:
+            engine (Engine): the engine to which the metric is attached.
+            name (str): the name of the metric.
+            lazy (bool, optional): if True, the metric is computed at the first access to
+                `engine.state.metrics[name]` after `EPOCH_COMPLETED` instead of at `EPOCH_COMPLETED`, so that an
+                expensive metric costs nothing in the epochs where it is not read (default: False). The value is
+                cached until the metrics of the engine are reset or updated, e.g. at the next epoch, when a value
+                which was not read is discarded and removed from `engine.state.metrics`. In distributed
+                configurations, the metric is computed at `EPOCH_COMPLETED` whatever `lazy`, since a metric
+                reduced over the processes, e.g. with :meth:`~ignite.metrics.metric.sync_all_reduce`, would wait
+                forever for the processes which do not read it.
+        """
+        engine.add_event_handler(Events.EPOCH_COMPLETED, self.lazily_completed if lazy else self.completed, name)
         if not engine.has_event_handler(self.started, Events.EPOCH_STARTED):
             engine.add_event_handler(Events.EPOCH_STARTED, self.started)
         if not engine.has_event_handler(self.iteration_completed, Events.ITERATION_COMPLETED):
@@ -136,6 +290,10 @@ class Metric(with_metaclass(ABCMeta, object)):
     def __getattr__(self, attr):
         from ignite.metrics import MetricsLambda
 
+        # Special methods looked up by the interpreter or the standard library, e.g. `__deepcopy__`
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, attr))
+
         def fn(x, *args, **kwargs):
             return getattr(x, attr)(*args, **kwargs)
 
@@ -146,3 +304,268 @@ class Metric(with_metaclass(ABCMeta, object)):
     def __getitem__(self, index):
         from ignite.metrics import MetricsLambda
         return MetricsLambda(lambda x: x[index], self)
+
+
+_VALIDATE_INPUTS_POLICIES = ("always", "first_batch", "never")
+
+
+def _check_validate_inputs(validate_inputs):
+    if validate_inputs not in _VALIDATE_INPUTS_POLICIES:
+        raise ValueError("Argument validate_inputs should be one of {}, but given {}"
+                         .format(_VALIDATE_INPUTS_POLICIES, validate_inputs))
+
+
+def _copy_value(value):
+    return value.clone() if isinstance(value, torch.Tensor) else value
+
+
+def _sum_values(value, other):
+    # Sum of two numbers or tensors, on the device of `value` if it is a tensor
+    if isinstance(value, torch.Tensor):
+        return value + torch.as_tensor(other, device=value.device)
+    if isinstance(other, torch.Tensor):
+        return other + value
+    return value + other
+
+
+def _get_memo(engine):
+    # Results of the metrics computed at the current iteration of the engine, shared by all the metrics computed from
+    # them, e.g. by the instances of `MetricsLambda` attached to the engine
+    stamp = (engine.state.epoch, engine.state.iteration)
+    memo = engine.state.__dict__.get("_metrics_memo")
+    if memo is None or memo[0] != stamp:
+        memo = engine.state._metrics_memo = (stamp, {})
+    return memo[1]
+
+
+def _clear_memo(engine):
+    # Called when a metric is reset or updated by the engine, after which the lazy metrics can not be computed
+    if engine.state is not None:
+        engine.state.__dict__.pop("_metrics_memo", None)
+        metrics = getattr(engine.state, "metrics", None)
+        if isinstance(metrics, _LazyMetrics):
+            metrics.discard_lazy()
+
+
+def _get_lazy_metrics(engine):
+    metrics = engine.state.metrics
+    if not isinstance(metrics, _LazyMetrics):
+        metrics = engine.state.metrics = _LazyMetrics(metrics)
+    return metrics
+
+
+class _LazyMetrics(MutableMapping):
+    """Map of metric names to results, replacing `engine.state.metrics` once a metric attached with `lazy=True` is
+    completed. The result of such a metric is computed at its first access and then stored as the other results."""
+
+    def __init__(self, metrics):
+        self._results = dict(metrics)
+        # Functions computing the results of the lazy metrics which were not accessed yet, and whether the results
+        # are discarded when the metrics are reset or updated
+        self._lazy = {}
+
+    def set_lazy(self, name, compute_fn, discard=True):
+        """Set the result under `name` to be computed by `compute_fn` at its first access. If `discard` is False,
+        `compute_fn` does not depend on the state of the metric, e.g. reads a computed tensor, and the result is kept
+        until it is replaced."""
+        self._results.pop(name, None)
+        self._lazy[name] = (compute_fn, discard)
+
+    def is_lazy(self, name):
+        """Whether the result under `name` is not computed yet."""
+        return name in self._lazy
+
+    def discard_lazy(self):
+        for name in [name for name, (_, discard) in self._lazy.items() if discard]:
+            del self._lazy[name]
+
+    def __getitem__(self, name):
+        if name in self._lazy:
+            self._results[name] = self._lazy.pop(name)[0]()
+        return self._results[name]
+
+    def __setitem__(self, name, value):
+        self._lazy.pop(name, None)
+        self._results[name] = value
+
+    def __delitem__(self, name):
+        if name in self._lazy:
+            del self._lazy[name]
+        else:
+            del self._results[name]
+
+    def __contains__(self, name):
+        return name in self._results or name in self._lazy
+
+    def __iter__(self):
+        return iter(list(self._results) + list(self._lazy))
+
+    def __len__(self):
+        return len(self._results) + len(self._lazy)
+
+    def __repr__(self):
+        items = ["{!r}: {!r}".format(k, v) for k, v in self._results.items()]
+        items += ["{!r}: <not computed>".format(k) for k in self._lazy]
+        return "{" + ", ".join(items) + "}"
+
+
+def _get_world_size():
+    if dist.is_available() and dist.is_initialized():
+        return dist.get_world_size()
+    return 1
+
+
+def _get_collective_device():
+    # NCCL collectives only support CUDA tensors
+    if dist.get_backend() == "nccl":
+        return torch.device("cuda", torch.cuda.current_device())
+    return torch.device("cpu")
+
+
+# Number of dimensions of the shapes compared by `_agreed_shapes`, the next dimensions being compared by the
+# numbers of elements only
+_MAX_COMPARED_DIMS = 4
+
+
+def _is_scalar(value):
+    return not isinstance(value, torch.Tensor) or value.dim() == 0
+
+
+def _agreed_shapes(values, device):
+    # Shapes of `values` after their reduction: the shapes of the tensors of at least one dimension, checked to be
+    # the same in all the processes, to which the numbers and 0-dimensional tensors of the other processes are
+    # broadcast, as when they are added to them in a single process; () for the values which are scalars in all the
+    # processes and 0-dimensional tensors in at least one of them, and None for the numbers in all the processes. The
+    # bounds of the shapes are reduced with a single `all_reduce` call.
+    header_size = 2 + _MAX_COMPARED_DIMS
+    bounds = []
+    for v in values:
+        if _is_scalar(v):
+            bounds.extend([-1] * header_size + [-sys.maxsize] * header_size + [1])
+        else:
+            dims = list(v.shape[:_MAX_COMPARED_DIMS]) + [1] * (_MAX_COMPARED_DIMS - v.dim())
+            header = [v.numel(), v.dim()] + dims
+            bounds.extend(header + [-x for x in header] + [0])
+        bounds.append(int(isinstance(v, torch.Tensor)))
+    bounds = torch.tensor(bounds, dtype=torch.int64, device=device)
+    dist.all_reduce(bounds, op=dist.ReduceOp.MAX)
+    bounds = bounds.view(len(values), 2 * header_size + 2).tolist()
+
+    shapes = []
+    for index, (v, value_bounds) in enumerate(zip(values, bounds)):
+        max_header, min_header = value_bounds[:header_size], [-x for x in value_bounds[header_size:-2]]
+        # Whether the value is a scalar in at least one process, and a tensor in at least one process
+        has_scalar, has_tensor = value_bounds[-2] > 0, value_bounds[-1] > 0
+        if max_header[0] < 0:
+            shapes.append(() if has_tensor else None)
+            continue
+        num_dims = max_header[1]
+        if max_header != min_header or (has_scalar and num_dims > _MAX_COMPARED_DIMS):
+            raise ValueError("Value {} to all-reduce should be a number or a tensor with the same shape in all the "
+                             "processes, but given tensors of {} to {} elements, of {} to {} dimensions and of "
+                             "shapes from {} to {} in the processes"
+                             .format(index, min_header[0], max_header[0], min_header[1], num_dims,
+                                     tuple(min_header[2:2 + num_dims]), tuple(max_header[2:2 + num_dims])))
+        shapes.append(tuple(max_header[2:2 + num_dims]) if _is_scalar(v) else v.shape)
+    return shapes
+
+
+# Reductions of `sync_all_reduce`
+_REDUCE_OPS = ("sum", "max", "min")
+
+
+def _check_reduce_op(op):
+    if op not in _REDUCE_OPS:
+        raise ValueError("Argument op should be one of {}, but given {}".format(_REDUCE_OPS, op))
+
+
+def _all_reduce_values(values, op="sum"):
+    """Sum numbers and tensors over all the processes of the distributed group, or take their element-wise maximum
+    or minimum with `op` "max" or "min".
+
+    The values are packed in a single double precision tensor, on the current CUDA device for the NCCL backend and
+    on CPU otherwise, reduced with a single `all_reduce` call. As this call requires buffers of the same size in all
+    the processes, the shapes of the values are first checked to be the same in all the processes with a small
+    `all_reduce` call, and a ValueError is raised in all the processes otherwise. A number or a 0-dimensional tensor,
+    e.g. the initial value of an accumulator of a process which did not see any batch, is broadcast to the shape of
+    the tensors of the other processes, and a number is returned as a tensor if the value is a tensor in another
+    process.
+
+    Returns the reduced values with the types, devices and dtypes of `values`, and as double precision tensors on
+    CPU for the numbers returned as tensors.
+    """
+    _check_reduce_op(op)
+    device = _get_collective_device()
+    shapes = _agreed_shapes(values, device)
+    flat = torch.cat([torch.as_tensor(v, dtype=torch.float64).expand(shape if shape is not None else ())
+                      .reshape(-1).to(device) for v, shape in zip(values, shapes)])
+    dist.all_reduce(flat, op=getattr(dist.ReduceOp, op.upper()))
+    flat = flat.cpu()
+
+    reduced_values = []
+    offset = 0
+    for v, shape in zip(values, shapes):
+        if shape is not None:
+            numel = int(torch.Size(shape).numel())
+            reduced = flat[offset:offset + numel].view(shape)
+            if isinstance(v, torch.Tensor):
+                reduced = reduced.to(dtype=v.dtype, device=v.device)
+            offset += numel
+        else:
+            reduced = flat[offset].item()
+            # The integers of a process, e.g. an accumulator without data, may be summed with floats of the others
+            if isinstance(v, numbers.Integral) and reduced.is_integer():
+                reduced = int(reduced)
+            offset += 1
+        reduced_values.append(reduced)
+    return reduced_values
+
+
+def sync_all_reduce(*attrs, **kwargs):
+    """Decorator of the `compute` method of a metric, such that the metric is computed from its attributes `attrs`
+    summed over all the processes of the distributed group, e.g. of `torch.distributed` with the `gloo` backend.
+
+    All the attributes are reduced with a single `all_reduce` call, and the local attributes are left unchanged.
+    Out of a distributed group, or in a group of a single process, the metric is computed from the local attributes.
+    As `all_reduce` is a collective call, the metric should be computed by all the processes of the group.
+
+    Args:
+        *attrs (str): names of the attributes, numbers or tensors of the same shape in all the processes, to sum.
+            A number or a 0-dimensional tensor, e.g. the initial value of an accumulator in a process without
+            data, can also be summed with the tensors of any shape of the other processes.
+        op (str, optional): keyword argument, reduction of the attributes: "sum", "max" or "min", the latter two
+            taking the element-wise maximum or minimum of the attributes, e.g. for an accumulated maximum
+            (default: "sum").
+
+    Examples:
+
+    .. code-block:: python
+
+        class MeanAbsoluteError(Metric):
+
+            @sync_all_reduce("_sum_of_absolute_errors", "_num_examples")
+            def compute(self):
+                return self._sum_of_absolute_errors / self._num_examples
+
+        class MaximumAbsoluteError(Metric):
+
+            @sync_all_reduce("_max_of_absolute_errors", op="max")
+            def compute(self):
+                return self._max_of_absolute_errors
+
+    """
+    op = kwargs.pop("op", "sum")
+    if kwargs:
+        raise TypeError("Unexpected keyword arguments {}".format(sorted(kwargs)))
+    _check_reduce_op(op)
+
+    def decorator(compute):
+
+        @wraps(compute)
+        def wrapper(self, *args, **kwargs):
+            with self._all_reduced(*attrs, op=op):
+                return compute(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
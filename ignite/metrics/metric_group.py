@@ -0,0 +1,152 @@
+import torch
+
+from ignite.engine import Events
+from ignite.metrics.metric import Metric, _clear_memo
+
+
+def _bincount(indices, num_bins):
+    # On CUDA, `torch.bincount` reads the maximal index on the host, while `index_add_` does not synchronize the
+    # device with the host
+    if indices.is_cuda:
+        counts = torch.zeros(num_bins, dtype=torch.int64, device=indices.device)
+        return counts.index_add_(0, indices, torch.ones_like(indices))
+    return torch.bincount(indices, minlength=num_bins)
+
+
+def _class_counts(output):
+    # Counts of a multiclass batch `(y_pred, y)`, with `y_pred` of shape (batch_size, num_classes, ...): matrix of
+    # shape (num_classes, num_classes) of the numbers of samples per target (rows) and predicted class (columns),
+    # and number of samples with a target out of `[0, num_classes)`, as tensors on the device of the data
+    y_pred, y = output
+    num_classes = y_pred.size(1)
+    num_bins = num_classes ** 2
+    y_pred = torch.argmax(y_pred, dim=1).flatten()
+    y = y.flatten().long()
+
+    indices = num_classes * y + y_pred
+    target_mask = (y >= 0) & (y < num_classes)
+    indices = torch.where(target_mask, indices, torch.full_like(indices, num_bins))
+    counts = _bincount(indices, num_bins + 1)
+    return counts[:num_bins].reshape(num_classes, num_classes), counts[num_bins]
+
+
+def _binary_counts(output):
+    # Counts of a binary batch `(y_pred, y)` of 0's and 1's: numbers of correct predictions, of true positives, of
+    # predicted positives and of actual positives, as tensors on the device of the data
+    y_pred, y = output
+    y_pred = y_pred.view(-1)
+    y = y.view(-1)
+    num_correct = torch.eq(y_pred.to(y), y).sum()
+    y = y.type_as(y_pred)
+    return num_correct, (y * y_pred).sum(), y_pred.sum(), y.sum()
+
+
+class _SharedOutput(object):
+    """Output of a batch and the intermediate results computed from it, shared by the metrics of a group."""
+
+    def __init__(self, output):
+        self.output = output
+        self._results = {}
+
+    def get(self, key, fn):
+        """Result of `fn(output)`, computed at the first call with the given `key`."""
+        if key not in self._results:
+            self._results[key] = fn(self.output)
+        return self._results[key]
+
+
+class MetricGroup(object):
+    """Group of metrics updated with the same output, computing the intermediate results common to several metrics
+    once per batch.
+
+    The metrics of the group are updated by a single handler of the engine. :class:`~ignite.metrics.Accuracy`,
+    :class:`~ignite.metrics.Precision`, :class:`~ignite.metrics.Recall` and :class:`~ignite.metrics.ConfusionMatrix`
+    share the checks of the shapes and of the type of the data and, in binary and multiclass cases, the `argmax` of
+    the predictions and the per-class counts of the batch, from which they update their states without one-hot
+    encoding. The other metrics are updated with their `update` method. The results are the ones of the metrics
+    used on their own.
+
+    Args:
+        metrics (dict of str - :class:`~ignite.metrics.Metric`): a map of metric names to metrics. The metrics
+            should not be attached to the engine. Instances of :class:`~ignite.metrics.MetricsLambda` computed
+            from metrics of the group can also be part of the group.
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the form expected by all the metrics
+            of the group. The `output_transform` of each metric is not used.
+
+    Examples:
+
+    .. code-block:: python
+
+        precision = Precision(average=False)
+        recall = Recall(average=False)
+        metrics = MetricGroup({
+            "accuracy": Accuracy(),
+            "precision": precision,
+            "recall": recall,
+            "f1": (precision * recall * 2 / (precision + recall + 1e-20)).mean(),
+            "cm": ConfusionMatrix(num_classes=10),
+        })
+        metrics.attach(evaluator)
+        # evaluator.state.metrics["accuracy"], evaluator.state.metrics["f1"], ...
+
+    """
+
+    def __init__(self, metrics, output_transform=lambda x: x):
+        if not isinstance(metrics, dict):
+            raise TypeError("Argument metrics should be a dictionary, but given {}".format(type(metrics)))
+        for name, metric in metrics.items():
+            if not isinstance(metric, Metric):
+                raise TypeError("Value of metric '{}' should be a Metric, but given {}".format(name, type(metric)))
+        self.metrics = metrics
+        self._output_transform = output_transform
+        self.reset()
+
+    def reset(self):
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def update(self, output):
+        shared = _SharedOutput(output)
+        for metric in self.metrics.values():
+            # Looked up on the class, as `Metric.__getattr__` creates attributes
+            if getattr(type(metric), "_update_shared", None) is not None:
+                metric._update_shared(shared)
+            else:
+                metric.update(output)
+
+    def compute(self):
+        """Compute the metrics of the group.
+
+        Returns:
+            dict: map of metric names to results.
+        """
+        memo = {}
+        return {name: metric._compute_memoized(memo) for name, metric in self.metrics.items()}
+
+    def started(self, engine):
+        _clear_memo(engine)
+        self.reset()
+
+    @torch.no_grad()
+    def iteration_completed(self, engine):
+        _clear_memo(engine)
+        output = self._output_transform(engine.state.output)
+        self.update(output)
+
+    def completed(self, engine):
+        for name, metric in self.metrics.items():
+            metric.completed(engine, name)
+
+    def attach(self, engine):
+        """Attach the group to the engine, the result of each metric being stored in `engine.state.metrics` under
+        its name.
+
+        Args:
+            engine (Engine): the engine to which the metrics are attached.
+        """
+        engine.add_event_handler(Events.EPOCH_COMPLETED, self.completed)
+        if not engine.has_event_handler(self.started, Events.EPOCH_STARTED):
+            engine.add_event_handler(Events.EPOCH_STARTED, self.started)
+        if not engine.has_event_handler(self.iteration_completed, Events.ITERATION_COMPLETED):
+            engine.add_event_handler(Events.ITERATION_COMPLETED, self.iteration_completed)
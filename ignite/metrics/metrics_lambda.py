@@ -14,6 +14,14 @@ class MetricsLambda(Metric):
     resetted. When attach, all its dependencies would be automatically
     attached.
 
+    Each metric of the graph of dependencies is computed once per call of `compute`, even if several metrics
+    depend on it. Once attached, the results are shared by all the metrics computed at the same iteration of the
+    engine, e.g. at `EPOCH_COMPLETED`, until a metric is reset or updated by the engine. Therefore, `f` should not
+    modify its arguments in-place.
+
+    The state of this metric, saved by :meth:`state_dict` and merged by :meth:`merge`, is the state of the metrics
+    it depends on. Therefore, the metrics it depends on should not be merged separately.
+
     Args:
         f (callable): the function that defines the computation
         args (sequence): Sequence of other metrics or something
@@ -52,10 +60,61 @@ class MetricsLambda(Metric):
         pass
 
     def compute(self):
-        materialized = [i.compute() if isinstance(i, Metric) else i for i in self.args]
-        materialized_kwargs = {k: (v.compute() if isinstance(v, Metric) else v) for k, v in self.kwargs.items()}
+        return self._compute({})
+
+    def _compute(self, memo):
+        materialized = [i._compute_memoized(memo) if isinstance(i, Metric) else i for i in self.args]
+        materialized_kwargs = {k: (v._compute_memoized(memo) if isinstance(v, Metric) else v)
+                               for k, v in self.kwargs.items()}
         return self.function(*materialized, **materialized_kwargs)
 
+    def _compute_memoized(self, memo):
+        key = id(self)
+        if key not in memo:
+            memo[key] = (self, self._compute(memo))
+        return memo[key][1]
+
+    def _dependencies(self):
+        # Metrics of the graph of dependencies other than instances of MetricsLambda, without duplicates, in a
+        # deterministic order
+        dependencies = []
+        for metric in itertools.chain(self.args, [self.kwargs[k] for k in sorted(self.kwargs)]):
+            if isinstance(metric, MetricsLambda):
+                candidates = metric._dependencies()
+            elif isinstance(metric, Metric):
+                candidates = [metric]
+            else:
+                continue
+            for m in candidates:
+                if not any(m is d for d in dependencies):
+                    dependencies.append(m)
+        return dependencies
+
+    # The state is the list of the states of the dependencies
+    _state_dict_keys = ("metrics",)
+
+    def state_dict(self):
+        """Returns a dictionary containing the states of the metrics it depends on.
+
+        Returns:
+            dict: a dictionary with key `metrics`, the list of the states of the metrics, in the order of the
+            arguments.
+        """
+        return {"metrics": [m.state_dict() for m in self._dependencies()]}
+
+    def load_state_dict(self, state_dict):
+        self._check_state_dict(state_dict)
+        for metric, metric_state_dict in zip(self._dependencies(), state_dict["metrics"]):
+            metric.load_state_dict(metric_state_dict)
+
+    def _additive_state_dict_keys(self):
+        return None
+
+    def _merge_state_dict(self, state_dict):
+        # As the dependencies are merged, they should not be merged separately
+        for metric, metric_state_dict in zip(self._dependencies(), state_dict["metrics"]):
+            metric.merge(metric_state_dict)
+
     def _internal_attach(self, engine):
         for index, metric in enumerate(itertools.chain(self.args, self.kwargs.values())):
             if isinstance(metric, MetricsLambda):
@@ -66,8 +125,8 @@ class MetricsLambda(Metric):
                 if not engine.has_event_handler(metric.iteration_completed, Events.ITERATION_COMPLETED):
                     engine.add_event_handler(Events.ITERATION_COMPLETED, metric.iteration_completed)
 
-    def attach(self, engine, name):
+    def attach(self, engine, name, lazy=False):
         # recursively attach all its dependencies
         self._internal_attach(engine)
         # attach only handler on EPOCH_COMPLETED
-        engine.add_event_handler(Events.EPOCH_COMPLETED, self.completed, name)
+        engine.add_event_handler(Events.EPOCH_COMPLETED, self.lazily_completed if lazy else self.completed, name)
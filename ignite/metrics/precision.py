@@ -1,27 +1,67 @@
 from __future__ import division
 
+from abc import abstractmethod
+import warnings
+
 import torch
 
 from ignite.metrics.accuracy import _BaseClassification
 from ignite.exceptions import NotComputableError
+from ignite.metrics.metric_group import _binary_counts, _class_counts
 from ignite.utils import to_onehot
 
 
 class _BasePrecisionRecall(_BaseClassification):
 
-    def __init__(self, output_transform=lambda x: x, average=False, is_multilabel=False):
+    def __init__(self, output_transform=lambda x: x, average=False, is_multilabel=False,
+                 validate_inputs="first_batch"):
+        if is_multilabel and not average:
+            warnings.warn("In multilabel cases with average=False, {} now returns a tensor with the value of each "
+                          "class (of length C), instead of the value of each sample (of length N)"
+                          .format(self.__class__.__name__), DeprecationWarning)
         self._average = average
         self._true_positives = None
         self._positives = None
         self.eps = 1e-20
-        super(_BasePrecisionRecall, self).__init__(output_transform=output_transform, is_multilabel=is_multilabel)
+        super(_BasePrecisionRecall, self).__init__(output_transform=output_transform, is_multilabel=is_multilabel,
+                                                   validate_inputs=validate_inputs)
+
+    _state_dict_keys = ("_type", "_num_classes", "_true_positives", "_positives")
 
     def reset(self):
-        self._true_positives = torch.DoubleTensor(0) if (self._is_multilabel and not self._average) else 0
-        self._positives = torch.DoubleTensor(0) if (self._is_multilabel and not self._average) else 0
+        self._true_positives = 0
+        self._positives = 0
         super(_BasePrecisionRecall, self).reset()
 
+    def _update_shared(self, shared):
+        validate = self._check_shared(shared)
+        if self._type == "binary":
+            _, true_positives, predicted_positives, actual_positives = shared.get("binary_counts", _binary_counts)
+        elif self._type == "multiclass":
+            counts, num_invalid_targets = shared.get("class_counts", _class_counts)
+            if validate and num_invalid_targets.item() > 0:
+                y_pred, y = shared.output
+                raise ValueError("y_pred contains less classes than y. Number of predicted classes is {}"
+                                 " and element in y has invalid class = {}.".format(y_pred.size(1), y.max().item() + 1))
+            true_positives = counts.diag()
+            predicted_positives = counts.sum(dim=0)
+            actual_positives = counts.sum(dim=1)
+        else:
+            self._update(shared.output, validate)
+            return
+        # Double precision on CPU, as with `update`
+        self._true_positives += true_positives.type(torch.DoubleTensor)
+        self._positives += self._select_positives(predicted_positives, actual_positives).type(torch.DoubleTensor)
+
+    @abstractmethod
+    def _select_positives(self, predicted_positives, actual_positives):
+        pass
+
     def compute(self):
+        with self._all_reduced("_true_positives", "_positives"):
+            return self._compute()
+
+    def _compute(self):
         if not (isinstance(self._positives, torch.Tensor) or self._positives > 0):
             raise NotComputableError("{} must have at least one example before"
                                      " it can be computed.".format(self.__class__.__name__))
@@ -54,8 +94,10 @@ class Precision(_BasePrecisionRecall):
 
         precision = Precision(output_transform=thresholded_output_transform)
 
-    In multilabel cases, average parameter should be True. However, if user would like to compute F1 metric, for
-    example, average parameter should be False. This can be done as shown below:
+    In multilabel cases, if average is True, precision is averaged across samples. If average is False, the precision of
+    each class is computed from the numbers of true positives and of predicted positives of the class summed over the
+    samples, such that the memory used by the metric does not depend on the number of samples. The F1 metric of each
+    class, and their mean, can then be computed as shown below:
 
     .. code-block:: python
 
@@ -66,9 +108,9 @@ class Precision(_BasePrecisionRecall):
 
     .. warning::
 
-        In multilabel cases, if average is False, current implementation stores all input data (output and target) in
-        as tensors before computing a metric. This can potentially lead to a memory error if the input data is larger
-        than available RAM.
+        In multilabel cases with average=False, previous versions returned the precision of each sample, a tensor of
+        length N, while the precision of each class, a tensor of length C, is now returned. A `DeprecationWarning` is
+        raised when the metric is created with these parameters.
 
     Args:
         output_transform (callable, optional): a callable that is used to transform the
@@ -77,25 +119,39 @@ class Precision(_BasePrecisionRecall):
             you want to compute the metric with respect to one of the outputs.
         average (bool, optional): if True, precision is computed as the unweighted average (across all classes
             in multiclass case), otherwise, returns a tensor with the precision (for each class in multiclass case).
-        is_multilabel (bool, optional) flag to use in multilabel case. By default, value is False. If True, average
-            parameter should be True and the average is computed across samples, instead of classes.
+        is_multilabel (bool, optional) flag to use in multilabel case. By default, value is False. If True and
+            average is True, the average is computed across samples, instead of classes.
+        validate_inputs (str, optional): policy of the checks of the values of `y` and `y_pred`, e.g. that they
+            are comprised of 0's and 1's in binary and multilabel cases or that `y` contains valid classes in
+            multiclass case, which allocate and compare tensors of the size of the batch: "always" checks all the
+            batches, "first_batch" the first batch after each reset and "never" none. The shapes are always checked.
+            By default, "first_batch".
     """
 
-    def __init__(self, output_transform=lambda x: x, average=False, is_multilabel=False):
+    def __init__(self, output_transform=lambda x: x, average=False, is_multilabel=False,
+                 validate_inputs="first_batch"):
         super(Precision, self).__init__(output_transform=output_transform,
-                                        average=average, is_multilabel=is_multilabel)
+                                        average=average, is_multilabel=is_multilabel,
+                                        validate_inputs=validate_inputs)
+
+    def _select_positives(self, predicted_positives, actual_positives):
+        return predicted_positives
 
     def update(self, output):
-        y_pred, y = output
+        validate = self._should_validate()
         self._check_shape(output)
-        self._check_type((y_pred, y))
+        self._check_type(output)
+        self._update(output, validate)
+
+    def _update(self, output, validate=True):
+        y_pred, y = output
 
         if self._type == "binary":
             y_pred = y_pred.view(-1)
             y = y.view(-1)
         elif self._type == "multiclass":
             num_classes = y_pred.size(1)
-            if y.max() + 1 > num_classes:
+            if validate and y.max() + 1 > num_classes:
                 raise ValueError("y_pred contains less classes than y. Number of predicted classes is {}"
                                  " and element in y has invalid class = {}.".format(num_classes, y.max().item() + 1))
             y = to_onehot(y.view(-1), num_classes=num_classes)
@@ -109,6 +165,13 @@ class Precision(_BasePrecisionRecall):
 
         y = y.type_as(y_pred)
         correct = y * y_pred
+
+        if self._type == "multilabel" and not self._average:
+            # Counts of each class, summed over the samples
+            self._true_positives += correct.sum(dim=1).type(torch.DoubleTensor)
+            self._positives += y_pred.sum(dim=1).type(torch.DoubleTensor)
+            return
+
         all_positives = y_pred.sum(dim=0).type(torch.DoubleTensor)  # Convert from int cuda/cpu to double cpu
 
         if correct.sum() == 0:
@@ -120,12 +183,8 @@ class Precision(_BasePrecisionRecall):
         true_positives = true_positives.type(torch.DoubleTensor)
 
         if self._type == "multilabel":
-            if not self._average:
-                self._true_positives = torch.cat([self._true_positives, true_positives], dim=0)
-                self._positives = torch.cat([self._positives, all_positives], dim=0)
-            else:
-                self._true_positives += torch.sum(true_positives / (all_positives + self.eps))
-                self._positives += len(all_positives)
+            self._true_positives += torch.sum(true_positives / (all_positives + self.eps))
+            self._positives += len(all_positives)
         else:
             self._true_positives += true_positives
             self._positives += all_positives
@@ -1,4 +1,7 @@
+import torch
+
 from ignite.metrics import Metric
+from ignite.metrics.metric import _get_lazy_metrics, _get_memo
 from ignite.engine import Events
 
 
@@ -14,6 +17,17 @@ class RunningAverage(Metric):
         epoch_bound (boolean, optional): whether the running average should be reset after each epoch (defaults
             to True).
 
+    Note:
+        If `src` is a metric, it is reset and computed at each iteration, and the running average is the average of
+        its values on the batches. To compute a metric from the running sums of its state, e.g. the accuracy of
+        the last batches, use :class:`~ignite.metrics.WindowedMetric`.
+
+    Note:
+        If `src` is None and the transformed output is a tensor, the running average is computed on the device of
+        the tensor, detached, without synchronizing the device with the host. As for the other metrics, a
+        0-dimensional average is read from `engine.state.metrics` as a Python number, but it is read from the device
+        at its first access only, e.g. every 100 iterations by a logger, instead of at each iteration.
+
     Examples:
 
     .. code-block:: python
@@ -30,6 +44,10 @@ class RunningAverage(Metric):
             print("running avg accuracy:", engine.state.metrics['running_avg_accuracy'])
             print("running avg loss:", engine.state.metrics['running_avg_loss'])
 
+        # Loss kept on the device by the trainer
+        trainer = create_supervised_trainer(model, optimizer, loss_fn, materialize_every=None)
+        RunningAverage(output_transform=lambda x: x).attach(trainer, 'running_avg_loss')
+
     """
 
     def __init__(self, src=None, alpha=0.98, output_transform=None, epoch_bound=True):
@@ -55,6 +73,8 @@ class RunningAverage(Metric):
         self.epoch_bound = epoch_bound
         super(RunningAverage, self).__init__(output_transform=output_transform)
 
+    _state_dict_keys = ("_value",)
+
     def reset(self):
         self._value = None
 
@@ -69,6 +89,12 @@ class RunningAverage(Metric):
             self._value = self._value * self.alpha + (1.0 - self.alpha) * self._get_src_value()
         return self._value
 
+    def _additive_state_dict_keys(self):
+        return None
+
+    def _merge_state_dict(self, state_dict):
+        raise TypeError("RunningAverage can not be merged, as its value depends on the order of the updates")
+
     def attach(self, engine, name):
         if self.epoch_bound:
             # restart average every epoch
@@ -78,6 +104,14 @@ class RunningAverage(Metric):
         # apply running average
         engine.add_event_handler(Events.ITERATION_COMPLETED, self.completed, name)
 
+    def completed(self, engine, name):
+        result = self._compute_memoized(_get_memo(engine))
+        if torch.is_tensor(result) and result.dim() == 0:
+            # The average is computed at each iteration, but read from the device at its first access only
+            _get_lazy_metrics(engine).set_lazy(name, result.item, discard=False)
+        else:
+            engine.state.metrics[name] = result
+
     def _get_metric_value(self):
         return self.src.compute()
 
@@ -89,4 +123,6 @@ class RunningAverage(Metric):
         self.src.iteration_completed(engine)
 
     def _output_update(self, output):
+        if isinstance(output, torch.Tensor):
+            output = output.detach()
         self.src = output
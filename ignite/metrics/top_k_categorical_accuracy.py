@@ -2,7 +2,7 @@ from __future__ import division
 
 import torch
 
-from ignite.metrics.metric import Metric
+from ignite.metrics.metric import Metric, sync_all_reduce
 from ignite.exceptions import NotComputableError
 
 
@@ -16,6 +16,8 @@ class TopKCategoricalAccuracy(Metric):
         super(TopKCategoricalAccuracy, self).__init__(output_transform)
         self._k = k
 
+    _state_dict_keys = ("_num_correct", "_num_examples")
+
     def reset(self):
         self._num_correct = 0
         self._num_examples = 0
@@ -28,6 +30,7 @@ class TopKCategoricalAccuracy(Metric):
         self._num_correct += torch.sum(correct).item()
         self._num_examples += correct.shape[0]
 
+    @sync_all_reduce("_num_correct", "_num_examples")
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError("TopKCategoricalAccuracy must have at"
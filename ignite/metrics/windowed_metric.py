@@ -0,0 +1,140 @@
+import copy
+import numbers
+from collections import deque
+
+from ignite.engine import Events
+from ignite.metrics.metric import Metric, _copy_value, _sum_values
+
+
+class WindowedMetric(Metric):
+    """Metric computed over the last batches, or over all the batches weighted by an exponential decay.
+
+    The metric `src` is reset and updated with each batch, and the sums over the batches of its state, e.g. the
+    numbers of correct predictions and of examples of :class:`~ignite.metrics.Accuracy`, are summed over the last
+    `window_size` batches or averaged with the decay `alpha`. The value is computed from these sums when it is read,
+    e.g. at `event_name` once attached, such that an update costs an update of `src` and a few sums of its state,
+    whatever the size of the window.
+
+    Args:
+        src (Metric): the metric, whose state is a sum over the batches, e.g. :class:`~ignite.metrics.Accuracy`,
+            :class:`~ignite.metrics.Loss` or :class:`~ignite.metrics.ConfusionMatrix`. Its `output_transform` is
+            used.
+        window_size (int, optional): number of the last batches over which the metric is computed. The states of
+            `src` of these batches are kept in memory, to be subtracted from the sums once out of the window, e.g.
+            `window_size` matrices of shape (num_classes, num_classes) for :class:`~ignite.metrics.ConfusionMatrix`.
+        alpha (float, optional): decay factor, such that the sums of the state over the batches are weighted by
+            `alpha ** k` for the `k`-th batch before the last one. Exactly one of `window_size` and `alpha` should
+            be given.
+        epoch_bound (bool, optional): whether the metric should be reset after each epoch (default: True).
+
+    Note:
+        With `alpha`, the ratios of the state are exponential moving averages weighted by the batches, e.g. the
+        accuracy is the ratio of the moving averages of the numbers of correct predictions and of examples, instead
+        of the moving average of the accuracies of the batches computed by :class:`~ignite.metrics.RunningAverage`.
+
+    Examples:
+
+    .. code-block:: python
+
+        # Accuracy of the last 100 batches, computed every 100 iterations
+        WindowedMetric(Accuracy(output_transform=lambda x: [x[1], x[2]]), window_size=100).attach(
+            trainer, "accuracy", event_name=Events.ITERATION_COMPLETED(every=100))
+
+        # Exponentially weighted loss, computed at each iteration
+        WindowedMetric(Loss(loss_fn, output_transform=lambda x: [x[1], x[2]]), alpha=0.98).attach(trainer, "loss")
+
+    """
+
+    def __init__(self, src, window_size=None, alpha=None, epoch_bound=True):
+        if not isinstance(src, Metric):
+            raise TypeError("Argument src should be a Metric, but given {}".format(type(src)))
+        if src._additive_state_dict_keys() is None:
+            raise ValueError("Argument src should be a metric whose state is a sum over the batches, but given {}"
+                             .format(type(src).__name__))
+        if (window_size is None) == (alpha is None):
+            raise ValueError("Exactly one of the arguments window_size and alpha should be given")
+        if window_size is not None and (not isinstance(window_size, numbers.Integral) or window_size < 1):
+            raise ValueError("Argument window_size should be a positive integer, but given {}".format(window_size))
+        if alpha is not None and not (0.0 < alpha <= 1.0):
+            raise ValueError("Argument alpha should be a float between 0.0 and 1.0, but given {}".format(alpha))
+
+        self.src = src
+        self.window_size = window_size
+        self.alpha = alpha
+        self.epoch_bound = epoch_bound
+        self._keys = src._additive_state_dict_keys()
+        # Metric computed from the sums of the state over the window, such that the state of `src` is kept
+        self._windowed_src = copy.deepcopy(src)
+        super(WindowedMetric, self).__init__(output_transform=src._output_transform)
+
+    _state_dict_keys = ("_sums", "_batch_sums", "src")
+
+    def state_dict(self):
+        return {
+            "_sums": _copy_sums(self._sums),
+            "_batch_sums": [_copy_sums(batch_sums) for batch_sums in self._batch_sums],
+            "src": self.src.state_dict(),
+        }
+
+    def load_state_dict(self, state_dict):
+        self._check_state_dict(state_dict)
+        self.src.load_state_dict(state_dict["src"])
+        self._sums = _copy_sums(state_dict["_sums"])
+        self._batch_sums = deque(_copy_sums(batch_sums) for batch_sums in state_dict["_batch_sums"])
+
+    def _additive_state_dict_keys(self):
+        return None
+
+    def _merge_state_dict(self, state_dict):
+        raise TypeError("WindowedMetric can not be merged, as its value depends on the order of the updates")
+
+    def reset(self):
+        self.src.reset()
+        # Sums of the state of `src` of the last `window_size` batches, one per batch
+        self._batch_sums = deque()
+        # Sums of the state over the window, or exponential moving sums, None before the first update
+        self._sums = None
+
+    def update(self, output):
+        # `src` holds the sums of the current batch only
+        self.src.reset()
+        self.src.update(output)
+        batch_sums = {k: _copy_value(getattr(self.src, k)) for k in self._keys}
+        if self._sums is None:
+            self._sums = dict(batch_sums)
+        elif self.window_size is not None:
+            self._sums = {k: _sum_values(self._sums[k], batch_sums[k]) for k in self._keys}
+        else:
+            self._sums = {k: _sum_values(self._sums[k] * self.alpha, batch_sums[k]) for k in self._keys}
+
+        if self.window_size is not None:
+            self._batch_sums.append(batch_sums)
+            if len(self._batch_sums) > self.window_size:
+                oldest_sums = self._batch_sums.popleft()
+                self._sums = {k: _sum_values(self._sums[k], -oldest_sums[k]) for k in self._keys}
+
+    def compute(self):
+        state_dict = {k: getattr(self.src, k) for k in self.src._state_dict_keys}
+        if self._sums is not None:
+            state_dict.update(self._sums)
+        self._windowed_src.load_state_dict(state_dict)
+        return self._windowed_src.compute()
+
+    def attach(self, engine, name, event_name=Events.ITERATION_COMPLETED):
+        """Attach the metric to the engine, the value being computed and stored in `engine.state.metrics` at
+        `event_name`.
+
+        Args:
+            engine (Engine): the engine to which the metric is attached.
+            name (str): the name of the metric.
+            event_name (Events, optional): event at which the value is computed, e.g.
+                `Events.ITERATION_COMPLETED(every=100)` (default: `Events.ITERATION_COMPLETED`).
+        """
+        if self.epoch_bound:
+            engine.add_event_handler(Events.EPOCH_STARTED, self.started)
+        engine.add_event_handler(Events.ITERATION_COMPLETED, self.iteration_completed)
+        engine.add_event_handler(event_name, self.completed, name)
+
+
+def _copy_sums(sums):
+    return None if sums is None else {k: _copy_value(v) for k, v in sums.items()}
@@ -0,0 +1,105 @@
+import gc
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from ignite.contrib.engines import create_parallel_supervised_evaluator
+from ignite.engine import Events, _prepare_batch, create_supervised_evaluator
+from ignite.metrics import Accuracy, ConfusionMatrix, EpochMetric, Loss, Precision, Recall, mIoU
+from tests.ignite.metrics.test_metric import _assert_metrics_close
+
+
+def _create_metrics():
+    precision = Precision(average=False)
+    recall = Recall(average=False)
+    cm = ConfusionMatrix(num_classes=3)
+    return {
+        "accuracy": Accuracy(),
+        "loss": Loss(torch.nn.functional.cross_entropy),
+        "precision": precision,
+        "f1": (precision * recall * 2 / (precision + recall + 1e-20)).mean(),
+        "mIoU": mIoU(cm),
+        "sum": EpochMetric(lambda y_pred, y: y_pred.sum().item()),
+    }
+
+
+def _create_model_and_dataset():
+    torch.manual_seed(0)
+    model = torch.nn.Linear(4, 3)
+    dataset = TensorDataset(torch.rand(103, 4), torch.randint(0, 3, size=(103,)))
+    return model, dataset
+
+
+def test_create_parallel_supervised_evaluator():
+    model, dataset = _create_model_and_dataset()
+    evaluator = create_supervised_evaluator(model, metrics=_create_metrics())
+    expected_metrics = evaluator.run(DataLoader(dataset, batch_size=8)).metrics
+
+    parallel_evaluator = create_parallel_supervised_evaluator(model, metrics=_create_metrics(), num_workers=3,
+                                                              batch_size=8)
+    events = []
+    for event in [Events.STARTED, Events.EPOCH_STARTED, Events.EPOCH_COMPLETED, Events.COMPLETED]:
+        parallel_evaluator.add_event_handler(event, lambda engine, event: events.append(event), event)
+
+    try:
+        state = parallel_evaluator.run(dataset)
+        _assert_metrics_close(state.metrics, expected_metrics)
+        assert state.output == len(dataset)
+        assert events == [Events.STARTED, Events.EPOCH_STARTED, Events.EPOCH_COMPLETED, Events.COMPLETED]
+
+        # Parameters updated in-place by the parent process are used by the workers
+        with torch.no_grad():
+            model.weight.mul_(-1.0)
+        expected_metrics = evaluator.run(DataLoader(dataset, batch_size=8)).metrics
+        state = parallel_evaluator.run(dataset)
+        _assert_metrics_close(state.metrics, expected_metrics)
+    finally:
+        parallel_evaluator.close()
+
+
+def test_more_workers_than_samples():
+    model, dataset = _create_model_and_dataset()
+    dataset = TensorDataset(*dataset[:2])
+    with create_parallel_supervised_evaluator(model, metrics={"accuracy": Accuracy()}, num_workers=4,
+                                              batch_size=8) as evaluator:
+        assert evaluator.run(dataset).output == 2
+    assert evaluator._pool is None
+
+
+def _failing_prepare_batch(batch, device=None, non_blocking=False):
+    raise RuntimeError("Failing prepare_batch")
+
+
+def test_workers_terminated():
+    model, dataset = _create_model_and_dataset()
+
+    # Terminated when a run raises an exception, and restarted by the next run
+    evaluator = create_parallel_supervised_evaluator(model, metrics={"accuracy": Accuracy()}, num_workers=2,
+                                                     batch_size=8, prepare_batch=_failing_prepare_batch)
+    with pytest.raises(RuntimeError, match=r"Failing prepare_batch"):
+        evaluator.run(dataset)
+    assert evaluator._pool is None
+    evaluator._prepare_batch = _prepare_batch
+    with evaluator:
+        assert evaluator.run(dataset).output == len(dataset)
+
+    # Terminated when the engine is garbage collected
+    evaluator = create_parallel_supervised_evaluator(model, metrics={"accuracy": Accuracy()}, num_workers=2,
+                                                     batch_size=8)
+    evaluator.run(dataset)
+    workers = list(evaluator._pool._pool)
+    del evaluator
+    gc.collect()
+    for worker in workers:
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+
+
+def test_wrong_inputs():
+    model, _ = _create_model_and_dataset()
+    with pytest.raises(ValueError, match=r"Argument num_workers should be a positive integer"):
+        create_parallel_supervised_evaluator(model, metrics={}, num_workers=0, batch_size=8)
+
+    with pytest.raises(ValueError, match=r"Argument batch_size should be a positive integer"):
+        create_parallel_supervised_evaluator(model, metrics={}, num_workers=2, batch_size=None)
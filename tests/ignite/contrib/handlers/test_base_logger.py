@@ -123,6 +123,25 @@ def test_attach():
     _test(Events.COMPLETED, 1)
 
 
+def test_attach_on_filtered_event():
+
+    n_epochs = 5
+    data = list(range(50))
+
+    trainer = Engine(lambda engine, batch: None)
+    logger = DummyLogger()
+    mock_log_handler = MagicMock()
+
+    logger.attach(trainer, log_handler=mock_log_handler, event_name=Events.ITERATION_COMPLETED(every=20))
+    trainer.run(data, max_epochs=n_epochs)
+
+    mock_log_handler.assert_called_with(trainer, logger, Events.ITERATION_COMPLETED)
+    assert mock_log_handler.call_count == len(data) * n_epochs // 20
+
+    with pytest.raises(RuntimeError, match="Unknown event name"):
+        logger.attach(trainer, log_handler=mock_log_handler, event_name="unknown")
+
+
 def test_attach_on_custom_event():
 
     n_epochs = 10
@@ -155,3 +155,17 @@ def test_lr_policy(model, optimizer, dummy_engine, dataloader):
         dummy_engine.run(dataloader)
     lr = lr_finder.get_results()["lr"]
     assert all([lr[i - 1] < lr[i] for i in range(1, len(lr))])
+
+
+def test_with_epoch_length(lr_finder, dummy_engine, dataloader):
+
+    def data():
+        while True:
+            for batch in dataloader:
+                yield batch
+
+    with lr_finder.attach(dummy_engine):
+        dummy_engine.run(data(), max_epochs=1, epoch_length=30)
+
+    assert dummy_engine.state.max_epochs == 4
+    assert 0 < len(lr_finder.get_results()["lr"]) <= lr_finder.num_iter
@@ -339,3 +339,81 @@ def test_pbar_with_nan_input():
     assert engine.should_terminate
     assert engine.state.iteration == 1001
     assert engine.state.epoch == 1
+
+
+def test_pbar_with_epoch_length(capsys):
+
+    def data():
+        while True:
+            yield 1
+
+    engine = Engine(update_fn)
+
+    pbar = ProgressBar()
+    pbar.attach(engine, ['a'])
+
+    engine.run(data(), max_epochs=2, epoch_length=4)
+
+    captured = capsys.readouterr()
+    err = captured.err.split('\r')
+    err = list(map(lambda x: x.strip(), err))
+    err = list(filter(None, err))
+    expected = u'Epoch [2/2]: [3/4]  75%|███████▌  , a=1.00e+00 [00:00<00:00]'
+    assert err[-1] == expected
+
+
+def test_pbar_with_unknown_epoch_length(capsys):
+
+    engine = Engine(update_fn)
+
+    pbar = ProgressBar()
+    pbar.attach(engine, ['a'])
+
+    engine.run(iter([1, 2, 3]), max_epochs=1)
+
+    captured = capsys.readouterr()
+    err = captured.err.split('\r')
+    err = list(map(lambda x: x.strip(), err))
+    err = list(filter(None, err))
+    assert err[-1].startswith(u'Epoch: [2/?]')
+
+
+def test_pbar_output_tensor_rendered_at_refresh(capsys):
+    loader = list(range(10))
+    engine = Engine(lambda engine, batch: torch.tensor(float(batch)))
+
+    pbar = ProgressBar(desc="Output tensor", mininterval=60)
+    pbar.attach(engine, output_transform=lambda x: x)
+
+    rendered_outputs = []
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def record_postfix(engine):
+        rendered_outputs.append(pbar.pbar.postfix)
+
+    engine.run(loader, max_epochs=1)
+
+    # Rendered at the first and the last iterations only
+    assert rendered_outputs[1:-1] == [rendered_outputs[0]] * (len(loader) - 2)
+    assert rendered_outputs[0] != rendered_outputs[-1]
+    assert "output=9.00e+00" in rendered_outputs[-1]
+
+
+def test_pbar_running_average_of_output_tensor_read_at_refresh(capsys):
+    loader = list(range(10))
+    engine = Engine(lambda engine, batch: torch.tensor(float(batch)))
+    RunningAverage(output_transform=lambda x: x, alpha=0.5).attach(engine, "avg")
+
+    pbar = ProgressBar(desc="Output tensor", mininterval=60)
+    pbar.attach(engine, metric_names=["avg"])
+
+    read_averages = []
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def record_read_average(engine):
+        read_averages.append(not engine.state.metrics.is_lazy("avg"))
+
+    engine.run(loader, max_epochs=1)
+
+    # Read from the device at the first and the last iterations only
+    assert read_averages == [True] + [False] * (len(loader) - 2) + [True]
@@ -2,6 +2,10 @@ import torch
 import numpy as np
 import pytest
 from ignite.contrib.metrics.regression._base import _BaseRegression, _BaseRegressionEpoch
+from ignite.contrib.metrics.regression import CanberraMetric, FractionalAbsoluteError, FractionalBias, \
+    GeometricMeanAbsoluteError, ManhattanDistance, MaximumAbsoluteError, MeanAbsoluteRelativeError, MeanError, \
+    MeanNormalizedBias, MedianAbsoluteError, MedianAbsolutePercentageError, MedianRelativeAbsoluteError, R2Score, \
+    StreamingMedianAbsoluteError, StreamingMedianAbsolutePercentageError, WaveHedgesDistance
 
 
 def test_base_regression_shapes():
@@ -101,3 +105,85 @@ def test_base_regression_compute_fn():
     # Wrong compute function
     with pytest.raises(TypeError):
         _BaseRegressionEpoch(12345)
+
+
+# GeometricMeanRelativeAbsoluteError depends on the order of the updates and is merged approximately
+_ORDER_INDEPENDENT_METRICS = [
+    CanberraMetric, FractionalAbsoluteError, FractionalBias, GeometricMeanAbsoluteError, ManhattanDistance,
+    MaximumAbsoluteError, MeanAbsoluteRelativeError, MeanError, MeanNormalizedBias, MedianAbsoluteError,
+    MedianAbsolutePercentageError, MedianRelativeAbsoluteError, R2Score, StreamingMedianAbsoluteError,
+    StreamingMedianAbsolutePercentageError, WaveHedgesDistance
+]
+
+
+@pytest.mark.parametrize("metric_cls", _ORDER_INDEPENDENT_METRICS)
+def test_merge(metric_cls):
+    torch.manual_seed(0)
+    y_pred = torch.rand(40, 1) + 1.0
+    y = torch.rand(40, 1) + 1.0
+
+    m = metric_cls()
+    m.update((y_pred[:15], y[:15]))
+    m.update((y_pred[15:], y[15:]))
+    expected = m.compute()
+
+    m1 = metric_cls()
+    m1.update((y_pred[:15], y[:15]))
+    m2 = metric_cls()
+    m2.update((y_pred[15:], y[15:]))
+    merged = metric_cls()
+    merged.merge(m1)
+    merged.merge(m2.state_dict())
+    assert merged.compute() == pytest.approx(expected)
+
+    resumed = metric_cls()
+    resumed.load_state_dict(m1.state_dict())
+    resumed.update((y_pred[15:], y[15:]))
+    assert resumed.compute() == pytest.approx(expected)
+
+
+def _create_dist_data(rank=None):
+    torch.manual_seed(0)
+    y_pred = torch.rand(40, 1) + 1.0
+    y = torch.rand(40, 1) + 1.0
+    if rank is not None:
+        # Uneven shards, and an empty shard
+        start, end = [(0, 15), (15, 15), (15, 40)][rank]
+        y_pred, y = y_pred[start:end], y[start:end]
+    return y_pred, y
+
+
+def _run_dist_metrics(rank, world_size, init_method, results):
+    import torch.distributed as dist
+
+    dist.init_process_group("gloo", init_method=init_method, rank=rank, world_size=world_size)
+    y_pred, y = _create_dist_data(rank)
+    for metric_cls in _ORDER_INDEPENDENT_METRICS:
+        m = metric_cls()
+        if len(y) > 0:
+            m.update((y_pred, y))
+        results[(rank, metric_cls.__name__)] = m.compute()
+    dist.destroy_process_group()
+
+
+def test_distributed(tmpdir):
+    import torch.distributed as dist
+    import torch.multiprocessing as mp
+
+    if not dist.is_available():
+        pytest.skip("Skip if torch.distributed is not available")
+
+    world_size = 3
+    init_method = "file://{}".format(tmpdir.join("dist_init"))
+    results = mp.Manager().dict()
+    mp.spawn(_run_dist_metrics, args=(world_size, init_method, results), nprocs=world_size)
+
+    # The metrics of all the processes are computed from the data of all the processes
+    for metric_cls in _ORDER_INDEPENDENT_METRICS:
+        m = metric_cls()
+        m.update(_create_dist_data())
+        expected = m.compute()
+        for rank in range(world_size):
+            # Sums of float32 values in a different order, amplified by the cancellation in R2Score
+            assert results[(rank, metric_cls.__name__)] == pytest.approx(expected, rel=1e-4, abs=1e-6), \
+                (metric_cls, rank)
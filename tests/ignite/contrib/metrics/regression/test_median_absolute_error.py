@@ -2,7 +2,9 @@ import torch
 import numpy as np
 import pytest
 from ignite.engine import Engine
-from ignite.contrib.metrics.regression import MedianAbsoluteError
+from ignite.contrib.metrics.regression import MedianAbsoluteError, StreamingMedianAbsoluteError
+from ignite.contrib.metrics.regression._sketch import _TDigest
+from ignite.exceptions import NotComputableError
 
 
 def test_wrong_input_shapes():
@@ -96,3 +98,111 @@ def test_integration_median_absolute_error_with_output_transform():
     median_absolute_error = engine.run(data, max_epochs=1).metrics['median_absolute_error']
 
     assert np_median_absolute_error == pytest.approx(median_absolute_error)
+
+
+def test_streaming_median_absolute_error_wrong_inputs():
+
+    with pytest.raises(ValueError):
+        StreamingMedianAbsoluteError(compression=1)
+
+    m = StreamingMedianAbsoluteError()
+    m.reset()
+
+    with pytest.raises(NotComputableError):
+        m.compute()
+
+    with pytest.raises(ValueError):
+        m.update((torch.rand(4, 1, 2), torch.rand(4, 1)))
+
+
+def test_streaming_median_absolute_error():
+
+    np.random.seed(1)
+    m = StreamingMedianAbsoluteError(compression=200)
+
+    # Exact up to compression / 2 samples, the median of an even number of values is the mean of the middle ones
+    for size in (51, 100):
+        np_y_pred = np.random.rand(size, 1)
+        np_y = np.random.rand(size, 1)
+        m.reset()
+        for i in range(0, size, 16):
+            m.update((torch.from_numpy(np_y_pred[i:i + 16]), torch.from_numpy(np_y[i:i + 16])))
+        assert m.compute() == pytest.approx(np.median(np.abs(np_y - np_y_pred)))
+
+    size = 100000
+    np_y_pred = np.random.rand(size)
+    np_y = np.random.rand(size)
+    np_errors = np.abs(np_y - np_y_pred)
+    m.reset()
+    for i in range(0, size, 64):
+        m.update((torch.from_numpy(np_y_pred[i:i + 64]), torch.from_numpy(np_y[i:i + 64])))
+    median_absolute_error = m.compute()
+    assert len(m._digest.means) <= 100
+    assert abs((np_errors < median_absolute_error).mean() - 0.5) < 1. / 200
+
+
+def test_tdigest_merge():
+
+    torch.manual_seed(12)
+    values = torch.rand(20000)
+
+    digest = _TDigest(100)
+    for i in range(0, len(values), 100):
+        digest.add(values[i:i + 100])
+
+    digests = [_TDigest(100) for _ in range(3)]
+    for i, d in enumerate(digests):
+        d.add(values[i::3])
+    merged = _TDigest(100)
+    for d in digests:
+        merged.merge(d)
+    merged.merge(_TDigest(100))
+
+    assert merged.count() == digest.count() == len(values)
+    assert merged.min == values.min() and merged.max == values.max()
+    for q in (0.1, 0.5, 0.9):
+        assert abs(merged.quantile(q) - digest.quantile(q)) < 0.02
+        assert abs((values < merged.quantile(q)).double().mean().item() - q) < 0.02
+
+
+def _run_dist_streaming_median(rank, world_size, init_method, results):
+    import torch.distributed as dist
+
+    dist.init_process_group("gloo", init_method=init_method, rank=rank, world_size=world_size)
+    torch.manual_seed(12)
+    y_pred, y = torch.rand(5000), torch.rand(5000)
+    # Uneven and empty shards
+    for sizes in ([7, 16], [0, 23], [2000, 3000]):
+        start = sum(sizes[:rank])
+        m = StreamingMedianAbsoluteError(compression=100)
+        m.reset()
+        for i in range(start, start + sizes[rank], 10):
+            end = min(i + 10, start + sizes[rank])
+            m.update((y_pred[i:end], y[i:end]))
+        results[(rank, tuple(sizes))] = m.compute()
+    dist.destroy_process_group()
+
+
+def test_distributed_streaming_median_absolute_error(tmpdir):
+    import torch.distributed as dist
+    import torch.multiprocessing as mp
+
+    if not dist.is_available():
+        pytest.skip("Skip if torch.distributed is not available")
+
+    world_size = 2
+    init_method = "file://{}".format(tmpdir.join("dist_init"))
+    results = mp.Manager().dict()
+    mp.spawn(_run_dist_streaming_median, args=(world_size, init_method, results), nprocs=world_size)
+
+    torch.manual_seed(12)
+    y_pred, y = torch.rand(5000), torch.rand(5000)
+    errors = torch.abs(y - y_pred).numpy()
+    for sizes in ([7, 16], [0, 23], [2000, 3000]):
+        assert results[(0, tuple(sizes))] == results[(1, tuple(sizes))]
+        result = results[(0, tuple(sizes))]
+        n = sum(sizes)
+        if n <= 50:
+            assert result == pytest.approx(np.median(errors[:n]))
+        else:
+            assert abs((errors[:n] < result).mean() - 0.5) < 1. / 100
@@ -2,7 +2,8 @@ import torch
 import numpy as np
 import pytest
 from ignite.engine import Engine
-from ignite.contrib.metrics.regression import MedianAbsolutePercentageError
+from ignite.contrib.metrics.regression import MedianAbsolutePercentageError, \
+    StreamingMedianAbsolutePercentageError
 
 
 def test_wrong_input_shapes():
@@ -96,3 +97,30 @@ def test_integration_median_absolute_percentage_error_with_output_transform():
     median_absolute_percentage_error = engine.run(data, max_epochs=1).metrics['median_absolute_percentage_error']
 
     assert np_median_absolute_percentage_error == pytest.approx(median_absolute_percentage_error)
+
+
+def test_streaming_median_absolute_percentage_error():
+
+    np.random.seed(1)
+    size = 105
+    np_y_pred = np.random.rand(size, 1)
+    np_y = np.random.rand(size, 1) + 1.
+    np_median_absolute_percentage_error = 100.0 * np.median(np.abs(np_y - np_y_pred) / np.abs(np_y))
+
+    batch_size = 15
+
+    def update_fn(engine, batch):
+        idx = (engine.state.iteration - 1) * batch_size
+        y_true_batch = np_y[idx:idx + batch_size]
+        y_pred_batch = np_y_pred[idx:idx + batch_size]
+        return torch.from_numpy(y_pred_batch), torch.from_numpy(y_true_batch)
+
+    engine = Engine(update_fn)
+
+    m = StreamingMedianAbsolutePercentageError(compression=1000)
+    m.attach(engine, 'median_absolute_percentage_error')
+
+    data = list(range(size // batch_size))
+    median_absolute_percentage_error = engine.run(data, max_epochs=1).metrics['median_absolute_percentage_error']
+
+    assert np_median_absolute_percentage_error == pytest.approx(median_absolute_percentage_error)
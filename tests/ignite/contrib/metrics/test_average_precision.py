@@ -1,10 +1,12 @@
 import numpy as np
 from sklearn.metrics import average_precision_score
 
+import pytest
 import torch
 
 from ignite.engine import Engine
-from ignite.contrib.metrics import AveragePrecision
+from ignite.contrib.metrics import AveragePrecision, BinnedAveragePrecision
+from ignite.exceptions import NotComputableError
 
 
 def test_ap_score():
@@ -110,3 +112,97 @@ def test_integration_ap_score_with_activated_output_transform():
     ap = engine.run(data, max_epochs=1).metrics['ap']
 
     assert ap == np_ap
+
+
+def test_binned_ap_wrong_inputs():
+
+    with pytest.raises(ValueError):
+        BinnedAveragePrecision(num_thresholds=1.5)
+
+    with pytest.raises(ValueError):
+        BinnedAveragePrecision(min_value=0., max_value=0.)
+
+    ap_metric = BinnedAveragePrecision()
+    ap_metric.reset()
+
+    with pytest.raises(NotComputableError):
+        ap_metric.compute()
+
+    with pytest.raises(ValueError):
+        ap_metric.update((torch.rand(4, 1, 2), torch.randint(0, 2, size=(4, 1, 2)).long()))
+
+    with pytest.raises(ValueError):
+        ap_metric.update((torch.rand(4), torch.tensor([0, 1, 3, 1])))
+
+    with pytest.raises(ValueError, match=r"y must be comprised of 0's and 1's"):
+        ap_metric.update((torch.rand(4), torch.tensor([0, 1, -1, 1])))
+
+    with pytest.raises(ValueError, match=r"y must be comprised of 0's and 1's"):
+        ap_metric.update((torch.rand(4), torch.tensor([0., 1., 0.5, 1.])))
+
+    ap_metric.update((torch.rand(4), torch.zeros(4).long()))
+    with pytest.raises(NotComputableError):
+        ap_metric.compute()
+
+
+def test_binned_ap_score():
+
+    np.random.seed(1)
+    size = 1000
+    num_thresholds = 50
+    np_y = np.random.randint(0, 2, size=(size,)).astype(np.int64)
+    np_y_pred = np.clip(np.random.rand(size) * 0.6 + np_y * 0.3, 0, 1)
+    # Scores equal within each bin
+    np_y_pred_binned = (np.clip(np.floor(np_y_pred * num_thresholds), 0, num_thresholds - 1) + 0.5) / num_thresholds
+
+    ap_metric = BinnedAveragePrecision(num_thresholds=num_thresholds)
+    for y_pred, expected_exact in [(np_y_pred_binned, True), (np_y_pred, False)]:
+        ap_metric.reset()
+        batch_size = 100
+        for i in range(0, size, batch_size):
+            ap_metric.update((torch.from_numpy(y_pred[i:i + batch_size]),
+                              torch.from_numpy(np_y[i:i + batch_size]).unsqueeze(1)))
+        ap = ap_metric.compute()
+
+        np_ap = average_precision_score(np_y, y_pred)
+        if expected_exact:
+            assert ap == pytest.approx(np_ap)
+        else:
+            bins = np.clip(np.floor(y_pred * num_thresholds), 0, num_thresholds - 1).astype(np.int64)
+            positives = np.bincount(bins[np_y == 1], minlength=num_thresholds)[::-1]
+            counts = np.bincount(bins, minlength=num_thresholds)[::-1]
+            above = np.maximum(np.cumsum(counts), 1)
+            bound = (positives * counts / above).sum() / positives.sum()
+            assert ap != np_ap
+            assert abs(ap - np_ap) <= bound
+
+
+def test_integration_binned_ap_score():
+
+    np.random.seed(1)
+    size = 100
+    np_y_pred = np.random.rand(size, 1)
+    np_y = np.zeros((size,), dtype=np.int64)
+    np_y[size // 2:] = 1
+    np.random.shuffle(np_y)
+
+    np_ap = average_precision_score(np_y, np_y_pred)
+
+    batch_size = 10
+
+    def update_fn(engine, batch):
+        idx = (engine.state.iteration - 1) * batch_size
+        y_true_batch = np_y[idx:idx + batch_size]
+        y_pred_batch = np_y_pred[idx:idx + batch_size]
+        return torch.from_numpy(y_pred_batch), torch.from_numpy(y_true_batch)
+
+    engine = Engine(update_fn)
+
+    # Enough thresholds for distinct bins
+    ap_metric = BinnedAveragePrecision(num_thresholds=100000)
+    ap_metric.attach(engine, 'ap')
+
+    data = list(range(size // batch_size))
+    ap = engine.run(data, max_epochs=1).metrics['ap']
+
+    assert ap == pytest.approx(np_ap)
@@ -1,10 +1,12 @@
 import numpy as np
 from sklearn.metrics import roc_auc_score
 
+import pytest
 import torch
 
 from ignite.engine import Engine
-from ignite.contrib.metrics import ROC_AUC
+from ignite.contrib.metrics import ROC_AUC, BinnedROC_AUC
+from ignite.exceptions import NotComputableError
 
 
 def test_roc_auc_score():
@@ -111,3 +113,115 @@ def test_integration_roc_auc_score_with_activated_output_transform():
     roc_auc = engine.run(data, max_epochs=1).metrics['roc_auc']
 
     assert roc_auc == np_roc_auc
+
+
+def test_binned_roc_auc_wrong_inputs():
+
+    with pytest.raises(ValueError):
+        BinnedROC_AUC(num_thresholds=0)
+
+    with pytest.raises(ValueError):
+        BinnedROC_AUC(min_value=1., max_value=0.)
+
+    roc_auc_metric = BinnedROC_AUC()
+    roc_auc_metric.reset()
+
+    with pytest.raises(NotComputableError):
+        roc_auc_metric.compute()
+
+    with pytest.raises(ValueError):
+        roc_auc_metric.update((torch.rand(4, 2), torch.randint(0, 2, size=(4, 2)).long()))
+
+    with pytest.raises(ValueError):
+        roc_auc_metric.update((torch.rand(4), torch.randint(0, 2, size=(5,)).long()))
+
+    with pytest.raises(ValueError):
+        roc_auc_metric.update((torch.rand(4), torch.tensor([0, 1, 2, 1])))
+
+    with pytest.raises(ValueError, match=r"y must be comprised of 0's and 1's"):
+        roc_auc_metric.update((torch.rand(4), torch.tensor([0, 1, -1, 1])))
+
+    with pytest.raises(ValueError, match=r"y must be comprised of 0's and 1's"):
+        roc_auc_metric.update((torch.rand(4), torch.tensor([0., 1., 0.5, 1.])))
+
+    roc_auc_metric.update((torch.rand(4), torch.ones(4).long()))
+    with pytest.raises(NotComputableError):
+        roc_auc_metric.compute()
+
+
+def test_binned_roc_auc_score():
+
+    np.random.seed(1)
+    size = 1000
+    num_thresholds = 50
+    np_y = np.random.randint(0, 2, size=(size,)).astype(np.int64)
+    np_y_pred = np.clip(np.random.rand(size) * 0.6 + np_y * 0.3, 0, 1)
+    # Scores equal within each bin
+    np_y_pred_binned = (np.clip(np.floor(np_y_pred * num_thresholds), 0, num_thresholds - 1) + 0.5) / num_thresholds
+
+    roc_auc_metric = BinnedROC_AUC(num_thresholds=num_thresholds)
+    for y_pred, expected_exact in [(np_y_pred_binned, True), (np_y_pred, False)]:
+        roc_auc_metric.reset()
+        batch_size = 100
+        for i in range(0, size, batch_size):
+            roc_auc_metric.update((torch.from_numpy(y_pred[i:i + batch_size]).unsqueeze(1),
+                                   torch.from_numpy(np_y[i:i + batch_size])))
+        roc_auc = roc_auc_metric.compute()
+
+        np_roc_auc = roc_auc_score(np_y, y_pred)
+        if expected_exact:
+            assert roc_auc == pytest.approx(np_roc_auc)
+        else:
+            bins = np.clip(np.floor(y_pred * num_thresholds), 0, num_thresholds - 1).astype(np.int64)
+            positives = np.bincount(bins[np_y == 1], minlength=num_thresholds)
+            negatives = np.bincount(bins[np_y == 0], minlength=num_thresholds)
+            bound = (positives * negatives).sum() / (2. * positives.sum() * negatives.sum())
+            assert roc_auc != np_roc_auc
+            assert abs(roc_auc - np_roc_auc) <= bound
+
+
+def test_integration_binned_roc_auc_score():
+
+    np.random.seed(1)
+    size = 100
+    np_y_pred = np.random.rand(size, 1)
+    np_y = np.zeros((size,), dtype=np.int64)
+    np_y[size // 2:] = 1
+    np.random.shuffle(np_y)
+
+    np_roc_auc = roc_auc_score(np_y, 2 * np_y_pred - 1)
+
+    batch_size = 10
+
+    def update_fn(engine, batch):
+        idx = (engine.state.iteration - 1) * batch_size
+        y_true_batch = np_y[idx:idx + batch_size]
+        y_pred_batch = np_y_pred[idx:idx + batch_size]
+        return torch.from_numpy(2 * y_pred_batch - 1), torch.from_numpy(y_true_batch)
+
+    engine = Engine(update_fn)
+
+    # Enough thresholds for distinct bins
+    roc_auc_metric = BinnedROC_AUC(num_thresholds=100000, min_value=-1., max_value=1.)
+    roc_auc_metric.attach(engine, 'roc_auc')
+
+    data = list(range(size // batch_size))
+    roc_auc = engine.run(data, max_epochs=1).metrics['roc_auc']
+
+    assert roc_auc == pytest.approx(np_roc_auc)
+
+
+def test_binned_roc_auc_merge():
+    torch.manual_seed(0)
+    y_pred = torch.rand(50)
+    y = torch.randint(0, 2, size=(50,)).long()
+
+    roc_auc = BinnedROC_AUC(num_thresholds=100)
+    roc_auc.update((y_pred, y))
+
+    roc_auc1 = BinnedROC_AUC(num_thresholds=100)
+    roc_auc1.update((y_pred[:20], y[:20]))
+    roc_auc2 = BinnedROC_AUC(num_thresholds=100)
+    roc_auc2.update((y_pred[20:], y[20:]))
+    roc_auc1.merge(roc_auc2.state_dict())
+    assert roc_auc1.compute() == pytest.approx(roc_auc.compute())
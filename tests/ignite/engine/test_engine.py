@@ -1,6 +1,7 @@
 from __future__ import division
 from enum import Enum
 import gc
+import threading
 
 import pytest
 from mock import call, MagicMock, Mock
@@ -11,7 +12,8 @@ from torch.nn import Linear
 from torch.nn.functional import mse_loss
 from torch.optim import SGD
 
-from ignite.engine import Engine, Events, State, create_supervised_trainer, create_supervised_evaluator
+from ignite.engine import Engine, Events, State, EventWithFilter, create_supervised_trainer, create_supervised_evaluator
+from ignite.engine.engine import _BatchPrefetcher, _skip_batches, _SkipBatchSampler, _with_batch_sampler
 from ignite.metrics import MeanSquaredError
 
 
@@ -120,6 +122,22 @@ def test_add_event_handler():
     assert completed_counter.count == 15
 
 
+def test_add_event_handler_prepend():
+    engine = Engine(lambda engine, batch: None)
+    calls = []
+
+    def handler(engine, name, prepend=""):
+        calls.append(prepend + name)
+
+    engine.add_event_handler(Events.STARTED, handler, "first")
+    engine._add_event_handler(Events.STARTED, handler, ("prepended",), {}, prepend=True)
+    engine.add_event_handler(Events.STARTED, handler, "last")
+    # The keyword arguments of add_event_handler are all passed to the handler
+    engine.add_event_handler(Events.STARTED, handler, "kwarg", prepend="with ")
+    engine.run([0])
+    assert calls == ["prepended", "first", "last", "with kwarg"]
+
+
 def test_adding_multiple_event_handlers():
     engine = DummyEngine()
     handlers = [MagicMock(), MagicMock()]
@@ -283,6 +301,140 @@ def test_args_and_kwargs_are_passed_to_event():
         assert handler_kwargs == kwargs
 
 
+def test_event_kwargs_do_not_update_registered_kwargs():
+    engine = DummyEngine()
+    handler = MagicMock()
+    engine.add_event_handler(Events.STARTED, handler, a=1)
+
+    engine._fire_event(Events.STARTED, b=2)
+    handler.assert_called_once_with(engine, a=1, b=2)
+
+    engine._fire_event(Events.STARTED)
+    handler.assert_called_with(engine, a=1)
+    assert engine._event_handlers[Events.STARTED][0][2] == {'a': 1}
+
+
+def test_dispatch_table():
+    engine = DummyEngine()
+    assert Events.STARTED not in engine._dispatch_table
+
+    h1 = MagicMock()
+    h2 = MagicMock()
+    engine.add_event_handler(Events.STARTED, h1)
+    engine.add_event_handler(Events.STARTED, h2)
+    assert [h for h, _, _, _ in engine._dispatch_table[Events.STARTED]] == [h1, h2]
+
+    engine.remove_event_handler(h1, Events.STARTED)
+    assert [h for h, _, _, _ in engine._dispatch_table[Events.STARTED]] == [h2]
+
+    engine.remove_event_handler(h2, Events.STARTED)
+    assert Events.STARTED not in engine._dispatch_table
+
+    # Firing an event without handlers or an unknown event is a no-op
+    engine._fire_event(Events.STARTED)
+    engine._fire_event("unknown event")
+    assert not h1.called and not h2.called
+
+
+def test_exception_raised_after_removing_exception_handler():
+    engine = Engine(MagicMock(side_effect=ValueError()))
+    handler = MagicMock()
+    engine.add_event_handler(Events.EXCEPTION_RAISED, handler)
+    engine.remove_event_handler(handler, Events.EXCEPTION_RAISED)
+
+    with raises(ValueError):
+        engine.run([1])
+    assert not handler.called
+
+
+def test_event_with_filter_bad_input():
+
+    with pytest.raises(ValueError, match=r"Exactly one of the arguments"):
+        Events.ITERATION_COMPLETED()
+
+    with pytest.raises(ValueError, match=r"Exactly one of the arguments"):
+        Events.ITERATION_COMPLETED(every=2, once=2)
+
+    with pytest.raises(ValueError, match=r"Argument every should be a positive integer"):
+        Events.ITERATION_COMPLETED(every=0)
+
+    with pytest.raises(ValueError, match=r"Argument once should be a positive integer"):
+        Events.ITERATION_COMPLETED(once=1.5)
+
+    with pytest.raises(TypeError, match=r"Argument event_filter should be a callable"):
+        Events.ITERATION_COMPLETED(event_filter="abc")
+
+    engine = DummyEngine()
+    with pytest.raises(ValueError, match=r"can not be filtered"):
+        engine.add_event_handler(Events.EXCEPTION_RAISED(every=2), lambda engine, e: None)
+
+
+def test_event_with_filter():
+    data = list(range(10))
+
+    def _test(event, expected_values, attr):
+        engine = Engine(lambda engine, batch: None)
+        handler = MagicMock()
+        values = []
+        engine.add_event_handler(event, lambda engine: values.append(getattr(engine.state, attr)))
+        engine.add_event_handler(event, handler, 1, a=2)
+        engine.run(data, max_epochs=5)
+        assert values == expected_values
+        assert handler.call_count == len(expected_values)
+        handler.assert_called_with(engine, 1, a=2)
+
+    _test(Events.ITERATION_COMPLETED(every=7), list(range(7, 51, 7)), "iteration")
+    _test(Events.ITERATION_STARTED(once=12), [12], "iteration")
+    _test(Events.EPOCH_COMPLETED(every=2), [2, 4], "epoch")
+    _test(Events.EPOCH_STARTED(once=5), [5], "epoch")
+    _test(Events.ITERATION_COMPLETED(event_filter=lambda engine, i: i in (1, 25, 49)), [1, 25, 49], "iteration")
+
+
+def test_event_with_filter_preserves_handlers_order():
+    engine = Engine(lambda engine, batch: None)
+    calls = []
+    engine.add_event_handler(Events.ITERATION_COMPLETED, lambda engine: calls.append("a"))
+    engine.add_event_handler(Events.ITERATION_COMPLETED(every=2), lambda engine: calls.append("b"))
+    engine.add_event_handler(Events.ITERATION_COMPLETED, lambda engine: calls.append("c"))
+    engine.run([0, 1], max_epochs=1)
+    assert calls == ["a", "c", "a", "b", "c"]
+
+
+def test_event_with_filter_remove_handler():
+    engine = Engine(lambda engine, batch: None)
+    handler = MagicMock()
+    event = Events.ITERATION_COMPLETED(every=2)
+
+    with engine.add_event_handler(event, handler):
+        assert engine.has_event_handler(handler, event)
+        assert engine.has_event_handler(handler, Events.ITERATION_COMPLETED)
+        engine.run([0, 1, 2, 3])
+    assert handler.call_count == 2
+    assert not engine.has_event_handler(handler)
+
+    engine.add_event_handler(event, handler)
+    engine.remove_event_handler(handler, event)
+    assert not engine.has_event_handler(handler)
+
+
+def test_custom_event_with_filter():
+    class Custom_Events(Enum):
+        TEST_EVENT = "test_event"
+
+    def process_func(engine, batch):
+        engine.state.test_event += 1
+        engine.fire_event(Custom_Events.TEST_EVENT)
+
+    engine = Engine(process_func)
+    engine.register_events(*Custom_Events, event_to_attr={Custom_Events.TEST_EVENT: 'test_event'})
+
+    values = []
+    engine.add_event_handler(EventWithFilter(Custom_Events.TEST_EVENT, every=3),
+                             lambda engine: values.append(engine.state.test_event))
+    engine.run(range(10))
+    assert values == [3, 6, 9]
+
+
 def test_custom_events():
     class Custom_Events(Enum):
         TEST_EVENT = "test_event"
@@ -347,6 +499,13 @@ def test_custom_events_with_event_to_attr():
     with pytest.raises(ValueError):
         engine.register_events(*Custom_Events, event_to_attr=custom_event_to_attr)
 
+    # Mapping of custom events is not shared between engines
+    assert Custom_Events.TEST_EVENT not in State.event_to_attr
+    engine.run(range(1))
+    assert not hasattr(engine.state, 'test_event')
+    with pytest.raises(RuntimeError, match=r"Unknown event name"):
+        engine.state.get_event_attrib_value(Custom_Events.TEST_EVENT)
+
 
 def test_on_decorator_raises_with_invalid_event():
     engine = DummyEngine()
@@ -662,6 +821,182 @@ def test_create_supervised_trainer_traced_with_cpu():
     assert traced_model.bias.item() == approx(0.8)
 
 
+def _train_linear(x, y, batch_size, max_epochs=1, **kwargs):
+    torch.manual_seed(12)
+    model = Linear(3, 2)
+    optimizer = SGD(model.parameters(), 0.1)
+    trainer = create_supervised_trainer(model, optimizer, mse_loss, **kwargs)
+    data = list(zip(torch.split(x, batch_size), torch.split(y, batch_size)))
+    state = trainer.run(data, max_epochs=max_epochs)
+    return model, state
+
+
+def test_create_supervised_trainer_gradient_accumulation():
+    torch.manual_seed(0)
+    x = torch.rand(8, 3)
+    y = torch.rand(8, 2)
+
+    model, _ = _train_linear(x, y, batch_size=8)
+    accumulated_model, _ = _train_linear(x, y, batch_size=4, gradient_accumulation_steps=2)
+    assert torch.allclose(model.weight.data, accumulated_model.weight.data)
+    assert torch.allclose(model.bias.data, accumulated_model.bias.data)
+
+    # Output is the unscaled loss of the batch
+    _, state = _train_linear(x[:4], y[:4], batch_size=4)
+    _, accumulated_state = _train_linear(x[:4], y[:4], batch_size=4, gradient_accumulation_steps=2)
+    assert accumulated_state.output == approx(state.output)
+
+    # Incomplete groups are stepped at the end of each epoch, with the average of their gradients
+    x = torch.rand(6, 3)
+    y = torch.rand(6, 2)
+    model, _ = _train_linear(x, y, batch_size=[4, 2], max_epochs=3)
+    accumulated_model, _ = _train_linear(x, y, batch_size=2, max_epochs=3, gradient_accumulation_steps=2)
+    assert torch.allclose(model.weight.data, accumulated_model.weight.data)
+    assert torch.allclose(model.bias.data, accumulated_model.bias.data)
+
+    model, _ = _train_linear(x, y, batch_size=6)
+    accumulated_model, _ = _train_linear(x, y, batch_size=2, gradient_accumulation_steps=4)
+    assert torch.allclose(model.weight.data, accumulated_model.weight.data)
+
+
+def test_create_supervised_trainer_micro_batches():
+    torch.manual_seed(0)
+    x = torch.rand(10, 3)
+    y = torch.rand(10, 2)
+
+    model, state = _train_linear(x, y, batch_size=10)
+    micro_model, micro_state = _train_linear(x, y, batch_size=10, num_micro_batches=3)
+    assert torch.allclose(model.weight.data, micro_model.weight.data)
+    assert torch.allclose(model.bias.data, micro_model.bias.data)
+    assert micro_state.output == approx(state.output)
+
+    # Micro-batches with gradient accumulation
+    micro_model, _ = _train_linear(x, y, batch_size=5, num_micro_batches=2, gradient_accumulation_steps=2)
+    assert torch.allclose(model.weight.data, micro_model.weight.data)
+
+    # output_transform receives the whole batch and the concatenated predictions
+    outputs = []
+    _train_linear(x, y, batch_size=10, num_micro_batches=4,
+                  output_transform=lambda x, y, y_pred, loss: outputs.append((x.shape, y_pred.shape)))
+    assert outputs == [(x.shape, y.shape)]
+
+
+def test_create_supervised_trainer_materialize_every():
+    x = torch.FloatTensor([[1.0], [2.0]])
+    y = torch.FloatTensor([[3.0], [5.0]])
+
+    for materialize_every, expected_types in [(1, [float] * 4), (3, [torch.Tensor] * 2 + [float, torch.Tensor]),
+                                              (None, [torch.Tensor] * 4)]:
+        model = Linear(1, 1)
+        trainer = create_supervised_trainer(model, SGD(model.parameters(), 0.1), mse_loss,
+                                            materialize_every=materialize_every)
+        outputs = []
+        trainer.add_event_handler(Events.ITERATION_COMPLETED, lambda engine: outputs.append(engine.state.output))
+        trainer.run([(x, y)] * 4)
+        assert [type(o) if isinstance(o, float) else torch.Tensor for o in outputs] == expected_types
+        for output in outputs:
+            if isinstance(output, torch.Tensor):
+                assert output.dim() == 0 and not output.requires_grad
+
+
+def test_create_supervised_trainer_wrong_accumulation_args():
+    model = Linear(1, 1)
+    optimizer = SGD(model.parameters(), 0.1)
+    with raises(ValueError, match=r"gradient_accumulation_steps should be a positive integer"):
+        create_supervised_trainer(model, optimizer, mse_loss, gradient_accumulation_steps=0)
+    with raises(ValueError, match=r"num_micro_batches should be a positive integer"):
+        create_supervised_trainer(model, optimizer, mse_loss, num_micro_batches=1.5)
+    with raises(ValueError, match=r"materialize_every should be a positive integer or None"):
+        create_supervised_trainer(model, optimizer, mse_loss, materialize_every=0)
+    with raises(ValueError, match=r"materialize_every applies to the default output_transform only"):
+        create_supervised_trainer(model, optimizer, mse_loss, materialize_every=None,
+                                  output_transform=lambda x, y, y_pred, loss: loss)
+
+    trainer = create_supervised_trainer(model, optimizer, mse_loss, num_micro_batches=2,
+                                        prepare_batch=lambda batch, device, non_blocking: ([batch[0]], batch[1]))
+    with raises(TypeError, match=r"batch_x and batch_y should be tensors"):
+        trainer.run([(torch.rand(4, 1), torch.rand(4, 1))])
+
+
+def test_create_supervised_evaluator_inference_batch_size():
+    torch.manual_seed(0)
+    model = Linear(3, 2)
+    x = torch.rand(23, 3)
+    y = torch.rand(23, 2)
+    # Small and big batches
+    sizes = [1, 2, 3, 9, 1, 5, 2]
+    data = list(zip(torch.split(x, sizes), torch.split(y, sizes)))
+
+    outputs = []
+
+    def output_transform(x, y, y_pred):
+        outputs.append((x, y, y_pred))
+        return y_pred, y
+
+    evaluator = create_supervised_evaluator(model, metrics={"mse": MeanSquaredError()}, inference_batch_size=4,
+                                            output_transform=output_transform)
+
+    @evaluator.on(Events.ITERATION_COMPLETED)
+    def check_mode(engine):
+        assert not model.training
+        assert not engine.state.output[0].requires_grad
+        # Gradients are disabled during the inference only
+        assert torch.is_grad_enabled()
+
+    model.train()
+    state = evaluator.run(data)
+
+    assert [len(o[0]) for o in outputs] == [4, 4, 4, 4, 4, 3]
+    assert state.epoch_length is None and state.iteration == 6
+    assert torch.equal(torch.cat([o[0] for o in outputs]), x)
+    assert torch.equal(torch.cat([o[1] for o in outputs]), y)
+    with torch.no_grad():
+        assert torch.allclose(torch.cat([o[2] for o in outputs]), model(x))
+        assert state.metrics["mse"] == approx(((model(x) - y) ** 2).sum().item() / len(x))
+    assert torch.is_grad_enabled()
+
+    # Data is re-batched at each run
+    outputs = []
+    evaluator.run(data, max_epochs=2)
+    assert len(outputs) == 12
+
+
+def test_create_supervised_evaluator_traced():
+    torch.manual_seed(0)
+    model = Linear(3, 2)
+    x = torch.rand(10, 3)
+    y = torch.rand(10, 2)
+    data = list(zip(torch.split(x, 4), torch.split(y, 4)))
+
+    evaluator = create_supervised_evaluator(model, metrics={"mse": MeanSquaredError()}, trace=True)
+    state = evaluator.run(data)
+    with torch.no_grad():
+        assert state.metrics["mse"] == approx(((model(x) - y) ** 2).sum().item() / len(x))
+
+    # Traced again for new input shapes and dtypes, and for replaced parameters
+    model.weight = torch.nn.Parameter(torch.rand(2, 3))
+    data = [(x[:3].double(), y[:3].double())] + list(zip(torch.split(x, 7), torch.split(y, 7)))
+    model.double()
+    state = evaluator.run(data[:1])
+    with torch.no_grad():
+        assert state.metrics["mse"] == approx(((model(x[:3].double()) - y[:3].double()) ** 2).sum().item() / 3)
+    model.float()
+    state = evaluator.run(data[1:])
+    with torch.no_grad():
+        assert state.metrics["mse"] == approx(((model(x) - y) ** 2).sum().item() / len(x))
+
+
+def test_create_supervised_evaluator_wrong_inference_args():
+    model = Linear(1, 1)
+    with raises(ValueError, match=r"inference_batch_size should be a positive integer"):
+        create_supervised_evaluator(model, inference_batch_size=0)
+
+    evaluator = create_supervised_evaluator(model, inference_batch_size=2,
+                                            prepare_batch=lambda batch, device, non_blocking: ([batch[0]], batch[1]))
+    with raises(TypeError, match=r"batch_x and batch_y should be tensors"):
+        evaluator.run([(torch.rand(4, 1), torch.rand(4, 1))])
+
+
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="Skip if no GPU")
 def test_create_supervised_trainer_on_cuda():
     model = Linear(1, 1)
@@ -812,3 +1147,396 @@ def test_reset_should_terminate():
 
     engine.run([0] * 20)
     assert engine.state.iteration == 10
+
+
+def test_prefetch_bad_input():
+    engine = Engine(lambda engine, batch: None)
+    with pytest.raises(ValueError, match=r"Argument prefetch should be a non-negative integer"):
+        engine.run([0, 1], prefetch=-1)
+
+
+def test_prefetch_preserves_order():
+
+    def _test(prefetch):
+        batches = []
+        engine = Engine(lambda engine, batch: batches.append(batch))
+        data = list(range(50))
+        state = engine.run(data, max_epochs=3, prefetch=prefetch)
+        assert batches == data * 3
+        assert state.iteration == 150
+
+    _test(1)
+    _test(2)
+    _test(100)
+
+
+def test_prefetch_runs_in_background_thread():
+    main_thread = threading.current_thread()
+    fetching_threads = set()
+
+    def data():
+        for i in range(5):
+            fetching_threads.add(threading.current_thread())
+            yield i
+
+    class Data(object):
+        def __iter__(self):
+            return data()
+
+    engine = Engine(lambda engine, batch: None)
+    engine.run(Data(), max_epochs=2, prefetch=2)
+    assert len(fetching_threads) == 2
+    assert main_thread not in fetching_threads
+    assert all(not t.is_alive() for t in fetching_threads)
+
+
+def test_prefetch_with_device():
+    batches = []
+    engine = Engine(lambda engine, batch: batches.append(batch))
+    data = [(torch.rand(4, 3), torch.randint(0, 2, size=(4, ))) for _ in range(10)]
+    engine.run(data, prefetch=3, prefetch_device="cpu")
+
+    assert len(batches) == len(data)
+    for (x, y), (true_x, true_y) in zip(batches, data):
+        assert x.device.type == "cpu"
+        assert torch.equal(x, true_x) and torch.equal(y, true_y)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="Skip if no GPU")
+def test_prefetch_with_pin_memory_on_cuda():
+    batches = []
+    engine = Engine(lambda engine, batch: batches.append(batch))
+    data = [torch.rand(4, 3) for _ in range(10)]
+    engine.run(data, prefetch=2, prefetch_device="cuda", pin_memory=True)
+
+    assert len(batches) == len(data)
+    for x, true_x in zip(batches, data):
+        assert x.is_cuda
+        assert torch.equal(x.cpu(), true_x)
+
+
+def test_prefetch_terminate():
+    alive_threads = threading.active_count()
+
+    def _test(terminate_fn, expected_iterations):
+        engine = Engine(lambda engine, batch: None)
+
+        @engine.on(Events.ITERATION_COMPLETED)
+        def terminate(engine):
+            if engine.state.iteration % 10 == 3:
+                terminate_fn(engine)
+
+        state = engine.run(list(range(10)), max_epochs=3, prefetch=2)
+        assert state.iteration == expected_iterations
+        assert threading.active_count() == alive_threads
+
+    _test(Engine.terminate, 3)
+    _test(Engine.terminate_epoch, 23)
+
+
+def test_prefetch_close_with_blocked_iterator():
+    release = threading.Event()
+
+    def data():
+        yield 0
+        release.wait()
+        yield 1
+
+    prefetcher = _BatchPrefetcher(data(), depth=2)
+    assert next(prefetcher) == 0
+    prefetcher.close(timeout=0.1)
+    # The daemon thread stops once the blocked batch is fetched
+    assert prefetcher._thread.is_alive()
+    release.set()
+    prefetcher._thread.join(timeout=5)
+    assert not prefetcher._thread.is_alive()
+
+
+def test_prefetch_terminate_epoch_with_epoch_length():
+    batches = []
+    engine = Engine(lambda engine, batch: batches.append(batch))
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def terminate(engine):
+        if engine.state.iteration == 2:
+            engine.terminate_epoch()
+
+    engine.run(list(range(100)), max_epochs=2, epoch_length=5, prefetch=3)
+    # Batches fetched in advance are processed by the next epoch
+    assert batches == list(range(7))
+
+
+def test_prefetch_exception_propagation():
+
+    def data():
+        yield 0
+        yield 1
+        raise ValueError("Data error")
+
+    class Data(object):
+        def __iter__(self):
+            return data()
+
+    processed = []
+    engine = Engine(lambda engine, batch: processed.append(batch))
+    with raises(ValueError, match=r"Data error"):
+        engine.run(Data(), prefetch=2)
+    assert processed == [0, 1]
+
+    engine = Engine(MagicMock(side_effect=RuntimeError("Process error")))
+    exceptions = []
+    engine.add_event_handler(Events.EXCEPTION_RAISED, lambda engine, e: exceptions.append(e))
+    engine.run(list(range(10)), prefetch=2)
+    assert len(exceptions) == 1 and isinstance(exceptions[0], RuntimeError)
+
+
+def test_epoch_length_bad_input():
+    engine = Engine(lambda engine, batch: None)
+    with pytest.raises(ValueError, match=r"Argument epoch_length should be a positive integer"):
+        engine.run([0, 1], epoch_length=0)
+
+    with pytest.raises(ValueError, match=r"Argument epoch_length should be a positive integer"):
+        engine.run([0, 1], epoch_length=1.5)
+
+
+def test_state_epoch_length():
+    engine = Engine(lambda engine, batch: None)
+
+    state = engine.run(list(range(10)), max_epochs=2)
+    assert state.epoch_length == 10
+    assert state.iteration == 20
+
+    state = engine.run(iter(range(10)), max_epochs=1)
+    assert state.epoch_length is None
+    assert state.iteration == 10
+
+    state = engine.run(list(range(10)), max_epochs=2, epoch_length=4)
+    assert state.epoch_length == 4
+    assert state.iteration == 8
+
+
+def test_epoch_length_single_iterator():
+
+    class Data(object):
+        def __init__(self, n):
+            self.n = n
+            self.num_iters = 0
+
+        def __iter__(self):
+            self.num_iters += 1
+            return iter(range(self.n))
+
+    def _test(prefetch):
+        data = Data(100)
+        batches = []
+        engine = Engine(lambda engine, batch: batches.append(batch))
+        epochs = []
+        engine.add_event_handler(Events.EPOCH_COMPLETED, lambda engine: epochs.append(engine.state.iteration))
+
+        state = engine.run(data, max_epochs=5, epoch_length=10, prefetch=prefetch)
+        assert data.num_iters == 1
+        assert batches == list(range(50))
+        assert epochs == [10, 20, 30, 40, 50]
+        assert state.epoch == 5
+
+        # A new iterator is created when the data is exhausted
+        data = Data(7)
+        batches = []
+        engine.run(data, max_epochs=3, epoch_length=5, prefetch=prefetch)
+        assert data.num_iters == 3
+        assert batches == [0, 1, 2, 3, 4, 5, 6, 0, 1, 2, 3, 4, 5, 6, 0]
+
+    _test(0)
+    _test(2)
+
+
+def test_epoch_length_with_generator():
+
+    def data():
+        for i in range(25):
+            yield i
+
+    batches = []
+    engine = Engine(lambda engine, batch: batches.append(batch))
+    state = engine.run(data(), max_epochs=2, epoch_length=10)
+    assert state.epoch == 2
+    assert batches == list(range(20))
+
+    # Data is exhausted before max_epochs are completed
+    batches = []
+    with pytest.warns(UserWarning, match=r"Data iterator can not provide data anymore"):
+        state = engine.run(data(), max_epochs=5, epoch_length=10)
+    assert state.iteration == 25
+    assert state.epoch == 3
+    assert batches == list(range(25))
+
+
+def test_epoch_length_terminate_epoch():
+    batches = []
+    engine = Engine(lambda engine, batch: batches.append(batch))
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def terminate_epoch(engine):
+        if engine.state.iteration == 3:
+            engine.terminate_epoch()
+
+    state = engine.run(list(range(100)), max_epochs=3, epoch_length=5)
+    assert state.iteration == 13
+    # the epoch following the terminated one continues from the next batch
+    assert batches == list(range(13))
+
+
+def test_state_dict():
+    engine = Engine(lambda engine, batch: None)
+    assert engine.state_dict() == {}
+
+    engine.run(list(range(10)), max_epochs=3, seed=12)
+    assert engine.state_dict() == {"seed": 12, "epoch_length": 10, "max_epochs": 3, "epoch": 3, "iteration": 30}
+
+
+def test_load_state_dict_bad_input():
+    engine = Engine(lambda engine, batch: None)
+
+    with pytest.raises(TypeError, match=r"Argument state_dict should be a dictionary"):
+        engine.load_state_dict([])
+
+    with pytest.raises(ValueError, match=r"Required keys \['seed', 'epoch'\] are absent"):
+        engine.load_state_dict({"epoch_length": 10, "max_epochs": 3, "iteration": 30})
+
+
+def _run_with_terminate(data, terminate_at, **kwargs):
+    batches = []
+    engine = Engine(lambda engine, batch: batches.append(batch))
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def terminate(engine):
+        if engine.state.iteration == terminate_at:
+            engine.terminate()
+
+    engine.run(data, **kwargs)
+    return batches, engine.state_dict()
+
+
+def _resume(data, state_dict, **kwargs):
+    batches = []
+    epochs = []
+    engine = Engine(lambda engine, batch: batches.append(batch))
+    engine.add_event_handler(Events.EPOCH_COMPLETED, lambda engine: epochs.append(engine.state.iteration))
+    engine.load_state_dict(state_dict)
+    state = engine.run(data, **kwargs)
+    return batches, epochs, state
+
+
+def test_resume_mid_epoch():
+    data = list(range(10))
+
+    batches, state_dict = _run_with_terminate(data, 13, max_epochs=3)
+    assert state_dict == {"seed": None, "epoch_length": 10, "max_epochs": 3, "epoch": 2, "iteration": 13}
+
+    resumed_batches, epochs, state = _resume(data, state_dict)
+    assert batches + resumed_batches == data * 3
+    assert epochs == [20, 30]
+    assert state.epoch == 3 and state.iteration == 30
+
+    # Resume at the end of an epoch
+    batches, state_dict = _run_with_terminate(data, 10, max_epochs=3)
+    resumed_batches, epochs, state = _resume(data, state_dict)
+    assert batches + resumed_batches == data * 3
+    assert epochs == [20, 30]
+
+    # Increase max_epochs
+    resumed_batches, epochs, state = _resume(data, state_dict, max_epochs=4)
+    assert batches + resumed_batches == data * 4
+    assert state.epoch == 4
+
+
+def test_resume_with_epoch_length():
+    data = list(range(7))
+
+    batches, state_dict = _run_with_terminate(data, 12, max_epochs=5, epoch_length=4)
+    resumed_batches, epochs, state = _resume(data, state_dict)
+    assert batches + resumed_batches == (data * 3)[:20]
+    assert epochs == [16, 20]
+
+    def stream():
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+    batches, state_dict = _run_with_terminate(stream(), 6, max_epochs=3, epoch_length=4)
+    assert batches == list(range(6))
+
+    # The processed batches of data without length are consumed from a new iterator
+    resumed_batches, epochs, state = _resume(stream(), state_dict)
+    assert batches + resumed_batches == list(range(12))
+    assert epochs == [8, 12]
+
+    class Stream(object):
+        def __iter__(self):
+            return stream()
+
+    batches, state_dict = _run_with_terminate(Stream(), 9, max_epochs=3, epoch_length=4)
+    resumed_batches, epochs, state = _resume(Stream(), state_dict)
+    assert batches + resumed_batches == list(range(12))
+    assert epochs == [12]
+
+
+def test_resume_shuffled_dataloader_with_seed():
+
+    class Dataset(torch.utils.data.Dataset):
+        def __init__(self):
+            self.loaded_indices = []
+
+        def __getitem__(self, index):
+            self.loaded_indices.append(index)
+            return index
+
+        def __len__(self):
+            return 20
+
+    def _to_list(batches):
+        return [b.tolist() for b in batches]
+
+    max_epochs = 3
+    dataset = Dataset()
+    data = torch.utils.data.DataLoader(dataset, batch_size=3, shuffle=True)
+    batches, _ = _run_with_terminate(data, -1, max_epochs=max_epochs, seed=17)
+    assert len(batches) == len(data) * max_epochs
+
+    dataset = Dataset()
+    data = torch.utils.data.DataLoader(dataset, batch_size=3, shuffle=True)
+    first_batches, state_dict = _run_with_terminate(data, 10, max_epochs=max_epochs, seed=17)
+    assert state_dict["seed"] == 17
+    assert _to_list(first_batches) == _to_list(batches[:10])
+
+    # Processed batches are not loaded when the run is resumed
+    dataset = Dataset()
+    data = torch.utils.data.DataLoader(dataset, batch_size=3, shuffle=True)
+    resumed_batches, _, state = _resume(data, state_dict)
+    assert _to_list(first_batches + resumed_batches) == _to_list(batches)
+    assert len(dataset.loaded_indices) == 3 * len(dataset) - sum(len(b) for b in first_batches)
+
+
+def test_skip_batches():
+    data = torch.utils.data.DataLoader(list(range(10)), batch_size=3)
+    assert [b.tolist() for b in _skip_batches(data, 2)] == [[6, 7, 8], [9]]
+    assert list(_skip_batches(list(range(5)), 2)) == [2, 3, 4]
+
+
+def test_skip_batches_keeps_dataloader_arguments():
+
+    def collate_fn(batch):
+        return [10 * x for x in batch]
+
+    def worker_init_fn(worker_id):
+        pass
+
+    data = torch.utils.data.DataLoader(list(range(10)), batch_size=3, collate_fn=collate_fn)
+    assert list(_skip_batches(data, 2)) == [[60, 70, 80], [90]]
+
+    data = torch.utils.data.DataLoader(list(range(10)), batch_size=3, collate_fn=collate_fn, num_workers=2,
+                                       timeout=5, worker_init_fn=worker_init_fn, pin_memory=True)
+    skipping_data = _with_batch_sampler(data, _SkipBatchSampler(data.batch_sampler, 2))
+    for name in ("collate_fn", "worker_init_fn", "timeout", "pin_memory", "num_workers"):
+        assert getattr(skipping_data, name) == getattr(data, name)
@@ -0,0 +1,187 @@
+import time
+
+import pytest
+from pytest import approx
+
+from ignite.engine import Engine, Events, HandlersTimeProfiler, TimesRecorder
+
+
+def _sleep(duration):
+
+    def handler(engine):
+        time.sleep(duration)
+
+    return handler
+
+
+def test_profiler_results():
+    true_dataflow_time = 0.01
+    true_processing_time = 0.02
+    true_handler_time = 0.001
+    num_iters = 5
+    max_epochs = 2
+
+    class Data(object):
+        def __iter__(self):
+            for i in range(num_iters):
+                time.sleep(true_dataflow_time)
+                yield i
+
+    def update(engine, batch):
+        time.sleep(true_processing_time)
+
+    engine = Engine(update)
+    profiler = HandlersTimeProfiler()
+    profiler.attach(engine)
+
+    engine.add_event_handler(Events.ITERATION_COMPLETED, _sleep(true_handler_time))
+    engine.add_event_handler(Events.EPOCH_COMPLETED, _sleep(50 * true_handler_time))
+    engine.add_event_handler(Events.ITERATION_COMPLETED(every=2), _sleep(0))
+    engine.run(Data(), max_epochs=max_epochs)
+
+    results = profiler.get_results()
+    total_iters = num_iters * max_epochs
+
+    assert results["dataflow"]["calls"] == total_iters
+    assert results["dataflow"]["min"] >= true_dataflow_time
+    assert results["processing"]["calls"] == total_iters
+    assert results["processing"]["total"] >= true_processing_time * total_iters
+    assert results["processing"]["min"] <= results["processing"]["mean"] <= results["processing"]["max"]
+
+    handlers = results["handlers"]
+    assert sorted((str(r["event"]), r["calls"]) for r in handlers if r["handler"].endswith("handler")) == [
+        (str(Events.EPOCH_COMPLETED), max_epochs),
+        (str(Events.ITERATION_COMPLETED), total_iters // 2),
+        (str(Events.ITERATION_COMPLETED), total_iters),
+    ]
+    assert handlers[0]["min"] >= 50 * true_handler_time
+    assert all(handlers[i]["total"] >= handlers[i + 1]["total"] for i in range(len(handlers) - 1))
+    # Profiler's own handler is recorded too
+    assert any(r["handler"] == "HandlersTimeProfiler._reset" for r in handlers)
+
+    output = profiler.print_results(results)
+    assert "Dataflow" in output and "Processing" in output and "Events.EPOCH_COMPLETED" in output
+
+
+def test_profiler_reset_on_started():
+    engine = Engine(lambda engine, batch: None)
+    profiler = HandlersTimeProfiler()
+    profiler.attach(engine)
+    engine.add_event_handler(Events.ITERATION_COMPLETED, lambda engine: None)
+
+    engine.run(list(range(10)))
+    engine.run(list(range(4)))
+    results = profiler.get_results()
+    assert results["dataflow"]["calls"] == 4
+    assert results["processing"]["calls"] == 4
+    assert [r["calls"] for r in results["handlers"] if r["event"] == Events.ITERATION_COMPLETED] == [4]
+
+
+def test_profiler_attach_detach():
+    engine = Engine(lambda engine, batch: None)
+
+    def handler(engine):
+        pass
+
+    engine.add_event_handler(Events.ITERATION_COMPLETED, handler)
+    dispatch_table = dict(engine._dispatch_table)
+
+    profiler = HandlersTimeProfiler()
+    profiler.attach(engine)
+    with pytest.raises(RuntimeError, match=r"already attached"):
+        profiler.attach(engine)
+
+    assert engine.has_event_handler(handler, Events.ITERATION_COMPLETED)
+    assert engine._dispatch_table[Events.ITERATION_COMPLETED][0][0] is not handler
+
+    profiler.detach()
+    assert engine._dispatch_table == dispatch_table
+    assert not engine.has_event_handler(profiler._reset)
+
+    engine.run(list(range(3)))
+    assert profiler.get_results()["dataflow"]["calls"] == 0
+
+
+def test_profiler_handler_exception():
+    engine = Engine(lambda engine, batch: None)
+    profiler = HandlersTimeProfiler()
+    profiler.attach(engine)
+
+    def raise_error(engine):
+        raise ValueError("Handler error")
+
+    engine.add_event_handler(Events.ITERATION_COMPLETED, raise_error)
+    with pytest.raises(ValueError, match=r"Handler error"):
+        engine.run([0, 1])
+    assert [r["calls"] for r in profiler.get_results()["handlers"] if r["handler"].endswith("raise_error")] == [1]
+
+
+def test_times_recorder():
+    true_dataflow_time = 0.02
+    true_processing_time = 0.01
+    true_handler_time = 0.005
+    num_iters = 5
+
+    class Data(object):
+        def __iter__(self):
+            for i in range(num_iters):
+                time.sleep(true_dataflow_time)
+                yield i
+
+    def update(engine, batch):
+        time.sleep(true_processing_time)
+
+    engine = Engine(update)
+
+    @engine.on(Events.STARTED)
+    def check_times_available(engine):
+        assert engine.state.times["dataflow"] == 0.
+
+    TimesRecorder().attach(engine)
+    engine.add_event_handler(Events.ITERATION_STARTED, _sleep(true_handler_time))
+
+    iteration_times = []
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def record(engine):
+        iteration_times.append(dict(engine.state.times))
+
+    engine.run(Data(), max_epochs=2)
+
+    assert len(iteration_times) == 2 * num_iters
+    for times in iteration_times:
+        assert times["iteration_dataflow"] >= true_dataflow_time
+        assert times["iteration_processing"] >= true_processing_time
+        assert times["iteration_handlers"] >= true_handler_time
+    assert all(t1["dataflow"] < t2["dataflow"] for t1, t2 in zip(iteration_times[:-1], iteration_times[1:]))
+
+    times = engine.state.times
+    assert times["dataflow"] == approx(sum(t["iteration_dataflow"] for t in iteration_times))
+    assert times["processing"] == approx(sum(t["iteration_processing"] for t in iteration_times))
+    assert times["handlers"] >= true_handler_time * 2 * num_iters
+    total = times["dataflow"] + times["processing"] + times["handlers"]
+    assert times["dataflow_fraction"] == approx(times["dataflow"] / total, abs=0.05)
+
+    # Times are reset on a new run
+    engine.run(Data(), max_epochs=1)
+    assert true_processing_time * num_iters <= engine.state.times["processing"] < times["processing"]
+
+
+def test_times_recorder_attach_detach():
+    engine = Engine(lambda engine, batch: None)
+    recorder = TimesRecorder()
+    recorder.attach(engine)
+    with pytest.raises(RuntimeError, match=r"already attached"):
+        recorder.attach(engine)
+
+    # Recorder and profiler can be used together
+    profiler = HandlersTimeProfiler()
+    profiler.attach(engine)
+    engine.run([0, 1, 2])
+    assert profiler.get_results()["dataflow"]["calls"] == 3
+    assert engine.state.times["dataflow"] > 0.
+
+    recorder.detach()
+    assert not engine.has_event_handler(recorder._reset)
+    engine.run([0, 1, 2])
+    assert not hasattr(engine.state, "times")
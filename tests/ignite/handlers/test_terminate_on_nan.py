@@ -1,5 +1,7 @@
 
+from mock import MagicMock
 import numpy as np
+import pytest
 import torch
 
 from ignite.engine import Engine, Events, State
@@ -122,3 +124,80 @@ def test_without_terminate_on_nan_inf():
 
     trainer.run(data, max_epochs=2)
     assert trainer.state.iteration == len(data) * 2
+
+
+def test_with_terminate_on_nan_check_every():
+
+    data = [torch.tensor(1.0)] * 5 + [torch.tensor(float("nan"))] + [torch.tensor(1.0)] * 10
+
+    def update_fn(engine, batch):
+        return batch
+
+    trainer = Engine(update_fn)
+    TerminateOnNan(check_every=4).attach(trainer)
+    trainer.run(data)
+    # NaN of the iteration 6 is read at the iteration 8
+    assert trainer.should_terminate
+    assert trainer.state.iteration == 8
+
+    # Numbers are checked immediately
+    trainer = Engine(update_fn)
+    TerminateOnNan(check_every=4).attach(trainer)
+    trainer.run([1.0, float("inf"), 1.0, 1.0])
+    assert trainer.state.iteration == 2
+
+
+def test_with_terminate_on_nan_check_every_last_iterations():
+
+    data = [torch.tensor(1.0)] * 5 + [torch.tensor(float("nan"))]
+
+    def update_fn(engine, batch):
+        return batch
+
+    trainer = Engine(update_fn)
+    TerminateOnNan(check_every=4).attach(trainer)
+    completed_epochs = []
+    trainer.add_event_handler(Events.EPOCH_COMPLETED, lambda engine: completed_epochs.append(engine.state.epoch))
+    trainer.run(data, max_epochs=3)
+    # NaN of the last iteration of the epoch is read at the end of the epoch
+    assert trainer.should_terminate
+    assert trainer.state.iteration == 6
+    assert completed_epochs == [1]
+
+    # NaN of the last iteration of a run terminated in the middle of an epoch
+    trainer = Engine(update_fn)
+    handler = TerminateOnNan(check_every=4)
+    handler._logger = MagicMock()
+    handler.attach(trainer)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED(once=6), lambda engine: engine.terminate())
+    trainer.run(data * 2)
+    assert trainer.state.iteration == 6
+    handler._logger.warning.assert_called_once()
+    assert "Output of iteration 6" in handler._logger.warning.call_args[0][0]
+
+
+def test_terminate_on_nan_wrong_check_every():
+    with pytest.raises(ValueError, match=r"check_every should be a positive integer"):
+        TerminateOnNan(check_every=0)
+
+    trainer = Engine(lambda engine, batch: batch)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED, TerminateOnNan(check_every=4))
+    with pytest.raises(RuntimeError, match=r"should be added to the engine with attach\(engine\)"):
+        trainer.run([torch.tensor(1.0)])
+
+
+def test_terminate_on_nan_attach():
+    trainer = Engine(lambda engine, batch: batch)
+    handler = TerminateOnNan(check_every=4)
+    handler.attach(trainer, Events.ITERATION_COMPLETED(every=2))
+    handler.attach(trainer)
+    assert trainer.has_event_handler(handler, Events.ITERATION_COMPLETED)
+    # The pending checks are read once per event, before the other handlers
+    for event_name in [Events.EPOCH_COMPLETED, Events.COMPLETED]:
+        assert [h for h, _, _, _ in trainer._event_handlers[event_name]].count(handler._read_pending_checks) == 1
+
+    # Checks only at the output events without pending checks
+    handler = TerminateOnNan()
+    trainer = Engine(lambda engine, batch: batch)
+    handler.attach(trainer)
+    assert not trainer.has_event_handler(handler._read_pending_checks)
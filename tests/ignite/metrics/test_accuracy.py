@@ -609,3 +609,29 @@ def test_incorrect_type():
 
     with pytest.raises(RuntimeError):
         acc.update((y_pred, y))
+
+
+def test_validate_inputs():
+    with pytest.raises(ValueError, match=r"Argument validate_inputs should be one of"):
+        Accuracy(validate_inputs="sometimes")
+
+    valid_batch = (torch.randint(0, 2, size=(10,)).long(), torch.randint(0, 2, size=(10,)).long())
+    invalid_batch = (torch.randint(0, 2, size=(10,)).long(), torch.randint(2, 4, size=(10,)).long())
+
+    acc = Accuracy(validate_inputs="always")
+    acc.update(valid_batch)
+    with pytest.raises(ValueError, match=r"For binary cases, y must be comprised of 0's and 1's."):
+        acc.update(invalid_batch)
+
+    acc = Accuracy()
+    acc.update(valid_batch)
+    acc.update(invalid_batch)
+    acc.reset()
+    with pytest.raises(ValueError, match=r"For binary cases, y must be comprised of 0's and 1's."):
+        acc.update(invalid_batch)
+
+    acc = Accuracy(validate_inputs="never")
+    acc.update(invalid_batch)
+    # Shapes are always checked
+    with pytest.raises(ValueError, match=r"y must have shape of"):
+        acc.update((torch.rand(10, 4, 3, 2), torch.randint(0, 2, size=(10,)).long()))
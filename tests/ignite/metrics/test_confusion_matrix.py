@@ -4,6 +4,7 @@ import torch
 import numpy as np
 from sklearn.metrics import confusion_matrix, accuracy_score, precision_score, recall_score
 
+from ignite.engine import Engine
 from ignite.exceptions import NotComputableError
 from ignite.metrics import ConfusionMatrix, IoU, mIoU
 from ignite.metrics.confusion_matrix import cmAccuracy, cmPrecision, cmRecall
@@ -199,6 +200,59 @@ def test_ignored_out_of_num_classes_indices():
     assert np.all(confusion_matrix(np_y, np_y_pred, labels=list(range(num_classes))) == cm.compute().numpy())
 
 
+def test_not_filtered_targets():
+    num_classes = 21
+    cm = ConfusionMatrix(num_classes=num_classes, filter_targets=False)
+
+    true_cm = 0
+    for _ in range(3):
+        y_pred = torch.rand(4, num_classes, 12, 10)
+        y = torch.randint(0, num_classes, size=(4, 12, 10)).int()
+        cm.update((y_pred, y))
+        np_y_pred = y_pred.numpy().argmax(axis=1).ravel()
+        np_y = y.numpy().ravel()
+        true_cm = true_cm + confusion_matrix(np_y, np_y_pred, labels=list(range(num_classes)))
+        assert np.all(true_cm == cm.compute().numpy())
+
+    y = torch.randint(0, 255, size=(4, 12, 10)).long()
+    y[0, 0, 0] = 254
+    with pytest.raises(ValueError, match=r"y should contain class indices in \[0, 21\), but given a maximal index"):
+        cm.update((y_pred, y))
+
+
+def _test_cm_device(device):
+    num_classes = 5
+    y_pred = torch.rand(4, num_classes, 12, 10)
+    y = torch.randint(0, 8, size=(4, 12, 10)).long()
+    np_y_pred = y_pred.numpy().argmax(axis=1).ravel()
+    np_y = y.numpy().ravel()
+    true_cm = confusion_matrix(np_y, np_y_pred, labels=list(range(num_classes)))
+
+    for cm_device in (None, "cpu", device):
+        cm = ConfusionMatrix(num_classes=num_classes, device=cm_device)
+        cm.update((y_pred.to(device), y.to(device)))
+        expected_device = torch.device(cm_device if cm_device is not None else device)
+        assert cm.confusion_matrix.device.type == expected_device.type
+        res = cm.compute()
+        assert res.device.type == "cpu"
+        assert np.all(true_cm == res.numpy())
+
+    cm = ConfusionMatrix(num_classes=num_classes, average="samples", device=None)
+    cm.update((y_pred.to(device), y.to(device)))
+    np.testing.assert_almost_equal(true_cm / len(y), cm.compute().numpy())
+    # Local state is kept as integers
+    assert cm.confusion_matrix.dtype == torch.int64
+
+
+def test_cm_device():
+    _test_cm_device("cpu")
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="Skip if no GPU")
+def test_cm_device_cuda():
+    _test_cm_device("cuda")
+
+
 def get_y_true_y_pred():
     # Generate an image with labels 0 (background), 1, 2
     # 3 classes:
@@ -450,6 +504,47 @@ def test_cm_recall():
     assert np.all(res == true_re)
 
 
+def test_cm_metrics_computed_once():
+
+    class CountingConfusionMatrix(ConfusionMatrix):
+
+        num_computes = 0
+
+        def compute(self):
+            CountingConfusionMatrix.num_computes += 1
+            return super(CountingConfusionMatrix, self).compute()
+
+    th_y_logits = torch.rand(10, 3, 12, 10)
+    th_y_true = torch.randint(0, 3, size=(10, 12, 10)).long()
+    y_true = th_y_true.numpy()
+    y_pred = torch.argmax(th_y_logits, dim=1).numpy()
+
+    def process_function(engine, batch):
+        return batch
+
+    engine = Engine(process_function)
+    cm = CountingConfusionMatrix(num_classes=3)
+    cm.attach(engine, "cm")
+    IoU(cm).attach(engine, "IoU")
+    mIoU(cm).attach(engine, "mIoU")
+    cmAccuracy(cm).attach(engine, "accuracy")
+    cmPrecision(cm, average=False).attach(engine, "precision")
+    cmRecall(cm, average=False).attach(engine, "recall")
+
+    engine.run([(th_y_logits, th_y_true)], max_epochs=2)
+    # Computed once per epoch and shared by all the metrics
+    assert CountingConfusionMatrix.num_computes == 2
+
+    np_y_true = y_true.reshape(-1)
+    np_y_pred = y_pred.reshape(-1)
+    assert engine.state.metrics["cm"].numpy() == pytest.approx(confusion_matrix(np_y_true, np_y_pred))
+    assert engine.state.metrics["accuracy"] == pytest.approx(accuracy_score(np_y_true, np_y_pred))
+    assert engine.state.metrics["precision"].numpy() == pytest.approx(
+        precision_score(np_y_true, np_y_pred, average=None))
+    assert engine.state.metrics["recall"].numpy() == pytest.approx(recall_score(np_y_true, np_y_pred, average=None))
+    assert engine.state.metrics["mIoU"] == pytest.approx(engine.state.metrics["IoU"].mean().item())
+
+
 def test_cm_with_average():
     num_classes = 5
     y_pred = torch.rand(20, num_classes)
@@ -1,3 +1,4 @@
+import os
 from ignite.metrics import EpochMetric
 import torch
 import pytest
@@ -111,3 +112,259 @@ def test_bad_compute_fn():
     output1 = (torch.rand(4, 3), torch.randint(0, 2, size=(4, 3), dtype=torch.long))
     with pytest.warns(RuntimeWarning):
         em.update(output1)
+
+
+def _sum_compute_fn(y_preds, y_targets):
+    # Depends on the order of the samples
+    weights = torch.arange(1, len(y_preds) + 1, dtype=torch.float32)
+    if y_preds.ndimension() == 2:
+        weights = weights.unsqueeze(1)
+    return (weights * y_preds).sum().item() + (weights * y_targets.float()).sum().item()
+
+
+def _create_epoch_data(n_samples, n_classes):
+    torch.manual_seed(12)
+    if n_classes == 1:
+        return torch.rand(n_samples), torch.randint(0, 2, size=(n_samples,))
+    return torch.rand(n_samples, n_classes), torch.randint(0, 2, size=(n_samples, n_classes))
+
+
+def _run_dist_epoch_metric(rank, world_size, init_method, results):
+    import torch.distributed as dist
+
+    dist.init_process_group("gloo", init_method=init_method, rank=rank, world_size=world_size)
+    for n_classes in (1, 3):
+        # Uneven and empty shards
+        for sizes in ([7, 16], [0, 23]):
+            y_pred, y = _create_epoch_data(sum(sizes), n_classes)
+            start = sum(sizes[:rank])
+            for compute_on_rank_zero in (False, True):
+                em = EpochMetric(_sum_compute_fn, compute_on_rank_zero=compute_on_rank_zero)
+                for i in range(start, start + sizes[rank], 5):
+                    end = min(i + 5, start + sizes[rank])
+                    em.update((y_pred[i:end], y[i:end]))
+                results[(rank, n_classes, tuple(sizes), compute_on_rank_zero)] = em.compute()
+    dist.destroy_process_group()
+
+
+def test_distributed_epoch_metric(tmpdir):
+    import torch.distributed as dist
+    import torch.multiprocessing as mp
+
+    if not dist.is_available():
+        pytest.skip("Skip if torch.distributed is not available")
+
+    world_size = 2
+    init_method = "file://{}".format(tmpdir.join("dist_init"))
+    results = mp.Manager().dict()
+    mp.spawn(_run_dist_epoch_metric, args=(world_size, init_method, results), nprocs=world_size)
+
+    for n_classes in (1, 3):
+        for sizes in ([7, 16], [0, 23]):
+            expected = _sum_compute_fn(*_create_epoch_data(sum(sizes), n_classes))
+            for rank in range(world_size):
+                for compute_on_rank_zero in (False, True):
+                    result = results[(rank, n_classes, tuple(sizes), compute_on_rank_zero)]
+                    assert result == pytest.approx(expected), (rank, n_classes, sizes, compute_on_rank_zero)
+
+
+def test_epoch_metric_chunks():
+
+    def compute_fn(y_preds, y_targets):
+        return y_preds, y_targets
+
+    em = EpochMetric(compute_fn)
+    y_pred = torch.rand(50, 3)
+    y = torch.randint(0, 2, size=(50, 3)).long()
+    for i in range(0, 50, 4):
+        y_pred_batch, y_batch = y_pred[i:i + 4].clone(), y[i:i + 4].clone()
+        em.update((y_pred_batch, y_batch))
+        # Stored values are not affected by in-place modifications of the inputs
+        y_pred_batch.zero_()
+        y_batch.zero_()
+
+    preds, targets = em.compute()
+    assert torch.equal(preds, y_pred) and torch.equal(targets, y)
+    # Chunks are concatenated once
+    assert len(em._predictions_storage.chunks) == 1 and len(em._targets_storage.chunks) == 1
+    assert em.compute()[0] is preds
+
+    em.update((torch.rand(2, 3), torch.ones(2, 3).long()))
+    preds, targets = em.compute()
+    assert preds.shape == (52, 3) and torch.equal(targets[-2:], torch.ones(2, 3).long())
+
+    em.reset()
+    preds, targets = em.compute()
+    assert preds.dtype == torch.float32 and targets.dtype == torch.long and len(preds) == 0
+
+
+def test_epoch_metric_wrong_batch_shape():
+    em = EpochMetric(lambda y_preds, y_targets: 0.0)
+    em.update((torch.rand(4, 3), torch.randint(0, 2, size=(4, 3)).long()))
+    with pytest.raises(ValueError, match=r"Shape of the batches should be \(batch_size, 3\)"):
+        em.update((torch.rand(4, 2), torch.randint(0, 2, size=(4, 2)).long()))
+
+
+def test_epoch_metric_spill(tmpdir):
+    def compute_fn(y_preds, y_targets):
+        return y_preds, y_targets
+
+    with pytest.raises(ValueError, match=r"spill_threshold should be a non-negative integer"):
+        EpochMetric(compute_fn, spill_threshold=-1)
+
+    spill_dir = str(tmpdir)
+    # 4 batches of 4 * 3 * (4 + 8) bytes are kept in memory
+    em = EpochMetric(compute_fn, spill_threshold=4 * 4 * 3 * 12, spill_dir=spill_dir)
+    y_pred = torch.rand(50, 3)
+    y = torch.randint(0, 2, size=(50, 3)).long()
+
+    for i in range(0, 16, 4):
+        em.update((y_pred[i:i + 4], y[i:i + 4]))
+    assert em._spill_tmpdir is None
+    preds, targets = em.compute()
+    assert torch.equal(preds, y_pred[:16]) and torch.equal(targets, y[:16])
+
+    for i in range(16, 50, 4):
+        em.update((y_pred[i:i + 4], y[i:i + 4]))
+        assert em._spill_tmpdir is not None and len(em._predictions_storage.chunks) == 0
+        assert len(tmpdir.listdir()) == 1
+        preds, targets = em.compute()
+        assert torch.equal(preds, y_pred[:i + 4]) and torch.equal(targets, y[:i + 4])
+
+    # Spilled data is stored in the files only
+    assert os.path.getsize(em._predictions_storage.path) == y_pred.numel() * 4
+    assert os.path.getsize(em._targets_storage.path) == y.numel() * 8
+    assert preds.dtype == torch.float32 and targets.dtype == torch.long
+    # Modifying the tensors does not modify the stored data
+    preds.zero_()
+    assert torch.equal(em.compute()[0], y_pred)
+
+    em.reset()
+    assert len(tmpdir.listdir()) == 0
+    assert len(em.compute()[0]) == 0
+
+    # Zero threshold spills at the first update, spilled files are removed with the metric
+    em = EpochMetric(compute_fn, spill_threshold=0, spill_dir=spill_dir)
+    em.update((y_pred[:4, 0], y[:4, 0]))
+    assert torch.equal(em.compute()[1], y[:4, 0])
+    assert len(tmpdir.listdir()) == 1
+    del em, preds, targets
+    import gc
+    gc.collect()
+    assert len(tmpdir.listdir()) == 0
+
+
+def test_epoch_metric_validate_inputs():
+
+    calls = []
+
+    def compute_fn(y_preds, y_targets):
+        calls.append(len(y_preds))
+        return 0.0
+
+    with pytest.raises(ValueError, match=r"Argument validate_inputs should be one of"):
+        EpochMetric(compute_fn, validate_inputs="once")
+
+    valid_batch = (torch.rand(4, 3), torch.randint(0, 2, size=(4, 3)).long())
+    invalid_batch = (torch.rand(4, 3), torch.randint(2, 4, size=(4, 3)).long())
+
+    em = EpochMetric(compute_fn, validate_inputs="always")
+    em.update(valid_batch)
+    with pytest.raises(ValueError, match=r"Targets should be binary \(0 or 1\)."):
+        em.update(invalid_batch)
+    assert calls == [4]
+
+    em = EpochMetric(compute_fn)
+    with pytest.raises(ValueError, match=r"Targets should be binary \(0 or 1\)."):
+        em.update(invalid_batch)
+    em.update(valid_batch)
+    em.update(invalid_batch)
+    assert calls == [4, 4]
+
+    del calls[:]
+    em = EpochMetric(compute_fn, validate_inputs="never")
+    em.update(invalid_batch)
+    assert calls == []
+    assert em.compute() == 0.0
+    assert calls == [4]
+
+
+def test_epoch_metric_merge(tmpdir):
+
+    def compute_fn(y_preds, y_targets):
+        return torch.stack([y_preds.sum(), y_targets.sum().float(), torch.tensor(float(len(y_targets)))])
+
+    torch.manual_seed(0)
+    y_pred = torch.rand(30, 3)
+    y = torch.randint(0, 2, size=(30, 3)).long()
+
+    em = EpochMetric(compute_fn)
+    em.update((y_pred, y))
+    expected = em.compute()
+
+    em1 = EpochMetric(compute_fn)
+    em1.update((y_pred[:10], y[:10]))
+    # Spilled to the disk
+    em2 = EpochMetric(compute_fn, spill_threshold=0, spill_dir=str(tmpdir))
+    em2.update((y_pred[10:], y[10:]))
+    em3 = EpochMetric(compute_fn, spill_threshold=0, spill_dir=str(tmpdir))
+    em3.merge(em1)
+    em3.merge(EpochMetric(compute_fn))
+    em3.merge(em2.state_dict())
+    assert torch.allclose(em3.compute(), expected)
+
+    # Resumed
+    state_dict = em1.state_dict()
+    em4 = EpochMetric(compute_fn)
+    em4.load_state_dict(state_dict)
+    em4.update((y_pred[10:], y[10:]))
+    assert torch.allclose(em4.compute(), expected)
+    assert state_dict["_predictions"].shape == (10, 3)
+
+
+class _CustomError(Exception):
+    pass
+
+
+def _run_dist_epoch_metric_failing_compute_fn(rank, world_size, init_method, results):
+    import torch.distributed as dist
+
+    def single_class_compute_fn(y_pred, y):
+        raise ValueError("Only one class present in y_true")
+
+    def custom_error_compute_fn(y_pred, y):
+        raise _CustomError("custom error")
+
+    dist.init_process_group("gloo", init_method=init_method, rank=rank, world_size=world_size)
+    y_pred, y = _create_epoch_data(8, 1)
+    for name, compute_fn in [("single_class", single_class_compute_fn), ("custom", custom_error_compute_fn),
+                             ("not_number", lambda y_pred, y: y_pred), ("sum", _sum_compute_fn)]:
+        em = EpochMetric(compute_fn, compute_on_rank_zero=True)
+        em.update((y_pred[4 * rank:4 * rank + 4], y[4 * rank:4 * rank + 4]))
+        try:
+            results[(rank, name)] = em.compute()
+        except Exception as e:
+            results[(rank, name)] = (type(e).__name__, str(e))
+    dist.destroy_process_group()
+
+
+def test_distributed_epoch_metric_failing_compute_fn(tmpdir):
+    import torch.distributed as dist
+    import torch.multiprocessing as mp
+
+    if not dist.is_available():
+        pytest.skip("Skip if torch.distributed is not available")
+
+    world_size = 2
+    init_method = "file://{}".format(tmpdir.join("dist_init"))
+    results = mp.Manager().dict()
+    mp.spawn(_run_dist_epoch_metric_failing_compute_fn, args=(world_size, init_method, results), nprocs=world_size)
+
+    # The error raised on rank 0 is raised in all the processes, which can then compute other metrics
+    for rank in range(world_size):
+        assert results[(rank, "single_class")] == ("ValueError", "Only one class present in y_true")
+        assert results[(rank, "not_number")][0] == "TypeError"
+        assert "compute_fn should return a number" in results[(rank, "not_number")][1]
+        assert results[(rank, "sum")] == pytest.approx(_sum_compute_fn(*_create_epoch_data(8, 1)))
+    assert results[(0, "custom")] == ("_CustomError", "custom error")
+    assert results[(1, "custom")] == ("RuntimeError", "_CustomError raised in the process of rank 0: custom error")
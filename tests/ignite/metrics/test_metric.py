@@ -1,9 +1,11 @@
+import itertools
 import sys
 from ignite.metrics import Metric, Precision, Recall, ConfusionMatrix
-from ignite.engine import Engine, State
+from ignite.engine import Engine, Events, State
 import torch
 from mock import MagicMock
 
+import pytest
 from pytest import approx, raises
 import numpy as np
 from sklearn.metrics import precision_score, recall_score, f1_score, confusion_matrix
@@ -266,7 +268,8 @@ def test_attach():
     assert m1.update_count == 50
 
     assert m2.reset_count == 5
-    assert m2.compute_count == 10
+    # Computed once per epoch for both names
+    assert m2.compute_count == 5
     assert m2.update_count == 50
 
 
@@ -445,3 +448,319 @@ def test_indexing_metric():
     _test(ConfusionMatrix(num_classes), confusion_matrix, {'labels': labels}, index=np.ix_(labels, labels))
     labels = [1]
     _test(ConfusionMatrix(num_classes), confusion_matrix, {'labels': labels}, index=np.ix_(labels, labels))
+
+
+def _create_dist_metrics():
+    from ignite.metrics import Accuracy, Loss, MeanPairwiseDistance, MeanSquaredError, TopKCategoricalAccuracy
+    from ignite.metrics import Average
+
+    def mse_output_transform(output):
+        y_pred, y = output
+        return y_pred, torch.nn.functional.one_hot(y, 4).to(y_pred)
+
+    return {
+        "accuracy": Accuracy(),
+        "loss": Loss(torch.nn.functional.cross_entropy),
+        "cm": ConfusionMatrix(num_classes=4),
+        "precision": Precision(average=False),
+        "recall": Recall(average=True),
+        "top2": TopKCategoricalAccuracy(k=2),
+        "mpd": MeanPairwiseDistance(output_transform=mse_output_transform),
+        "mse": MeanSquaredError(output_transform=mse_output_transform),
+        "average": Average(output_transform=lambda output: output[0]),
+    }
+
+
+def _create_dist_data(rank=None, world_size=1):
+    torch.manual_seed(12)
+    y_pred = torch.rand(40, 4)
+    y = torch.randint(0, 4, size=(40,))
+    if rank is not None:
+        # Uneven shards, and an empty shard with 3 processes
+        sizes = {1: [40], 2: [12, 28], 3: [12, 0, 28]}[world_size]
+        start = sum(sizes[:rank])
+        y_pred, y = y_pred[start:start + sizes[rank]], y[start:start + sizes[rank]]
+    return [batch for batch in zip(torch.split(y_pred, 4), torch.split(y, 4)) if len(batch[1]) > 0]
+
+
+def _run_dist_metrics(rank, world_size, init_method, results):
+    import torch.distributed as dist
+
+    dist.init_process_group("gloo", init_method=init_method, rank=rank, world_size=world_size)
+    engine = Engine(lambda engine, batch: batch)
+    for name, metric in _create_dist_metrics().items():
+        metric.attach(engine, name)
+    state = engine.run(_create_dist_data(rank, world_size))
+    results[rank] = state.metrics
+    dist.destroy_process_group()
+
+
+def _assert_metrics_close(metrics, expected_metrics):
+    assert set(metrics) == set(expected_metrics)
+    for name, expected in expected_metrics.items():
+        if isinstance(expected, torch.Tensor):
+            assert torch.allclose(metrics[name].double(), expected.double()), name
+        else:
+            assert metrics[name] == approx(expected), name
+
+
+@pytest.mark.parametrize("world_size", [2, 3])
+def test_distributed_all_reduce(tmpdir, world_size):
+    import torch.distributed as dist
+    import torch.multiprocessing as mp
+
+    if not dist.is_available():
+        pytest.skip("Skip if torch.distributed is not available")
+
+    engine = Engine(lambda engine, batch: batch)
+    for name, metric in _create_dist_metrics().items():
+        metric.attach(engine, name)
+    expected_metrics = engine.run(_create_dist_data()).metrics
+
+    init_method = "file://{}".format(tmpdir.join("dist_init"))
+    results = mp.Manager().dict()
+    mp.spawn(_run_dist_metrics, args=(world_size, init_method, results), nprocs=world_size)
+
+    for rank in range(world_size):
+        _assert_metrics_close(results[rank], expected_metrics)
+
+
+def _run_dist_lazy_attach(rank, world_size, init_method, results):
+    import torch.distributed as dist
+    from ignite.metrics import Accuracy
+
+    dist.init_process_group("gloo", init_method=init_method, rank=rank, world_size=world_size)
+    engine = Engine(lambda engine, batch: batch)
+    Accuracy().attach(engine, "accuracy", lazy=True)
+    state = engine.run(_create_dist_data(rank, world_size))
+    # Computed at EPOCH_COMPLETED with all the processes, although the process 0 only reads it
+    if rank == 0:
+        results[rank] = state.metrics["accuracy"]
+    dist.destroy_process_group()
+
+
+def test_distributed_lazy_attach(tmpdir):
+    import torch.distributed as dist
+    import torch.multiprocessing as mp
+    from ignite.metrics import Accuracy
+
+    if not dist.is_available():
+        pytest.skip("Skip if torch.distributed is not available")
+
+    engine = Engine(lambda engine, batch: batch)
+    Accuracy().attach(engine, "accuracy")
+    expected = engine.run(_create_dist_data()).metrics["accuracy"]
+
+    init_method = "file://{}".format(tmpdir.join("dist_init"))
+    results = mp.Manager().dict()
+    mp.spawn(_run_dist_lazy_attach, args=(2, init_method, results), nprocs=2)
+    assert results[0] == approx(expected)
+
+
+def _run_dist_all_reduce_values(rank, world_size, init_method, values, op, results):
+    import torch.distributed as dist
+    from ignite.metrics.metric import _all_reduce_values
+
+    dist.init_process_group("gloo", init_method=init_method, rank=rank, world_size=world_size)
+    try:
+        results[rank] = _all_reduce_values(values[rank], op)
+    except ValueError as e:
+        results[rank] = e
+    dist.destroy_process_group()
+
+
+def test_distributed_all_reduce_values(tmpdir):
+    import torch.distributed as dist
+    import torch.multiprocessing as mp
+
+    if not dist.is_available():
+        pytest.skip("Skip if torch.distributed is not available")
+
+    # The file of a process group is removed when it is destroyed, a new one is used for each run
+    num_runs = itertools.count()
+
+    def _run(values, op="sum"):
+        init_method = "file://{}".format(tmpdir.join("dist_init_{}".format(next(num_runs))))
+        results = mp.Manager().dict()
+        mp.spawn(_run_dist_all_reduce_values, args=(len(values), init_method, values, op, results),
+                 nprocs=len(values))
+        return [results[rank] for rank in range(len(values))]
+
+    # Numbers and 0-dimensional tensors are broadcast to the tensors of the other processes
+    results = _run([[0, 2, torch.tensor([1., 2.]), torch.tensor(1.)],
+                    [torch.tensor([3., 4.]), 3, 0, torch.ones(2, 3)],
+                    [1, torch.tensor(1), torch.tensor([0., 1.]), torch.tensor(0.)]])
+    for reduced in results:
+        assert torch.equal(reduced[0].double(), torch.tensor([4., 5.], dtype=torch.float64))
+        assert reduced[1] == 6
+        assert torch.equal(reduced[2].double(), torch.tensor([1., 3.], dtype=torch.float64))
+        assert torch.equal(reduced[3].double(), torch.full((2, 3), 2., dtype=torch.float64))
+
+    # Maximum and minimum, and numbers returned as tensors if the value is a tensor in another process
+    values = [[-1, torch.tensor([1., 5.]), 2.5], [torch.tensor(3.), torch.tensor([4., 0.]), 1]]
+    for op, expected in [("max", [3., [4., 5.], 2.5]), ("min", [-1., [1., 0.], 1])]:
+        for reduced in _run(values, op):
+            assert torch.is_tensor(reduced[0]) and reduced[0].dim() == 0 and reduced[0].item() == expected[0]
+            assert reduced[1].tolist() == expected[1]
+            assert reduced[2] == expected[2]
+
+    # Tensors of different shapes in the processes are rejected in all the processes
+    for values in [[[torch.zeros(2)], [torch.zeros(3)]], [[torch.zeros(2, 3)], [torch.zeros(3, 2)]]]:
+        for e in _run(values):
+            assert isinstance(e, ValueError) and "same shape in all the processes" in str(e)
+
+
+def test_sync_all_reduce_wrong_op():
+    from ignite.metrics.metric import sync_all_reduce
+
+    with raises(ValueError, match=r"Argument op should be one of"):
+        sync_all_reduce("_sum", op="mean")
+
+    with raises(TypeError, match=r"Unexpected keyword arguments"):
+        sync_all_reduce("_sum", reduction="max")
+
+
+def test_all_reduced_local_values():
+    from ignite.metrics import Accuracy
+
+    # Out of a distributed group, the local values are used
+    accuracy = Accuracy()
+    accuracy.update((torch.tensor([[0.1, 0.9], [0.8, 0.2]]), torch.tensor([1, 1])))
+    assert accuracy.compute() == approx(0.5)
+    assert accuracy._num_correct == 1 and accuracy._num_examples == 2
+
+
+def _compute_metrics(metrics):
+    results = {}
+    for name, metric in metrics.items():
+        result = metric.compute()
+        if torch.is_tensor(result) and len(result.shape) == 0:
+            result = result.item()
+        results[name] = result
+    return results
+
+
+def _update_metrics(metrics, data):
+    for batch in data:
+        for metric in metrics.values():
+            metric.update(metric._output_transform(batch))
+
+
+def test_merge():
+    expected_metrics = _create_dist_metrics()
+    _update_metrics(expected_metrics, _create_dist_data())
+    expected_metrics = _compute_metrics(expected_metrics)
+
+    # Metrics updated with uneven shards, merged as metrics or as state dictionaries
+    shards = [_create_dist_metrics() for _ in range(3)]
+    for rank, metrics in enumerate(shards[:2]):
+        _update_metrics(metrics, _create_dist_data(rank, 2))
+    for name, metric in shards[2].items():
+        metric.merge(shards[0][name])
+        metric.merge(shards[1][name].state_dict())
+    _assert_metrics_close(_compute_metrics(shards[2]), expected_metrics)
+
+
+def test_load_state_dict():
+    expected_metrics = _create_dist_metrics()
+    _update_metrics(expected_metrics, _create_dist_data())
+    expected_metrics = _compute_metrics(expected_metrics)
+
+    data = _create_dist_data()
+    metrics = _create_dist_metrics()
+    _update_metrics(metrics, data[:3])
+    state_dicts = {name: metric.state_dict() for name, metric in metrics.items()}
+    # The saved states are not modified by the next updates
+    _update_metrics(metrics, data[3:])
+
+    resumed_metrics = _create_dist_metrics()
+    for name, metric in resumed_metrics.items():
+        metric.load_state_dict(state_dicts[name])
+    _update_metrics(resumed_metrics, data[3:])
+    _assert_metrics_close(_compute_metrics(resumed_metrics), expected_metrics)
+
+
+def test_merge_wrong_inputs():
+    from ignite.metrics import Accuracy
+
+    accuracy = Accuracy()
+    with raises(TypeError, match=r"Argument other should be a"):
+        accuracy.merge(Precision())
+
+    with raises(TypeError, match=r"Argument state_dict should be a dictionary"):
+        accuracy.merge([0, 1])
+
+    with raises(ValueError, match=r"Required keys \['_num_correct'\] are absent"):
+        accuracy.load_state_dict({"_type": None, "_num_classes": None, "_num_examples": 0})
+
+    accuracy.update((torch.tensor([[0.1, 0.9], [0.8, 0.2]]), torch.tensor([1, 1])))
+    other = Accuracy()
+    other.update((torch.tensor([1, 0]), torch.tensor([1, 1])))
+    with raises(RuntimeError, match=r"Input data type has changed"):
+        accuracy.merge(other)
+
+
+def test_deepcopy():
+    import copy
+    from ignite.metrics import Accuracy
+
+    accuracy = Accuracy()
+    accuracy.update((torch.tensor([[0.1, 0.9], [0.8, 0.2]]), torch.tensor([1, 1])))
+    accuracy_copy = copy.deepcopy(accuracy)
+    assert isinstance(accuracy_copy, Accuracy)
+    accuracy_copy.update((torch.tensor([[0.1, 0.9]]), torch.tensor([1])))
+    assert accuracy.compute() == approx(0.5)
+    assert accuracy_copy.compute() == approx(2.0 / 3.0)
+
+
+def test_lazy_attach():
+
+    class CountMetric(Metric):
+        def __init__(self):
+            self.compute_count = 0
+            super(CountMetric, self).__init__()
+
+        def reset(self):
+            self.sum = 0
+
+        def update(self, output):
+            self.sum += output
+
+        def compute(self):
+            self.compute_count += 1
+            return torch.tensor(self.sum)
+
+    engine = Engine(lambda e, b: b)
+    eager = CountMetric()
+    lazy = CountMetric()
+    lazy_lambda = lazy * 2
+    eager.attach(engine, "eager")
+    lazy.attach(engine, "lazy", lazy=True)
+    lazy_lambda.attach(engine, "lazy_lambda", lazy=True)
+
+    @engine.on(Events.EPOCH_COMPLETED)
+    def read_every_other_epoch(engine):
+        if engine.state.epoch % 2 == 0:
+            assert engine.state.metrics["lazy"] == 6
+            assert engine.state.metrics["lazy"] == 6
+
+    engine.run([1, 2, 3], max_epochs=4)
+
+    assert eager.compute_count == 4
+    # Computed at the epochs 2 and 4 only, once per epoch
+    assert lazy.compute_count == 2
+
+    metrics = engine.state.metrics
+    assert sorted(metrics) == ["eager", "lazy", "lazy_lambda"]
+    assert "lazy_lambda" in metrics
+    assert "<not computed>" in repr(metrics)
+    # Computed at the first access after the run, reusing the computed result of `lazy`
+    assert metrics["lazy_lambda"] == 12
+    assert lazy.compute_count == 2
+    assert dict(metrics) == {"eager": 6, "lazy": 6, "lazy_lambda": 12}
+
+    # Not read values are discarded when the metrics are reset
+    engine.run([1, 2], max_epochs=1)
+    eager.started(engine)
+    assert "lazy" not in engine.state.metrics
+    assert engine.state.metrics["eager"] == 3
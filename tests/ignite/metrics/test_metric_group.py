@@ -0,0 +1,121 @@
+import pytest
+import torch
+
+from ignite.engine import Engine, Events
+from ignite.metrics import Accuracy, ConfusionMatrix, Loss, MetricGroup, Precision, Recall
+
+
+torch.manual_seed(12)
+
+
+def _create_metrics(num_classes=None, is_multilabel=False):
+    metrics = {
+        "accuracy": Accuracy(is_multilabel=is_multilabel),
+        "precision": Precision(average=False, is_multilabel=is_multilabel),
+        "recall": Recall(average=False, is_multilabel=is_multilabel),
+        "avg_precision": Precision(average=True, is_multilabel=is_multilabel),
+        "avg_recall": Recall(average=True, is_multilabel=is_multilabel),
+    }
+    if num_classes is not None:
+        metrics["cm"] = ConfusionMatrix(num_classes=num_classes)
+    return metrics
+
+
+def _assert_results_equal(group_results, expected_results):
+    assert set(group_results.keys()) == set(expected_results.keys())
+    for name, expected in expected_results.items():
+        result = group_results[name]
+        if isinstance(expected, torch.Tensor):
+            assert torch.allclose(result.double(), expected.double()), name
+        else:
+            assert result == pytest.approx(expected), name
+
+
+def _test_group(batches, num_classes=None, is_multilabel=False):
+    metrics = _create_metrics(num_classes, is_multilabel)
+    group = MetricGroup(_create_metrics(num_classes, is_multilabel))
+    group.reset()
+    for batch in batches:
+        for metric in metrics.values():
+            metric.update(batch)
+        group.update(batch)
+    _assert_results_equal(group.compute(), {name: metric.compute() for name, metric in metrics.items()})
+
+
+def test_binary():
+    batches = [(torch.randint(0, 2, size=(10,)).long(), torch.randint(0, 2, size=(10,)).long()) for _ in range(3)]
+    _test_group(batches)
+    batches = [(torch.randint(0, 2, size=(10, 1, 5)).float(), torch.randint(0, 2, size=(10, 5)).long())
+               for _ in range(3)]
+    _test_group(batches)
+
+
+def test_multiclass():
+    batches = [(torch.rand(10, 4), torch.randint(0, 4, size=(10,)).long()) for _ in range(3)]
+    _test_group(batches, num_classes=4)
+    batches = [(torch.rand(4, 5, 12, 10), torch.randint(0, 5, size=(4, 12, 10)).long()) for _ in range(3)]
+    _test_group(batches, num_classes=5)
+
+
+def test_multilabel():
+    batches = [(torch.randint(0, 2, size=(10, 4, 3)).long(), torch.randint(0, 2, size=(10, 4, 3)).long())
+               for _ in range(3)]
+    _test_group(batches, is_multilabel=True)
+
+
+def test_wrong_inputs():
+    with pytest.raises(TypeError):
+        MetricGroup([Accuracy()])
+
+    with pytest.raises(TypeError):
+        MetricGroup({"accuracy": Accuracy(), "other": 1})
+
+    group = MetricGroup({"accuracy": Accuracy(), "precision": Precision()})
+    with pytest.raises(ValueError, match=r"For binary cases, y must be comprised of 0's and 1's."):
+        group.update((torch.randint(0, 2, size=(10,)).long(), torch.randint(0, 3, size=(10,)).long()))
+
+    group.reset()
+    with pytest.raises(ValueError, match=r"y_pred contains less classes than y."):
+        group.update((torch.rand(10, 4), torch.tensor([0, 1, 2, 3, 4, 0, 1, 2, 3, 0])))
+
+    group.reset()
+    group.update((torch.rand(10, 4), torch.randint(0, 4, size=(10,)).long()))
+    with pytest.raises(RuntimeError, match=r"Input data type has changed from multiclass to binary."):
+        group.update((torch.randint(0, 2, size=(10,)).long(), torch.randint(0, 2, size=(10,)).long()))
+
+
+def test_integration():
+    n_iters = 10
+    batch_size = 8
+    num_classes = 5
+    y_preds = torch.rand(n_iters, batch_size, num_classes)
+    y_true = torch.randint(0, num_classes, size=(n_iters, batch_size)).long()
+
+    def update_fn(engine, i):
+        return {"y_pred": y_preds[i], "y": y_true[i]}
+
+    def output_transform(output):
+        return output["y_pred"], output["y"]
+
+    metrics = _create_metrics(num_classes)
+    precision, recall = metrics["precision"], metrics["recall"]
+    metrics["f1"] = (precision * recall * 2 / (precision + recall + 1e-20)).mean()
+    # Metric with its own update
+    metrics["loss"] = Loss(torch.nn.functional.cross_entropy)
+
+    engine = Engine(update_fn)
+    MetricGroup(metrics, output_transform=output_transform).attach(engine)
+    assert len(engine._event_handlers[Events.ITERATION_COMPLETED]) == 1
+    state = engine.run(list(range(n_iters)), max_epochs=2)
+
+    expected_metrics = _create_metrics(num_classes)
+    precision, recall = expected_metrics["precision"], expected_metrics["recall"]
+    expected_metrics["f1"] = (precision * recall * 2 / (precision + recall + 1e-20)).mean()
+    expected_metrics["loss"] = Loss(torch.nn.functional.cross_entropy)
+    engine = Engine(update_fn)
+    for name, metric in expected_metrics.items():
+        metric._output_transform = output_transform
+        metric.attach(engine, name)
+    expected_state = engine.run(list(range(n_iters)), max_epochs=2)
+
+    _assert_results_equal(state.metrics, expected_state.metrics)
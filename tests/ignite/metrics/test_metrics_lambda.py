@@ -1,4 +1,4 @@
-from ignite.engine import Engine
+from ignite.engine import Engine, Events
 from ignite.metrics import Metric, MetricsLambda, Precision, Recall
 from pytest import approx
 from sklearn.metrics import precision_score, recall_score, f1_score
@@ -292,3 +292,116 @@ def test_recursive_attachment():
         return 2.0 + 0.2 * (p1 * p2 + p1 - p2) ** 0.5
 
     _test(some_metric, "some metric", compute_true_somemetric)
+
+
+class CountingMetric(ListGatherMetric):
+
+    def __init__(self, index):
+        self.num_computes = 0
+        super(CountingMetric, self).__init__(index)
+
+    def compute(self):
+        self.num_computes += 1
+        return super(CountingMetric, self).compute()
+
+
+def test_memoized_compute():
+    m0 = CountingMetric(0)
+    m1 = CountingMetric(1)
+    s = m0 + m1
+    f = s * s + m0 / m1
+    m0.update([1, 10])
+    m1.update([1, 10])
+
+    assert f.compute() == 11 * 11 + 0.1
+    assert m0.num_computes == 1
+    assert m1.num_computes == 1
+
+    # Computed again by a new call
+    assert f.compute() == 11 * 11 + 0.1
+    assert m0.num_computes == 2
+    assert m1.num_computes == 2
+
+
+def test_memoized_compute_attached():
+    m0 = CountingMetric(0)
+    m1 = CountingMetric(1)
+
+    def process_function(engine, data):
+        return data
+
+    engine = Engine(process_function)
+
+    s = m0 + m1
+    m0.attach(engine, 'm0')
+    s.attach(engine, 's')
+    (s * 2).attach(engine, 's2')
+    (s - m0).attach(engine, 'm1')
+
+    engine.run([[1, 10], [2, 20]], max_epochs=2)
+    assert engine.state.metrics == {'m0': 2, 's': 22, 's2': 44, 'm1': 20}
+    # Computed once per epoch
+    assert m0.num_computes == 2
+    assert m1.num_computes == 2
+
+    engine.run([[3, 30]])
+    assert engine.state.metrics == {'m0': 3, 's': 33, 's2': 66, 'm1': 30}
+    assert m0.num_computes == 3
+    assert m1.num_computes == 3
+
+
+def test_memoized_compute_invalidated():
+    m0 = CountingMetric(0)
+    m1 = CountingMetric(1)
+
+    def process_function(engine, data):
+        return data
+
+    engine = Engine(process_function)
+    s = m0 + m1
+    s._internal_attach(engine)
+    engine.add_event_handler(Events.ITERATION_COMPLETED, s.completed, 's')
+    engine.add_event_handler(Events.ITERATION_COMPLETED, (s * 2).completed, 's2')
+
+    values = []
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def save_values(engine):
+        values.append((engine.state.metrics['s'], engine.state.metrics['s2']))
+
+    engine.run([[1, 10], [2, 20], [3, 30]])
+    # Computed again at each iteration, as the metrics are updated by the engine
+    assert values == [(11, 22), (22, 44), (33, 66)]
+    assert m0.num_computes == 3
+    assert m1.num_computes == 3
+
+
+def test_merge():
+    torch.manual_seed(0)
+    y_pred = torch.rand(40, 4)
+    y = torch.randint(0, 4, size=(40,)).long()
+
+    def create_f1():
+        precision = Precision(average=False)
+        recall = Recall(average=False)
+        return precision, recall, (precision * recall * 2 / (precision + recall + 1e-20)).mean()
+
+    precision, recall, f1 = create_f1()
+    precision.update((y_pred, y))
+    recall.update((y_pred, y))
+    expected = f1.compute()
+
+    shards = [create_f1() for _ in range(3)]
+    for (precision, recall, _), (start, end) in zip(shards[:2], [(0, 15), (15, 40)]):
+        precision.update((y_pred[start:end], y[start:end]))
+        recall.update((y_pred[start:end], y[start:end]))
+    f1 = shards[2][2]
+    # Each dependency is merged once
+    assert len(f1.state_dict()["metrics"]) == 2
+    f1.merge(shards[0][2])
+    f1.merge(shards[1][2].state_dict())
+    assert f1.compute() == approx(expected)
+
+    _, _, resumed_f1 = create_f1()
+    resumed_f1.load_state_dict(f1.state_dict())
+    assert resumed_f1.compute() == approx(expected)
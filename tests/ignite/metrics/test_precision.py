@@ -509,10 +509,13 @@ def test_multilabel_input_NC():
         np_y_pred = y_pred.numpy()
         np_y = y.numpy()
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
         pr.reset()
         y_pred = torch.randint(0, 2, size=(10, 4))
@@ -521,10 +524,13 @@ def test_multilabel_input_NC():
         np_y_pred = y_pred.numpy()
         np_y = y.numpy()
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
         # Batched Updates
         pr.reset()
@@ -541,10 +547,13 @@ def test_multilabel_input_NC():
         np_y = y.numpy()
         np_y_pred = y_pred.numpy()
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
     for _ in range(5):
         _test(average=True)
@@ -556,7 +565,10 @@ def test_multilabel_input_NC():
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).type(torch.LongTensor)
     pr1.update((y_pred, y))
     pr2.update((y_pred, y))
-    assert pr1.compute() == pytest.approx(pr2.compute().mean().item())
+    np_y_pred = to_numpy_multilabel(y_pred)
+    np_y = to_numpy_multilabel(y)
+    assert pr1.compute() == pytest.approx(precision_score(np_y, np_y_pred, average='samples'))
+    assert pr2.compute().numpy() == pytest.approx(precision_score(np_y, np_y_pred, average=None))
 
 
 def test_multilabel_input_NCL():
@@ -570,10 +582,13 @@ def test_multilabel_input_NCL():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
         pr.reset()
         y_pred = torch.randint(0, 2, size=(15, 4, 10))
@@ -582,10 +597,13 @@ def test_multilabel_input_NCL():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
         # Batched Updates
         pr.reset()
@@ -602,10 +620,13 @@ def test_multilabel_input_NCL():
         np_y = to_numpy_multilabel(y)
         np_y_pred = to_numpy_multilabel(y_pred)
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
     for _ in range(5):
         _test(average=True)
@@ -617,7 +638,10 @@ def test_multilabel_input_NCL():
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).type(torch.LongTensor)
     pr1.update((y_pred, y))
     pr2.update((y_pred, y))
-    assert pr1.compute() == pytest.approx(pr2.compute().mean().item())
+    np_y_pred = to_numpy_multilabel(y_pred)
+    np_y = to_numpy_multilabel(y)
+    assert pr1.compute() == pytest.approx(precision_score(np_y, np_y_pred, average='samples'))
+    assert pr2.compute().numpy() == pytest.approx(precision_score(np_y, np_y_pred, average=None))
 
 
 def test_multilabel_input_NCHW():
@@ -631,10 +655,13 @@ def test_multilabel_input_NCHW():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
         pr.reset()
         y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
@@ -643,10 +670,13 @@ def test_multilabel_input_NCHW():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
         # Batched Updates
         pr.reset()
@@ -663,10 +693,13 @@ def test_multilabel_input_NCHW():
         np_y = to_numpy_multilabel(y)
         np_y_pred = to_numpy_multilabel(y_pred)
         assert pr._type == 'multilabel'
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr_compute)
+            if average:
+                assert precision_score(np_y, np_y_pred, average='samples') == pytest.approx(pr.compute())
+            else:
+                # Precision of each class
+                assert precision_score(np_y, np_y_pred, average=None) == pytest.approx(pr.compute().numpy())
 
     for _ in range(5):
         _test(average=True)
@@ -678,7 +711,33 @@ def test_multilabel_input_NCHW():
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).type(torch.LongTensor)
     pr1.update((y_pred, y))
     pr2.update((y_pred, y))
-    assert pr1.compute() == pytest.approx(pr2.compute().mean().item())
+    np_y_pred = to_numpy_multilabel(y_pred)
+    np_y = to_numpy_multilabel(y)
+    assert pr1.compute() == pytest.approx(precision_score(np_y, np_y_pred, average='samples'))
+    assert pr2.compute().numpy() == pytest.approx(precision_score(np_y, np_y_pred, average=None))
+
+
+def test_multilabel_constant_memory():
+    # Without averaging, the states hold the counts of each class whatever the number of samples
+    pr = Precision(average=False, is_multilabel=True)
+    for _ in range(10):
+        y_pred = torch.randint(0, 2, size=(20, 4, 8))
+        y = torch.randint(0, 2, size=(20, 4, 8)).long()
+        pr.update((y_pred, y))
+    assert pr._true_positives.shape == (4,)
+    assert pr._positives.shape == (4,)
+    assert pr.compute().shape == (4,)
+
+
+def test_multilabel_not_averaged_warns():
+    # Per-class values are returned instead of per-sample values
+    with pytest.warns(DeprecationWarning, match=r"value of each class"):
+        Precision(average=False, is_multilabel=True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        Precision(average=True, is_multilabel=True)
+        Precision(average=False)
 
 
 def test_incorrect_type():
@@ -706,7 +765,10 @@ def test_incorrect_type():
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).type(torch.LongTensor)
     pr1.update((y_pred, y))
     pr2.update((y_pred, y))
-    assert pr1.compute() == pytest.approx(pr2.compute().mean().item())
+    np_y_pred = to_numpy_multilabel(y_pred)
+    np_y = to_numpy_multilabel(y)
+    assert pr1.compute() == pytest.approx(precision_score(np_y, np_y_pred, average='samples'))
+    assert pr2.compute().numpy() == pytest.approx(precision_score(np_y, np_y_pred, average=None))
 
 
 def test_incorrect_y_classes():
@@ -722,3 +784,28 @@ def test_incorrect_y_classes():
 
     _test(average=True)
     _test(average=False)
+
+
+def test_validate_inputs():
+    with pytest.raises(ValueError, match=r"Argument validate_inputs should be one of"):
+        Precision(validate_inputs=None)
+
+    valid_batch = (torch.rand(10, 4), torch.randint(0, 4, size=(10,)).long())
+    invalid_batch = (torch.rand(10, 4), torch.randint(4, 5, size=(10,)).long())
+
+    pr = Precision(validate_inputs="always")
+    pr.update(valid_batch)
+    with pytest.raises(ValueError, match=r"y_pred contains less classes than y"):
+        pr.update(invalid_batch)
+
+    pr = Precision()
+    with pytest.raises(ValueError, match=r"y_pred contains less classes than y"):
+        pr.update(invalid_batch)
+    pr.reset()
+    pr.update(valid_batch)
+    # Out of range classes are detected by the one-hot encoding only
+    with pytest.raises(RuntimeError):
+        pr.update(invalid_batch)
+
+    pr = Precision(validate_inputs="never", is_multilabel=True, average=True)
+    pr.update((torch.randint(0, 2, size=(10, 4)).long(), torch.randint(2, 4, size=(10, 4)).long()))
@@ -509,10 +509,13 @@ def test_multilabel_input_NC():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
         re.reset()
         y_pred = torch.randint(0, 2, size=(10, 4))
@@ -521,10 +524,13 @@ def test_multilabel_input_NC():
         np_y_pred = y_pred.numpy()
         np_y = y.numpy()
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
         # Batched Updates
         re.reset()
@@ -541,10 +547,13 @@ def test_multilabel_input_NC():
         np_y = y.numpy()
         np_y_pred = y_pred.numpy()
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
     for _ in range(5):
         _test(average=True)
@@ -556,7 +565,10 @@ def test_multilabel_input_NC():
     y = torch.randint(0, 2, size=(10, 4)).type(torch.LongTensor)
     re1.update((y_pred, y))
     re2.update((y_pred, y))
-    assert re1.compute() == pytest.approx(re2.compute().mean().item())
+    np_y_pred = to_numpy_multilabel(y_pred)
+    np_y = to_numpy_multilabel(y)
+    assert re1.compute() == pytest.approx(recall_score(np_y, np_y_pred, average='samples'))
+    assert re2.compute().numpy() == pytest.approx(recall_score(np_y, np_y_pred, average=None))
 
 
 def test_multilabel_input_NCL():
@@ -570,10 +582,13 @@ def test_multilabel_input_NCL():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
         re.reset()
         y_pred = torch.randint(0, 2, size=(15, 4, 10))
@@ -582,10 +597,13 @@ def test_multilabel_input_NCL():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
         # Batched Updates
         re.reset()
@@ -602,10 +620,13 @@ def test_multilabel_input_NCL():
         np_y = to_numpy_multilabel(y)
         np_y_pred = to_numpy_multilabel(y_pred)
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
     for _ in range(5):
         _test(average=True)
@@ -617,7 +638,10 @@ def test_multilabel_input_NCL():
     y = torch.randint(0, 2, size=(10, 4, 20)).type(torch.LongTensor)
     re1.update((y_pred, y))
     re2.update((y_pred, y))
-    assert re1.compute() == pytest.approx(re2.compute().mean().item())
+    np_y_pred = to_numpy_multilabel(y_pred)
+    np_y = to_numpy_multilabel(y)
+    assert re1.compute() == pytest.approx(recall_score(np_y, np_y_pred, average='samples'))
+    assert re2.compute().numpy() == pytest.approx(recall_score(np_y, np_y_pred, average=None))
 
 
 def test_multilabel_input_NCHW():
@@ -631,10 +655,13 @@ def test_multilabel_input_NCHW():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
         re.reset()
         y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
@@ -643,10 +670,13 @@ def test_multilabel_input_NCHW():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
         # Batched Updates
         re.reset()
@@ -663,10 +693,13 @@ def test_multilabel_input_NCHW():
         np_y = to_numpy_multilabel(y)
         np_y_pred = to_numpy_multilabel(y_pred)
         assert re._type == 'multilabel'
-        re_compute = re.compute() if average else re.compute().mean().item()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re_compute)
+            if average:
+                assert recall_score(np_y, np_y_pred, average='samples') == pytest.approx(re.compute())
+            else:
+                # Recall of each class
+                assert recall_score(np_y, np_y_pred, average=None) == pytest.approx(re.compute().numpy())
 
     for _ in range(5):
         _test(average=True)
@@ -678,7 +711,33 @@ def test_multilabel_input_NCHW():
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).type(torch.LongTensor)
     re1.update((y_pred, y))
     re2.update((y_pred, y))
-    assert re1.compute() == pytest.approx(re2.compute().mean().item())
+    np_y_pred = to_numpy_multilabel(y_pred)
+    np_y = to_numpy_multilabel(y)
+    assert re1.compute() == pytest.approx(recall_score(np_y, np_y_pred, average='samples'))
+    assert re2.compute().numpy() == pytest.approx(recall_score(np_y, np_y_pred, average=None))
+
+
+def test_multilabel_constant_memory():
+    # Without averaging, the states hold the counts of each class whatever the number of samples
+    re = Recall(average=False, is_multilabel=True)
+    for _ in range(10):
+        y_pred = torch.randint(0, 2, size=(20, 4, 8))
+        y = torch.randint(0, 2, size=(20, 4, 8)).long()
+        re.update((y_pred, y))
+    assert re._true_positives.shape == (4,)
+    assert re._positives.shape == (4,)
+    assert re.compute().shape == (4,)
+
+
+def test_multilabel_not_averaged_warns():
+    # Per-class values are returned instead of per-sample values
+    with pytest.warns(DeprecationWarning, match=r"value of each class"):
+        Recall(average=False, is_multilabel=True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        Recall(average=True, is_multilabel=True)
+        Recall(average=False)
 
 
 def test_incorrect_type():
@@ -706,7 +765,10 @@ def test_incorrect_type():
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).type(torch.LongTensor)
     re1.update((y_pred, y))
     re2.update((y_pred, y))
-    assert re1.compute() == pytest.approx(re2.compute().mean().item())
+    np_y_pred = to_numpy_multilabel(y_pred)
+    np_y = to_numpy_multilabel(y)
+    assert re1.compute() == pytest.approx(recall_score(np_y, np_y_pred, average='samples'))
+    assert re2.compute().numpy() == pytest.approx(recall_score(np_y, np_y_pred, average=None))
 
 
 def test_incorrect_y_classes():
@@ -722,3 +784,20 @@ def test_incorrect_y_classes():
 
     _test(average=True)
     _test(average=False)
+
+
+def test_validate_inputs():
+    valid_batch = (torch.randint(0, 2, size=(10, 4)).long(), torch.randint(0, 2, size=(10, 4)).long())
+    invalid_batch = (torch.randint(2, 4, size=(10, 4)).long(), torch.randint(0, 2, size=(10, 4)).long())
+
+    re = Recall(is_multilabel=True, average=True, validate_inputs="always")
+    re.update(valid_batch)
+    with pytest.raises(ValueError, match=r"For binary cases, y_pred must be comprised of 0's and 1's."):
+        re.update(invalid_batch)
+
+    re = Recall(is_multilabel=True, average=True)
+    re.update(valid_batch)
+    re.update(invalid_batch)
+
+    re = Recall(is_multilabel=True, average=True, validate_inputs="never")
+    re.update(invalid_batch)
@@ -212,3 +212,70 @@ def test_multiple_attach():
 
     data = list(range(n_iters))
     trainer.run(data)
+
+
+def test_output_tensor():
+
+    outputs = [torch.tensor(float(i)) for i in range(10)]
+
+    def update_fn(engine, batch):
+        # Non-detached output
+        return outputs[batch] * torch.ones(1, requires_grad=True).sum()
+
+    trainer = Engine(update_fn)
+    alpha = 0.9
+    RunningAverage(output_transform=lambda x: x, alpha=alpha).attach(trainer, 'running_avg_output')
+
+    expected = [None]
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def check_running_avg_output(engine):
+        value = engine.state.metrics['running_avg_output']
+        assert isinstance(value, float)
+        output = float(engine.state.output)
+        expected[0] = output if expected[0] is None else expected[0] * alpha + (1.0 - alpha) * output
+        assert value == pytest.approx(expected[0])
+
+    trainer.run(list(range(10)))
+
+
+def test_output_tensor_read_when_accessed():
+    outputs = [torch.tensor(float(i)) for i in range(10)]
+    trainer = Engine(lambda engine, batch: outputs[batch])
+    alpha = 0.9
+    RunningAverage(output_transform=lambda x: x, alpha=alpha).attach(trainer, 'running_avg_output')
+
+    expected = [None]
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def check_running_avg_output(engine):
+        output = float(engine.state.output)
+        expected[0] = output if expected[0] is None else expected[0] * alpha + (1.0 - alpha) * output
+        metrics = engine.state.metrics
+        # Not read from the device until accessed
+        assert metrics.is_lazy('running_avg_output')
+        if engine.state.iteration % 3 == 0:
+            assert metrics['running_avg_output'] == pytest.approx(expected[0])
+            assert not metrics.is_lazy('running_avg_output')
+
+    trainer.run(list(range(10)))
+    # The last average is kept after the run
+    value = trainer.state.metrics['running_avg_output']
+    assert isinstance(value, float)
+    assert value == pytest.approx(expected[0])
+
+
+def test_state_dict():
+    avg_output = RunningAverage(output_transform=lambda x: x, alpha=0.5)
+    avg_output.update(2.0)
+    avg_output.compute()
+    avg_output.update(4.0)
+    avg_output.compute()
+
+    resumed = RunningAverage(output_transform=lambda x: x, alpha=0.5)
+    resumed.load_state_dict(avg_output.state_dict())
+    resumed.update(8.0)
+    assert resumed.compute() == pytest.approx(0.5 * 3.0 + 0.5 * 8.0)
+
+    with pytest.raises(TypeError, match=r"RunningAverage can not be merged"):
+        resumed.merge(avg_output)
@@ -0,0 +1,170 @@
+import pytest
+import torch
+
+from ignite.engine import Engine, Events
+from ignite.metrics import Accuracy, ConfusionMatrix, EpochMetric, Loss, WindowedMetric
+
+
+def _create_data(num_batches=10, batch_size=8, num_classes=3):
+    torch.manual_seed(0)
+    return [(torch.rand(batch_size, num_classes), torch.randint(0, num_classes, size=(batch_size,)))
+            for _ in range(num_batches)]
+
+
+def test_wrong_input_args():
+    with pytest.raises(TypeError, match=r"Argument src should be a Metric"):
+        WindowedMetric(lambda x: x, window_size=2)
+
+    with pytest.raises(ValueError, match=r"Argument src should be a metric whose state is a sum"):
+        WindowedMetric(EpochMetric(lambda y_pred, y: 0.0), window_size=2)
+
+    with pytest.raises(ValueError, match=r"Exactly one of the arguments window_size and alpha"):
+        WindowedMetric(Accuracy())
+
+    with pytest.raises(ValueError, match=r"Exactly one of the arguments window_size and alpha"):
+        WindowedMetric(Accuracy(), window_size=2, alpha=0.5)
+
+    with pytest.raises(ValueError, match=r"Argument window_size should be a positive integer"):
+        WindowedMetric(Accuracy(), window_size=0)
+
+    with pytest.raises(ValueError, match=r"Argument alpha should be a float between 0.0 and 1.0"):
+        WindowedMetric(Accuracy(), alpha=1.5)
+
+
+def test_window():
+    data = _create_data()
+    num_correct = [(torch.argmax(y_pred, dim=1) == y).sum().item() for y_pred, y in data]
+
+    engine = Engine(lambda engine, batch: batch)
+    WindowedMetric(Accuracy(), window_size=3).attach(engine, "accuracy")
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def check_accuracy(engine):
+        # Reset at each epoch
+        i = (engine.state.iteration - 1) % len(data) + 1
+        window = num_correct[max(0, i - 3):i]
+        assert engine.state.metrics["accuracy"] == pytest.approx(sum(window) / (8.0 * len(window)))
+
+    engine.run(data, max_epochs=2)
+
+
+def test_exponential_decay():
+    data = _create_data()
+    num_correct = [(torch.argmax(y_pred, dim=1) == y).sum().item() for y_pred, y in data]
+    alpha = 0.9
+
+    engine = Engine(lambda engine, batch: batch)
+    WindowedMetric(Accuracy(), alpha=alpha).attach(engine, "accuracy")
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def check_accuracy(engine):
+        i = engine.state.iteration
+        weights = [alpha ** (i - 1 - k) for k in range(i)]
+        expected = sum(w * c for w, c in zip(weights, num_correct)) / (8.0 * sum(weights))
+        assert engine.state.metrics["accuracy"] == pytest.approx(expected)
+
+    engine.run(data)
+
+
+def test_event_name():
+    data = _create_data()
+
+    class CountingConfusionMatrix(ConfusionMatrix):
+
+        num_computes = 0
+
+        def compute(self):
+            CountingConfusionMatrix.num_computes += 1
+            return super(CountingConfusionMatrix, self).compute()
+
+    engine = Engine(lambda engine, batch: batch)
+    cm = WindowedMetric(CountingConfusionMatrix(num_classes=3), window_size=4)
+    cm.attach(engine, "cm", event_name=Events.ITERATION_COMPLETED(every=5))
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def check_cm(engine):
+        i = engine.state.iteration
+        if i % 5 == 0:
+            expected = CountingConfusionMatrix(num_classes=3)
+            for batch in data[i - 4:i]:
+                expected.update(batch)
+            assert torch.equal(engine.state.metrics["cm"], expected.compute())
+        else:
+            assert ("cm" in engine.state.metrics) == (i > 5)
+
+    engine.run(data)
+    # Computed only at the event, plus the computations of the expected values
+    assert CountingConfusionMatrix.num_computes == 2 + 2
+
+
+def test_epoch_unbound():
+    data = _create_data(num_batches=4)
+    num_correct = [(torch.argmax(y_pred, dim=1) == y).sum().item() for y_pred, y in data]
+
+    engine = Engine(lambda engine, batch: batch)
+    WindowedMetric(Accuracy(), window_size=6, epoch_bound=False).attach(engine, "accuracy",
+                                                                        event_name=Events.EPOCH_COMPLETED)
+    engine.run(data, max_epochs=2)
+    # Window over the two last batches of the first epoch and the four batches of the second epoch
+    window = num_correct[2:] + num_correct
+    assert engine.state.metrics["accuracy"] == pytest.approx(sum(window) / (8.0 * len(window)))
+
+
+def test_kept_batch_states():
+    data = _create_data(num_batches=20)
+    losses = [torch.nn.functional.cross_entropy(y_pred, y).item() for y_pred, y in data]
+
+    loss = WindowedMetric(Loss(torch.nn.functional.cross_entropy), window_size=3)
+    loss.reset()
+    for i, batch in enumerate(data, 1):
+        loss.update(batch)
+        # The states of the batches of the window only are kept
+        assert len(loss._batch_sums) == min(i, 3)
+        window = losses[max(0, i - 3):i]
+        assert loss.compute() == pytest.approx(sum(window) / len(window))
+
+
+def test_state_dict():
+
+    def _test(**kwargs):
+        data = _create_data(num_batches=10)
+        metric = WindowedMetric(ConfusionMatrix(num_classes=3), **kwargs)
+        for batch in data[:5]:
+            metric.update(batch)
+        state_dict = metric.state_dict()
+        value = metric.compute().clone()
+
+        # The saved state is not modified by the next updates
+        metric.update(data[5])
+        resumed = WindowedMetric(ConfusionMatrix(num_classes=3), **kwargs)
+        resumed.load_state_dict(state_dict)
+        assert torch.equal(resumed.compute(), value)
+
+        resumed.update(data[5])
+        for batch in data[6:]:
+            metric.update(batch)
+            resumed.update(batch)
+        assert torch.equal(resumed.compute(), metric.compute())
+
+    _test(window_size=3)
+    _test(alpha=0.9)
+
+
+def test_load_state_dict_wrong_keys():
+    metric = WindowedMetric(Accuracy(), window_size=3)
+    with pytest.raises(ValueError, match=r"Required keys"):
+        metric.load_state_dict({"_sums": None})
+
+
+def test_merge():
+    data = _create_data()
+    metric = WindowedMetric(Accuracy(), window_size=3)
+    other = WindowedMetric(Accuracy(), window_size=3)
+    metric.update(data[0])
+    other.update(data[1])
+
+    with pytest.raises(TypeError, match=r"WindowedMetric can not be merged"):
+        metric.merge(other)
+
+    with pytest.raises(TypeError, match=r"WindowedMetric can not be merged"):
+        metric.merge(other.state_dict())